@@ -0,0 +1,8 @@
+"""Throughput and latency benchmarks for the public URLs.
+
+``python -m benchmarks`` seeds a separate SQLite database with production-like
+volumes (``seed``), requests every URL in ``targets.TARGETS`` through Django's
+test client and through a local threaded WSGI server (``runner``), saves the
+figures as JSON and fails when they regress against a stored baseline
+(``compare``). See ``python -m benchmarks --help``.
+"""
@@ -0,0 +1,106 @@
+"""Command line: ``python -m benchmarks [--scale 0.1] [--save-baseline]``.
+
+Runs against its own SQLite file (``benchmarks/bench.sqlite3`` unless
+``DJANGO_DB_NAME`` is set), migrating and seeding it first, with ``DEBUG``
+off as in production. Exits with status 1 when ``compare`` reports a
+regression against the baseline.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier for the seeded volumes (default 1.0)")
+    parser.add_argument("--skip-seed", action="store_true", help="benchmark the database as it is")
+    parser.add_argument("--requests", type=int, default=200, help="timed requests per target and mode")
+    parser.add_argument("--warmup", type=int, default=5, help="untimed requests per target first")
+    parser.add_argument("--concurrency", type=int, default=8, help="client threads in wsgi mode")
+    parser.add_argument("--modes", nargs="+", default=["client", "wsgi"], choices=["client", "wsgi"])
+    parser.add_argument("--targets", nargs="+", help="target names (default: all)")
+    parser.add_argument("--output", type=Path, default=HERE / "results" / "latest.json")
+    parser.add_argument("--baseline", type=Path, default=HERE / "baseline.json")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown as a fraction (default 0.2)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="ignore changes smaller than this")
+    return parser.parse_args(argv)
+
+
+def print_table(results, out):
+    out.write(f"{'mode':<7}{'target':<18}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}\n")
+    for mode, targets in results.items():
+        for name, row in targets.items():
+            out.write(
+                f"{mode:<7}{name:<18}{row['throughput_rps']:>10.1f}{row['p50_ms']:>10.2f}"
+                f"{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}{row['errors']:>8}\n"
+            )
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    os.environ.setdefault("DJANGO_DB_NAME", str(HERE / "bench.sqlite3"))
+
+    import django
+
+    django.setup()
+
+    from django.core.management import call_command
+    from django.db import connection
+    from django.test.utils import override_settings
+
+    from . import compare, runner, seed, targets
+
+    call_command("migrate", verbosity=0)
+    volumes = seed.scaled(args.scale)
+    if not args.skip_seed:
+        seed.seed(volumes, stdout=sys.stdout)
+
+    with override_settings(DEBUG=False, ALLOWED_HOSTS=["testserver", "127.0.0.1"]):
+        paths = targets.resolve(args.targets)
+        results = {
+            mode: runner.run(mode, paths, args.requests, args.warmup, args.concurrency)
+            for mode in args.modes
+        }
+    document = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "machine": platform.platform(),
+            "database": connection.vendor,
+            "volumes": volumes,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+    print_table(results, sys.stdout)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(document, indent=2) + "\n")
+    sys.stdout.write(f"Results written to {args.output}\n")
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    if baseline is None:
+        sys.stdout.write(f"No baseline at {args.baseline}; nothing to compare.\n")
+    regressions = compare.compare(document, baseline, args.threshold, args.min_delta_ms)
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(document, indent=2) + "\n")
+        sys.stdout.write(f"Baseline saved to {args.baseline}\n")
+    for regression in regressions:
+        sys.stdout.write(f"REGRESSION {regression}\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
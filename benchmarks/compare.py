@@ -0,0 +1,34 @@
+"""Regression check of a benchmark run against a stored baseline.
+
+A target regresses when its p50 or p95 latency grows, or its throughput
+falls, by more than ``threshold`` (a fraction) compared with the baseline.
+Changes smaller than ``min_delta_ms`` per request are ignored, so
+sub-millisecond cache hits don't fail a run on timer noise. Any failed
+request is a regression regardless of the baseline.
+"""
+
+LATENCIES = ("p50_ms", "p95_ms")
+
+
+def _slower(before_ms, after_ms, threshold, min_delta_ms):
+    return after_ms > before_ms * (1 + threshold) and after_ms - before_ms > min_delta_ms
+
+
+def compare(results, baseline, threshold=0.2, min_delta_ms=1.0):
+    """Human-readable regressions of ``results`` against ``baseline`` (both result documents)."""
+    regressions = []
+    for mode, targets in results["results"].items():
+        for name, current in targets.items():
+            label = f"{mode} {name}"
+            if current["errors"]:
+                regressions.append(f"{label}: {current['errors']} of {current['requests']} requests failed")
+            previous = baseline.get("results", {}).get(mode, {}).get(name) if baseline else None
+            if previous is None:
+                continue
+            for key in LATENCIES:
+                if _slower(previous[key], current[key], threshold, min_delta_ms):
+                    regressions.append(f"{label}: {key} {previous[key]:.1f} -> {current[key]:.1f}")
+            before, after = previous["throughput_rps"], current["throughput_rps"]
+            if before and after and _slower(1000 / before, 1000 / after, threshold, min_delta_ms):
+                regressions.append(f"{label}: throughput {before:.1f} -> {after:.1f} req/s")
+    return regressions
@@ -0,0 +1,123 @@
+"""Timing loops for the benchmark targets.
+
+``client`` mode calls the WSGI handler in-process through Django's test
+client: no sockets, one request at a time, so it isolates view, ORM and
+template cost. ``wsgi`` mode serves the project from a threaded
+``wsgiref`` server on a free local port and requests it over HTTP from
+``concurrency`` threads, which adds request parsing, connection handling
+and contention between concurrent requests.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from socketserver import ThreadingMixIn
+from urllib.error import HTTPError
+from urllib.request import urlopen
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from django.core.wsgi import get_wsgi_application
+from django.test import Client
+
+from core.perf import percentile
+
+MODES = ("client", "wsgi")
+
+
+def summarize(durations, errors, elapsed):
+    """Throughput and latency percentiles (ms) of one target's timed requests."""
+    ordered = sorted(duration * 1000 for duration in durations)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 50), 3),
+        "p95_ms": round(percentile(ordered, 95), 3),
+        "p99_ms": round(percentile(ordered, 99), 3),
+    }
+
+
+def _timed(fetch):
+    started = time.perf_counter()
+    ok = fetch()
+    return time.perf_counter() - started, ok
+
+
+def measure(fetch, requests, warmup=1, concurrency=1):
+    """Call ``fetch`` (returns whether the response succeeded) ``requests`` times after ``warmup`` untimed calls."""
+    for _ in range(warmup):
+        fetch()
+    started = time.perf_counter()
+    if concurrency == 1:
+        results = [_timed(fetch) for _ in range(requests)]
+    else:
+        with ThreadPoolExecutor(concurrency) as pool:
+            results = list(pool.map(lambda _: _timed(fetch), range(requests)))
+    elapsed = time.perf_counter() - started
+    return summarize([duration for duration, _ in results], sum(not ok for _, ok in results), elapsed)
+
+
+def client_fetcher(path):
+    # Server errors are counted like any other failed request instead of raised.
+    client = Client(raise_request_exception=False)
+
+    def fetch():
+        response = client.get(path)
+        if response.streaming:
+            b"".join(response.streaming_content)
+        response.close()
+        return response.status_code < 400
+
+    return fetch
+
+
+def http_fetcher(url):
+    def fetch():
+        try:
+            with urlopen(url, timeout=30) as response:
+                response.read()
+            return True
+        except HTTPError as error:
+            error.read()
+            return False
+        except OSError:
+            return False
+
+    return fetch
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def wsgi_server():
+    """Serve the project on a free local port for the duration of the block; yields the base URL."""
+    server = make_server(
+        "127.0.0.1", 0, get_wsgi_application(), server_class=_ThreadingWSGIServer, handler_class=_QuietHandler,
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def run(mode, paths, requests, warmup=1, concurrency=1):
+    """``{target: summary}`` for every ``{target: path}`` in ``paths``."""
+    if mode == "client":
+        return {name: measure(client_fetcher(path), requests, warmup) for name, path in paths.items()}
+    with wsgi_server() as base:
+        return {
+            name: measure(http_fetcher(base + path), requests, warmup, concurrency)
+            for name, path in paths.items()
+        }
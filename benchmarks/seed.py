@@ -0,0 +1,151 @@
+"""Production-like data volumes for the benchmarks.
+
+Rows are inserted with ``bulk_create`` in chunks, so signals don't run: the
+derived blog fields are filled in here, the cache counters are bumped at the
+end, and the search index and related-content table are left empty (the
+benchmarked pages don't need them). Seeding tops up to the requested volumes,
+so a second run against the same database costs only the counts.
+"""
+
+import itertools
+import random
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from core.cache import bump_model_version
+from core.models import (
+    BlogPost, BlogPostTag, Contact, Item, PortfolioProject, ProjectTechnology, Service, Tag, TeamMember, Technology,
+)
+
+VOLUMES = {
+    "posts": 10_000,
+    "projects": 1_000,
+    "contacts": 100_000,
+    "items": 1_000_000,
+}
+
+CHUNK = 5_000
+PREFIX = "benchmark"
+
+_WORDS = (
+    "platform data cloud migration pipeline latency model geospatial survey dashboard api cache "
+    "analytics deployment security workflow integration mobile sensor query index report"
+).split()
+
+_EXPERTISE = [choice for choice, _ in Service._meta.get_field("expertise").choices]
+_CATEGORIES = [choice for choice, _ in BlogPost._meta.get_field("category").choices]
+
+
+def scaled(scale):
+    """``VOLUMES`` multiplied by ``scale``, at least one row each."""
+    return {name: max(1, int(count * scale)) for name, count in VOLUMES.items()}
+
+
+def _text(rng, words):
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _chunks(total, build):
+    """Lists of at most ``CHUNK`` objects built by ``build(n)`` for ``n`` in ``range(total)``."""
+    numbers = iter(range(total))
+    while chunk := [build(n) for n in itertools.islice(numbers, CHUNK)]:
+        yield chunk
+
+
+def _fixed_content():
+    """The handful of services and team members every page shows."""
+    for n, expertise in enumerate(_EXPERTISE):
+        Service.objects.get_or_create(
+            title=f"{expertise.replace('_', ' ').title()} Services",
+            defaults={
+                "description": "End-to-end delivery from discovery to support.", "expertise": expertise,
+                "icon": "fas fa-cogs", "features": ["Discovery", "Delivery", "Support"], "order": n,
+            },
+        )
+    for n in range(8):
+        TeamMember.objects.get_or_create(name=f"Team Member {n}", defaults={"position": "Engineer", "order": n})
+
+
+def _posts(rng, author, tags, count):
+    start = BlogPost.objects.filter(slug__startswith=PREFIX).count()
+    now = timezone.now()
+
+    def build(n):
+        number = start + n
+        post = BlogPost(
+            title=f"{_text(rng, 6).title()} {number}", slug=f"{PREFIX}-post-{number}",
+            excerpt=_text(rng, 25), content="".join(f"<p>{_text(rng, 80)}</p>" for _ in range(6)),
+            author=author, category=rng.choice(_CATEGORIES), published=rng.random() < 0.9,
+            published_date=now - timedelta(hours=number),
+        )
+        post.refresh_text_stats()
+        return post
+
+    for chunk in _chunks(count, build):
+        posts = BlogPost.objects.bulk_create(chunk)
+        BlogPostTag.objects.bulk_create(
+            BlogPostTag(post=post, tag=tag) for post in posts for tag in rng.sample(tags, 3)
+        )
+
+
+def _projects(rng, technologies, count):
+    def build(n):
+        return PortfolioProject(
+            title=f"{_text(rng, 4).title()} Project", client=f"Client {rng.randrange(200)}",
+            description=_text(rng, 120), expertise=rng.choice(_EXPERTISE), featured=rng.random() < 0.05,
+            completion_date=timezone.now().date() - timedelta(days=rng.randrange(2000)),
+        )
+
+    for chunk in _chunks(count, build):
+        projects = PortfolioProject.objects.bulk_create(chunk)
+        ProjectTechnology.objects.bulk_create(
+            ProjectTechnology(project=project, technology=technology)
+            for project in projects for technology in rng.sample(technologies, 4)
+        )
+
+
+def _contacts(rng, count):
+    def build(n):
+        return Contact(
+            name=f"Lead {n}", email=f"lead{n}@example.com", company=f"Company {rng.randrange(5000)}",
+            message=_text(rng, 40),
+        )
+
+    for chunk in _chunks(count, build):
+        Contact.objects.bulk_create(chunk)
+
+
+def _items(rng, owner, count):
+    def build(n):
+        return Item(name=f"Item {n}", description=_text(rng, 12), owner=owner if n % 2 else None)
+
+    for chunk in _chunks(count, build):
+        Item.objects.bulk_create(chunk)
+
+
+def seed(volumes, stdout=None, random_seed=0):
+    """Top the database up to ``volumes`` (keys as in ``VOLUMES``)."""
+    rng = random.Random(random_seed)
+    author, _ = User.objects.get_or_create(username=f"{PREFIX}-author", defaults={"first_name": "Bench"})
+    tags = Tag.from_string(", ".join(word.title() for word in _WORDS[:12]))
+    technologies = Technology.from_string(", ".join(f"{word.title()} Stack" for word in _WORDS[:12]))
+    _fixed_content()
+
+    steps = [
+        ("posts", BlogPost, lambda count: _posts(rng, author, tags, count)),
+        ("projects", PortfolioProject, lambda count: _projects(rng, technologies, count)),
+        ("contacts", Contact, lambda count: _contacts(rng, count)),
+        ("items", Item, lambda count: _items(rng, author, count)),
+    ]
+    for name, model, create in steps:
+        missing = volumes[name] - model.objects.count()
+        if missing > 0:
+            if stdout:
+                stdout.write(f"Seeding {missing} {name}...\n")
+            with transaction.atomic():
+                create(missing)
+    for model in (BlogPost, PortfolioProject, Service, TeamMember, Tag, Technology):
+        bump_model_version(model)
@@ -0,0 +1,43 @@
+"""The URLs under benchmark.
+
+Each target maps a stable name, used as the key in result files, to a
+function returning the path to request. Detail pages pick a row from the
+middle of the seeded data, so they neither hit the first page's cache nor
+depend on a particular primary key.
+"""
+
+from django.urls import reverse
+
+from core.models import BlogPost, PortfolioProject
+
+
+def _middle(queryset):
+    return queryset[queryset.count() // 2]
+
+
+def _portfolio_detail():
+    project = _middle(PortfolioProject.objects.order_by("pk").only("pk"))
+    return reverse("core:portfolio_detail", args=[project.pk])
+
+
+def _blog_detail():
+    post = _middle(BlogPost.objects.published().order_by("pk").only("slug"))
+    return reverse("core:blog_detail", kwargs={"slug": post.slug})
+
+
+TARGETS = {
+    "index": lambda: reverse("core:index"),
+    "services": lambda: reverse("core:services"),
+    "portfolio_list": lambda: reverse("core:portfolio"),
+    "portfolio_detail": _portfolio_detail,
+    "blog_list": lambda: reverse("core:blog"),
+    "blog_detail": _blog_detail,
+    "sitemap": lambda: reverse("sitemap"),
+    "brochure": lambda: reverse("core:brochure"),
+    "api_items": lambda: reverse("api:item-list"),
+}
+
+
+def resolve(names=None):
+    """``{name: path}`` for ``names`` (every target by default)."""
+    return {name: TARGETS[name]() for name in (names or TARGETS)}
@@ -0,0 +1,26 @@
+"""Gunicorn settings: ``gunicorn -c config/gunicorn.conf.py config.wsgi``.
+
+Set ``PROMETHEUS_MULTIPROC_DIR`` to an empty directory so ``/metrics`` reports
+the totals of every worker (see ``core.metrics``).
+"""
+
+import glob
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", 4))
+
+
+def on_starting(server):
+    # Counts left over from a previous run would be added to this one's.
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        for path in glob.glob(os.path.join(directory, "*.db")):
+            os.remove(path)
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
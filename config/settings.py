@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -42,7 +43,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.PerfMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "core.middleware.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -64,6 +67,7 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "core.context_processors.caching",
             ],
         },
     },
@@ -75,13 +79,113 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# DJANGO_DB_ENGINE selects sqlite (default) or postgresql; DJANGO_DB_NAME,
+# _USER, _PASSWORD, _HOST and _PORT fill in the connection. PostgreSQL needs
+# ``pip install "psycopg[binary]"``.
+
+DATABASE_ENGINES = {
+    "sqlite": "core.backends.sqlite3",
+    "postgresql": "django.db.backends.postgresql",
+}
+_db_engine = os.environ.get("DJANGO_DB_ENGINE", "sqlite")
+
+if _db_engine == "sqlite":
+    _db_name = os.environ.get("DJANGO_DB_NAME", BASE_DIR / "db.sqlite3")
+    # WAL lets readers run alongside the single writer; NORMAL syncs at
+    # checkpoints instead of every commit, which is safe in WAL mode. Switching
+    # to WAL rewrites the file header, so the development database bundled in
+    # the repository stays in rollback-journal mode unless DJANGO_DB_WAL=1.
+    _db_wal = os.environ.get("DJANGO_DB_WAL", "0" if Path(_db_name) == BASE_DIR / "db.sqlite3" else "1") == "1"
+    _db_pragmas = ["PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL"] if _db_wal else []
+    _db_pragmas += [
+        f"PRAGMA mmap_size={int(os.environ.get('DJANGO_DB_MMAP_SIZE', 128 * 1024 * 1024))}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    _db_options = {
+        # Seconds a writer waits for the lock before "database is locked".
+        "timeout": int(os.environ.get("DJANGO_DB_TIMEOUT", 20)),
+        "transaction_mode": "IMMEDIATE",
+        "init_command": ";".join(_db_pragmas),
+    }
+else:
+    _db_name = os.environ.get("DJANGO_DB_NAME", "nexussphere")
+    _db_options = {
+        "connect_timeout": int(os.environ.get("DJANGO_DB_TIMEOUT", 5)),
+    }
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "ENGINE": DATABASE_ENGINES[_db_engine],
+        "NAME": _db_name,
+        "USER": os.environ.get("DJANGO_DB_USER", ""),
+        "PASSWORD": os.environ.get("DJANGO_DB_PASSWORD", ""),
+        "HOST": os.environ.get("DJANGO_DB_HOST", ""),
+        "PORT": os.environ.get("DJANGO_DB_PORT", ""),
+        # Keep connections open between requests; the health check replaces
+        # one the server dropped instead of failing the next request.
+        "CONN_MAX_AGE": int(os.environ.get("DJANGO_DB_CONN_MAX_AGE", 60)),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": _db_options,
+    }
+}
+
+# Read replicas: DJANGO_DB_REPLICAS lists replica SQLite files or PostgreSQL
+# hosts, comma-separated. Public GET traffic reads from them (see core.routers).
+for _index, _location in enumerate(filter(None, os.environ.get("DJANGO_DB_REPLICAS", "").split(",")), 1):
+    DATABASES[f"replica{_index}"] = {
+        **DATABASES["default"],
+        "NAME" if _db_engine == "sqlite" else "HOST": _location.strip(),
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+DATABASE_ROUTERS = ["core.routers.PrimaryReplicaRouter"]
+# Always on the primary, even for GET.
+DATABASE_PRIMARY_PATHS = ("/admin/", "/accounts/")
+# How long a client that just wrote keeps reading from the primary.
+REPLICA_STICKY_SECONDS = int(os.environ.get("DJANGO_DB_REPLICA_STICKY_SECONDS", 10))
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# DJANGO_CACHE_BACKEND selects one of the aliases below; DJANGO_CACHE_LOCATION
+# overrides its default location (directory, redis:// URL or host:port).
+
+CACHE_BACKENDS = {
+    "locmem": ("django.core.cache.backends.locmem.LocMemCache", "nexussphere"),
+    "file": ("django.core.cache.backends.filebased.FileBasedCache", str(BASE_DIR / ".cache")),
+    "redis": ("django.core.cache.backends.redis.RedisCache", "redis://127.0.0.1:6379/1"),
+    "memcached": ("django.core.cache.backends.memcached.PyMemcacheCache", "127.0.0.1:11211"),
+    "dummy": ("django.core.cache.backends.dummy.DummyCache", ""),
+}
+_cache_backend, _cache_location = CACHE_BACKENDS[os.environ.get("DJANGO_CACHE_BACKEND", "locmem")]
+
+CACHES = {
+    "default": {
+        "BACKEND": _cache_backend,
+        "LOCATION": os.environ.get("DJANGO_CACHE_LOCATION", _cache_location),
+        "TIMEOUT": int(os.environ.get("DJANGO_CACHE_TIMEOUT", 300)),
+        "KEY_PREFIX": "nexussphere",
     }
 }
 
+# Seconds anonymous responses of the marketing pages and their expensive
+# template fragments stay cached. Model saves invalidate them immediately
+# (see core.cache), so these can be long.
+PAGE_CACHE_TIMEOUT = int(os.environ.get("DJANGO_PAGE_CACHE_TIMEOUT", 60 * 60 * 24))
+FRAGMENT_CACHE_TIMEOUT = int(os.environ.get("DJANGO_FRAGMENT_CACHE_TIMEOUT", 60 * 60 * 24))
+# Seconds feed readers and proxies may reuse a blog feed before revalidating.
+FEED_MAX_AGE = 300
+
+# Request instrumentation (core.perf): Server-Timing headers, a log line per
+# request on the core.perf logger and rolling per-view percentiles on /__perf__/.
+PERF_ENABLED = os.environ.get("DJANGO_PERF", "1") == "1"
+PERF_WINDOW = 500
+# One statement run this often in a request is reported as a likely N+1.
+PERF_REPEATED_QUERY_THRESHOLD = 5
+# Bearer token Prometheus must send to scrape /metrics (core.metrics); empty
+# leaves it open, for when the endpoint is only reachable internally.
+METRICS_TOKEN = os.environ.get("DJANGO_METRICS_TOKEN", "")
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -119,12 +223,38 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 STATICFILES_DIRS = [BASE_DIR / "static"]
+STATIC_ROOT = Path(os.environ.get("DJANGO_STATIC_ROOT", BASE_DIR / "staticfiles"))
+
+# DJANGO_STATIC_STORAGE=manifest for production: ``collectstatic`` then writes
+# content-hashed names with gzip/brotli siblings (see core.storage). The
+# manifest only exists after ``collectstatic``, so development and tests keep
+# the plain storage.
+STATIC_STORAGE_BACKENDS = {
+    "plain": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    "manifest": "core.storage.CompressedManifestStaticFilesStorage",
+}
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": STATIC_STORAGE_BACKENDS[os.environ.get("DJANGO_STATIC_STORAGE", "plain")]},
+}
+# Cache lifetimes for files served by core.views.static_view.
+STATIC_IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+STATIC_MAX_AGE = 60
 
 # Media files (User uploaded images, files)
 # https://docs.djangoproject.com/en/4.2/howto/static-files/#serving-files-uploaded-by-a-user-during-development
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Resized/WebP copies of media and static images (see core.images)
+IMAGE_DERIVATIVES_ROOT = MEDIA_ROOT / "derivatives"
+IMAGE_DERIVATIVES_URL = MEDIA_URL + "derivatives/"
+
+# Pregenerated brochure PDFs (see core.brochure)
+BROCHURE_ROOT = Path(os.environ.get("DJANGO_BROCHURE_ROOT", MEDIA_ROOT / "brochures"))
+# A superseded PDF stays on disk this long for downloads that already looked it up.
+BROCHURE_RETENTION_SECONDS = int(os.environ.get("DJANGO_BROCHURE_RETENTION_SECONDS", "600"))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
@@ -134,5 +264,51 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 LOGIN_URL = "/accounts/login/"
 LOGIN_REDIRECT_URL = "/"
 
-# Development email backend: prints emails to console (useful for password reset flow)
-EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+# Email: printed to the console unless DJANGO_EMAIL_BACKEND points at a real backend,
+# e.g. "django.core.mail.backends.smtp.EmailBackend" with DJANGO_EMAIL_HOST/PORT.
+EMAIL_BACKEND = os.environ.get("DJANGO_EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend")
+EMAIL_HOST = os.environ.get("DJANGO_EMAIL_HOST", "localhost")
+EMAIL_PORT = int(os.environ.get("DJANGO_EMAIL_PORT", "25"))
+EMAIL_TIMEOUT = 30
+DEFAULT_FROM_EMAIL = os.environ.get("DJANGO_DEFAULT_FROM_EMAIL", "NexusSphere Solutions <info@nexusspheresolutions.com>")
+
+# Contact form follow-ups, run by `manage.py runworker` (see core.tasks)
+CONTACT_NOTIFY_EMAILS = [
+    address.strip()
+    for address in os.environ.get("DJANGO_CONTACT_NOTIFY_EMAILS", "info@nexusspheresolutions.com").split(",")
+    if address.strip()
+]
+CRM_WEBHOOK_URL = os.environ.get("DJANGO_CRM_WEBHOOK_URL", "")
+CRM_WEBHOOK_TIMEOUT = 10
+
+# Contact form abuse protection (see core.spam): (burst size, seconds to refill it)
+CONTACT_RATE_LIMITS = {
+    "ip": (5, 60 * 60),
+    "email": (3, 24 * 60 * 60),
+}
+CONTACT_FORM_MIN_SECONDS = 3
+CONTACT_FORM_MAX_AGE = 24 * 60 * 60
+SPAM_QUARANTINE_SCORE = 2.5
+SPAM_REJECT_SCORE = 5.0
+# Reverse proxies (nginx, a load balancer) in front of the app. Each one appends
+# to X-Forwarded-For, and the per-IP limit reads the client address from there.
+# Leave at 0 when gunicorn is reachable directly, or the header can be forged.
+SPAM_TRUSTED_PROXY_COUNT = int(os.environ.get("DJANGO_TRUSTED_PROXY_COUNT", 0))
+
+# Read-only content API: Cache-Control max-age and lifetime of cached representations
+API_CACHE_MAX_AGE = 60
+API_REPRESENTATION_TIMEOUT = 24 * 60 * 60
+
+# Bulk contact import (POST /api/contacts/bulk/)
+CONTACT_BULK_MAX_ROWS = 10000
+CONTACT_BULK_BATCH_SIZE = 500
+# Bulk item writes (/api/items/bulk/)
+ITEM_BULK_MAX_ROWS = 10000
+ITEM_BULK_BATCH_SIZE = 500
+# Large enough for a full bulk-import batch; Django's default is 2.5 MB.
+DATA_UPLOAD_MAX_MEMORY_SIZE = 16 * 1024 * 1024
+
+# Background job queue (see core.jobs); delays in seconds
+JOB_RETRY_DELAY = 30
+JOB_RETRY_MAX_DELAY = 60 * 60
+JOB_LOCK_TIMEOUT = 10 * 60
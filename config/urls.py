@@ -15,11 +15,16 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+import re
+
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
-from django.contrib.sitemaps.views import sitemap
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.http import HttpResponse
-from core.sitemaps import StaticViewSitemap, ServiceSitemap, PortfolioSitemap, TeamSitemap, BlogSitemap
+from core.metrics import metrics_view
+from core.views import perf_view, static_view
+from core.sitemaps import sitemap_index_view, sitemap_section_view
 
 # Simple robots.txt view
 def robots_txt(request):
@@ -54,21 +59,24 @@ Sitemap: https://nexusspheresolutions.com/sitemap.xml
 """
     return HttpResponse(content, content_type='text/plain')
 
-# Sitemap configuration
-sitemaps = {
-    'static': StaticViewSitemap,
-    'services': ServiceSitemap,
-    'portfolio': PortfolioSitemap,
-    'team': TeamSitemap,
-    'blog': BlogSitemap,
-}
-
 urlpatterns = [
-    path("sitemap.xml", sitemap, {"sitemaps": sitemaps}, name="django.contrib.sitemaps.views.sitemap"),
+    path("sitemap.xml", sitemap_index_view, name="sitemap"),
+    path("sitemap-<slug:section>-<int:page>.xml", sitemap_section_view, name="sitemap_section"),
     path("robots.txt", robots_txt),
+    path("__perf__/", perf_view, name="perf"),
+    path("metrics", metrics_view, name="metrics"),
     path("admin/", admin.site.urls),
     path("", include("core.urls")),
     path("accounts/", include("django.contrib.auth.urls")),
     path("accounts/", include("core.urls_accounts")),
     path("api/", include(("core.api.urls", "core.api"), namespace="api")),
 ]
+
+# Collected static files, precompressed and cached for a year when hashed
+# (``runserver`` serves STATICFILES_DIRS itself while DEBUG is on).
+urlpatterns += [
+    re_path(rf"^{re.escape(settings.STATIC_URL.lstrip('/'))}(?P<path>.+)$", static_view, name="static"),
+]
+
+# Uploaded media and image derivatives; in production the web server serves MEDIA_ROOT.
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -1,14 +1,28 @@
 from django.contrib import admin
-from .models import Contact, TeamMember, Service, PortfolioProject, BlogPost, Item
+from django.utils import timezone
+from . import exports
+from .models import (
+    Contact, TeamMember, Service, PortfolioProject, BlogPost, Item,
+    Tag, Technology, BlogPostTag, ProjectTechnology, Job,
+)
 
 
 @admin.register(Contact)
 class ContactAdmin(admin.ModelAdmin):
-    list_display = ("name", "email", "company", "created_at")
+    list_display = ("name", "email", "company", "created_at", "quarantined", "spam_score")
     search_fields = ("name", "email", "company")
-    list_filter = ("created_at",)
-    readonly_fields = ("created_at",)
+    list_filter = ("quarantined", "created_at")
+    readonly_fields = ("created_at", "spam_score")
     ordering = ("-created_at",)
+    actions = ("export_csv", "export_ndjson")
+
+    @admin.action(description="Export selected contacts as CSV")
+    def export_csv(self, request, queryset):
+        return exports.export_response(queryset, exports.CONTACT_FIELDS, "csv", "contacts")
+
+    @admin.action(description="Export selected contacts as NDJSON")
+    def export_ndjson(self, request, queryset):
+        return exports.export_response(queryset, exports.CONTACT_FIELDS, "ndjson", "contacts")
 
 
 @admin.register(TeamMember)
@@ -28,15 +42,36 @@ class ServiceAdmin(admin.ModelAdmin):
     ordering = ("order", "title")
 
 
+@admin.register(Tag, Technology)
+class TaxonomyTermAdmin(admin.ModelAdmin):
+    list_display = ("name", "slug")
+    search_fields = ("name",)
+    prepopulated_fields = {"slug": ("name",)}
+
+
+class ProjectTechnologyInline(admin.TabularInline):
+    model = ProjectTechnology
+    extra = 1
+    autocomplete_fields = ("technology",)
+
+
+class BlogPostTagInline(admin.TabularInline):
+    model = BlogPostTag
+    extra = 1
+    autocomplete_fields = ("tag",)
+
+
 @admin.register(PortfolioProject)
 class PortfolioProjectAdmin(admin.ModelAdmin):
     list_display = ("title", "client", "expertise", "featured", "completion_date")
-    search_fields = ("title", "client", "expertise", "technologies")
+    search_fields = ("title", "client", "expertise", "technologies__name")
     list_filter = ("expertise", "featured", "completion_date")
+    inlines = (ProjectTechnologyInline,)
 
 
 @admin.register(BlogPost)
 class BlogPostAdmin(admin.ModelAdmin):
+    inlines = (BlogPostTagInline,)
     list_display = ("title", "author", "category", "published", "published_date", "created_at")
     search_fields = ("title", "content", "author__username")
     list_filter = ("category", "published", "published_date", "created_at")
@@ -51,3 +86,19 @@ class ItemAdmin(admin.ModelAdmin):
 	list_display = ("id", "name", "owner", "created_at")
 	search_fields = ("name", "owner__username")
 	raw_id_fields = ("owner",)
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("task", "status", "attempts", "max_attempts", "run_after", "finished_at")
+    list_filter = ("status", "task")
+    readonly_fields = ("created_at", "finished_at", "locked_by", "locked_at", "last_error")
+    ordering = ("-id",)
+    actions = ("retry_jobs",)
+
+    @admin.action(description="Retry selected jobs now")
+    def retry_jobs(self, request, queryset):
+        count = queryset.exclude(status=Job.RUNNING).update(
+            status=Job.QUEUED, attempts=0, run_after=timezone.now(), finished_at=None,
+        )
+        self.message_user(request, f"Queued {count} job(s) for retry.")
@@ -0,0 +1,110 @@
+"""HTTP and representation caching for the read-only content API.
+
+``VersionedSerializerMixin`` caches each object's serialized dict under its
+``updated_at`` plus the model's generation counter (``core.cache``), which
+also moves when related tags/technologies change; list pages fetch all of
+them with one ``get_many``. ``HTTPCacheMixin`` gives list and detail
+responses an ETag, ``Last-Modified`` and ``Cache-Control`` and answers
+revalidations with ``304 Not Modified`` after a single aggregate query.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from rest_framework import serializers
+
+from ..cache import model_version
+from ..conditional import latest_change
+
+
+class CachedListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        items = data.all() if isinstance(data, models.manager.BaseManager) else data
+        items = list(items)
+        if not items:
+            return []
+        version = model_version(self.child.Meta.model)
+        keys = [self.child.representation_key(item, version) for item in items]
+        cached = cache.get_many(keys)
+        missing = {}
+        result = []
+        for key, item in zip(keys, items):
+            if key not in cached:
+                missing[key] = cached[key] = self.child.build_representation(item)
+            result.append(cached[key])
+        if missing:
+            cache.set_many(missing, settings.API_REPRESENTATION_TIMEOUT)
+        return result
+
+
+class VersionedSerializerMixin:
+    """Cache ``to_representation`` per object version. Output must not depend on the request."""
+
+    def representation_key(self, instance, version=None):
+        if version is None:
+            version = model_version(self.Meta.model)
+        updated = instance.updated_at.timestamp() if instance.updated_at else 0
+        return f"api:{type(self).__name__}:{version}:{instance.pk}:{updated}"
+
+    def build_representation(self, instance):
+        return super().to_representation(instance)
+
+    def to_representation(self, instance):
+        key = self.representation_key(instance)
+        data = cache.get(key)
+        if data is None:
+            data = self.build_representation(instance)
+            cache.set(key, data, settings.API_REPRESENTATION_TIMEOUT)
+        return data
+
+
+class HTTPCacheMixin:
+    """ETag / Last-Modified / Cache-Control for ``list`` and ``retrieve``."""
+
+    def validator_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == "retrieve":
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return queryset
+
+    def _cached_response(self, request, handler):
+        last_modified, rows = latest_change(self.validator_queryset())
+        if self.action == "retrieve" and not rows:
+            return handler()  # Let the view raise 404.
+        version = model_version(self.get_queryset().model)
+        raw = "|".join([
+            request.get_full_path(),
+            request.accepted_renderer.format,
+            str(version),
+            last_modified.isoformat() if last_modified else "",
+            str(rows),
+        ])
+        etag = quote_etag(hashlib.md5(raw.encode()).hexdigest())
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = handler()
+            if response.status_code != 200:
+                return response
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        # The browsable API shows who is logged in, so only JSON may sit in shared caches.
+        visibility = {"public": True} if request.accepted_renderer.format == "json" else {"private": True}
+        patch_cache_control(response, max_age=settings.API_CACHE_MAX_AGE, **visibility)
+        patch_vary_headers(response, ("Accept",))
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(request, lambda: super(HTTPCacheMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(
+            request, lambda: super(HTTPCacheMixin, self).retrieve(request, *args, **kwargs),
+        )
@@ -0,0 +1,122 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class ContentPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class KeysetCursorPagination(BasePagination):
+    """Newest-first cursor pagination keyed on ``(ordering_field, id)``.
+
+    Unlike DRF's ``CursorPagination``, which positions on one field and falls
+    back to an offset among equal values, each page is an index range scan
+    starting right after the previous page's last ``(ordering_field, id)``
+    pair, so latency stays flat however deep a client walks. Needs a
+    composite index on ``(ordering_field, id)``.
+    """
+
+    ordering_field = "created_at"
+    page_size = 50
+    max_page_size = 500
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request, queryset.model)
+        field = self.ordering_field
+
+        if cursor is None:
+            reverse = False
+            queryset = queryset.order_by(f"-{field}", "-id")
+        else:
+            value, pk, reverse = cursor
+            # The redundant ``<=``/``>=`` bound lets the database seek into the
+            # index instead of scanning it from the top to evaluate the OR.
+            if reverse:
+                after = Q(**{f"{field}__gt": value}) | Q(id__gt=pk)
+                queryset = queryset.filter(after, **{f"{field}__gte": value}).order_by(field, "id")
+            else:
+                before = Q(**{f"{field}__lt": value}) | Q(id__lt=pk)
+                queryset = queryset.filter(before, **{f"{field}__lte": value}).order_by(f"-{field}", "-id")
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def decode_cursor(self, request, model):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            value, pk, reverse = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            value = model._meta.get_field(self.ordering_field).to_python(value)
+            if value is None or isinstance(pk, bool) or not isinstance(pk, int):
+                raise ValueError("Incomplete cursor")
+            return value, pk, bool(reverse)
+        except (TypeError, ValueError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, row, reverse):
+        value = getattr(row, self.ordering_field)
+        value = value.isoformat() if hasattr(value, "isoformat") else value
+        encoded = base64.urlsafe_b64encode(json.dumps([value, row.pk, int(reverse)]).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ("next", self.get_next_link()),
+            ("previous", self.get_previous_link()),
+            ("results", data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -1,10 +1,130 @@
-from rest_framework import serializers
-from ..models import Item
+from django.urls import reverse
+from rest_framework import permissions, serializers
+from ..models import BlogPost, Contact, Item, PortfolioProject, Service, TeamMember
+from .caching import CachedListSerializer, VersionedSerializerMixin
 
 
-class ItemSerializer(serializers.ModelSerializer):
+def requested_fields(request):
+    """Field names from ``?fields=a,b``, or ``None`` when the parameter is absent."""
+    if request is None or not request.query_params.get("fields"):
+        return None
+    return {name.strip() for name in request.query_params["fields"].split(",") if name.strip()}
+
+
+class SparseFieldsetMixin:
+    """Limit the serialized fields to those listed in ``?fields=`` (top-level serializer only).
+
+    Reads drop the other fields before serializing. Writes still validate and
+    save every field, and only the response is trimmed, so ``?fields=`` can't
+    be used to skip validation.
+    """
+
+    _response_fields = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.parent is not None and not isinstance(self.parent, serializers.ListSerializer):
+            return
+        request = self.context.get("request")
+        wanted = requested_fields(request)
+        if wanted is None:
+            return
+        unknown = wanted - set(self.fields)
+        if unknown:
+            raise serializers.ValidationError({"fields": f"Unknown field(s): {', '.join(sorted(unknown))}."})
+        if request.method not in permissions.SAFE_METHODS:
+            self._response_fields = wanted
+            return
+        for name in set(self.fields) - wanted:
+            self.fields.pop(name)
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if self._response_fields is not None:
+            for name in set(data) - self._response_fields:
+                del data[name]
+        return data
+
+
+class ItemSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     owner = serializers.ReadOnlyField(source="owner.username")
 
     class Meta:
         model = Item
         fields = ["id", "name", "description", "created_at", "owner"]
+
+
+class ContactSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Contact
+        fields = ["id", "name", "email", "company", "message", "created_at"]
+        read_only_fields = ["id", "created_at"]
+
+
+# Read-only content API. Representations are cached per object version, so
+# they must not depend on the request (URLs are site-relative).
+class ImageURLField(serializers.ImageField):
+    def to_representation(self, value):
+        return value.url if value else None
+
+
+class ServiceSerializer(VersionedSerializerMixin, serializers.ModelSerializer):
+    expertise_display = serializers.CharField(source="get_expertise_display")
+
+    class Meta:
+        model = Service
+        fields = [
+            "id", "title", "description", "expertise", "expertise_display", "icon", "features",
+            "price_range", "order", "updated_at",
+        ]
+        list_serializer_class = CachedListSerializer
+
+
+class TeamMemberSerializer(VersionedSerializerMixin, serializers.ModelSerializer):
+    image = ImageURLField()
+
+    class Meta:
+        model = TeamMember
+        fields = ["id", "name", "position", "bio", "image", "email", "linkedin", "github", "order", "updated_at"]
+        list_serializer_class = CachedListSerializer
+
+
+class PortfolioProjectSerializer(VersionedSerializerMixin, serializers.ModelSerializer):
+    expertise_display = serializers.CharField(source="get_expertise_display")
+    technologies = serializers.SlugRelatedField(slug_field="name", many=True, read_only=True)
+    image = ImageURLField()
+    url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = PortfolioProject
+        fields = [
+            "id", "title", "client", "description", "expertise", "expertise_display", "technologies",
+            "image", "live_url", "github_url", "featured", "completion_date", "url", "updated_at",
+        ]
+        list_serializer_class = CachedListSerializer
+
+    def get_url(self, obj):
+        return reverse("core:portfolio_detail", args=[obj.pk])
+
+
+class BlogPostSerializer(VersionedSerializerMixin, serializers.ModelSerializer):
+    author = serializers.SerializerMethodField()
+    tags = serializers.SlugRelatedField(slug_field="name", many=True, read_only=True)
+    image = ImageURLField()
+    url = serializers.CharField(source="get_absolute_url")
+
+    class Meta:
+        model = BlogPost
+        fields = [
+            "id", "title", "slug", "plain_excerpt", "author", "category", "tags", "image",
+            "published_date", "reading_minutes", "url", "updated_at",
+        ]
+        list_serializer_class = CachedListSerializer
+
+    def get_author(self, obj):
+        return obj.author.get_full_name() or obj.author.username
+
+
+class BlogPostDetailSerializer(BlogPostSerializer):
+    class Meta(BlogPostSerializer.Meta):
+        fields = BlogPostSerializer.Meta.fields + ["content", "word_count"]
@@ -1,9 +1,16 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ItemViewSet
+from .views import (
+    BlogPostViewSet, ContactViewSet, ItemViewSet, PortfolioProjectViewSet, ServiceViewSet, TeamMemberViewSet,
+)
 
 router = DefaultRouter()
 router.register(r"items", ItemViewSet, basename="item")
+router.register(r"contacts", ContactViewSet, basename="contact")
+router.register(r"services", ServiceViewSet, basename="service")
+router.register(r"team", TeamMemberViewSet, basename="teammember")
+router.register(r"portfolio", PortfolioProjectViewSet, basename="portfolioproject")
+router.register(r"blog", BlogPostViewSet, basename="blogpost")
 
 urlpatterns = [
     path("", include(router.urls)),
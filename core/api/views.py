@@ -1,6 +1,50 @@
-from rest_framework import viewsets, permissions
-from ..models import Item
-from .serializers import ItemSerializer
+from django.conf import settings
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+from rest_framework import viewsets, permissions, serializers, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from .. import exports, spam
+from ..models import BlogPost, Contact, Item, PortfolioProject, Service, TeamMember
+from .caching import HTTPCacheMixin
+from .pagination import ContentPagination, KeysetCursorPagination
+from .serializers import (
+    BlogPostDetailSerializer, BlogPostSerializer, ContactSerializer, ItemSerializer,
+    PortfolioProjectSerializer, ServiceSerializer, TeamMemberSerializer, requested_fields,
+)
+
+
+def _batch(request, limit, noun):
+    """The request body as a list of at most ``limit`` rows."""
+    rows = request.data
+    if not isinstance(rows, list):
+        raise ValidationError({"detail": f"Expected a JSON list of {noun}."})
+    if len(rows) > limit:
+        raise ValidationError({"detail": f"At most {limit} {noun} per request."})
+    return rows
+
+
+def _validate_rows(validator, rows):
+    """Validate every row with one serializer; returns ``[(index, data)]`` and per-row errors.
+
+    Building a serializer per row would dominate the cost of a large batch.
+    """
+    valid, errors = [], []
+    for index, row in enumerate(rows):
+        try:
+            valid.append((index, validator.run_validation(row)))
+        except serializers.ValidationError as exc:
+            errors.append({"index": index, "errors": exc.detail})
+    return valid, errors
+
+
+def _is_id(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _batch_status(succeeded, errors, success=status.HTTP_200_OK):
+    return success if succeeded or not errors else status.HTTP_400_BAD_REQUEST
 
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
@@ -15,9 +59,224 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
 
 
 class ItemViewSet(viewsets.ModelViewSet):
-    queryset = Item.objects.all().order_by("-created_at")
+    queryset = Item.objects.all().order_by("-created_at", "-id")
     serializer_class = ItemSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsOwnerOrReadOnly]
+    pagination_class = KeysetCursorPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = requested_fields(self.request)
+        if fields is None or "owner" in fields:
+            return queryset.select_related("owner")
+        return queryset
 
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
+
+    # Bulk writes: one statement per chunk instead of one request per item.
+    # Rows that fail validation or the ownership check are reported by index
+    # and skipped; the rest are applied in one transaction.
+    def _check_owners(self, owners, ids):
+        """Split ``ids`` into those the user may change and per-id error messages.
+
+        ``owners`` maps the ids that exist to their ``owner_id``, fetched for
+        the whole batch in one query.
+        """
+        user = self.request.user
+        allowed, problems = set(), {}
+        for pk in ids:
+            if pk not in owners:
+                problems[pk] = "Not found."
+            elif user.is_staff or owners[pk] == user.pk:
+                allowed.add(pk)
+            else:
+                problems[pk] = "You do not have permission to change this item."
+        return allowed, problems
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """Create items from a JSON list, owned by the requesting user."""
+        rows = _batch(request, settings.ITEM_BULK_MAX_ROWS, "items")
+        valid, errors = _validate_rows(self.get_serializer(), rows)
+        items = [Item(owner=request.user, **data) for _, data in valid]
+        with transaction.atomic():
+            Item.objects.bulk_create(items, batch_size=settings.ITEM_BULK_BATCH_SIZE)
+        return Response(
+            {"created": [item.pk for item in items], "errors": errors},
+            status=_batch_status(items, errors, status.HTTP_201_CREATED),
+        )
+
+    @bulk.mapping.patch
+    def bulk_partial_update(self, request):
+        """Apply a JSON list of ``{"id": ..., <fields>}`` partial updates."""
+        rows = _batch(request, settings.ITEM_BULK_MAX_ROWS, "items")
+        errors, updates = [], []
+        for index, row in enumerate(rows):
+            pk = row.get("id") if isinstance(row, dict) else None
+            if not _is_id(pk):
+                errors.append({"index": index, "errors": {"id": ["An integer id is required."]}})
+            else:
+                updates.append((index, pk, {key: value for key, value in row.items() if key != "id"}))
+
+        ids = {pk for _, pk, _ in updates}
+        items = Item.objects.in_bulk(ids)
+        allowed, problems = self._check_owners({pk: item.owner_id for pk, item in items.items()}, ids)
+        validator = self.get_serializer(partial=True)
+        changed, fields = {}, set()
+        for index, pk, data in updates:
+            if pk in problems:
+                errors.append({"index": index, "id": pk, "errors": {"detail": [problems[pk]]}})
+                continue
+            try:
+                data = validator.run_validation(data)
+            except serializers.ValidationError as exc:
+                errors.append({"index": index, "id": pk, "errors": exc.detail})
+                continue
+            for field, value in data.items():
+                setattr(items[pk], field, value)
+            fields.update(data)
+            changed[pk] = items[pk]
+
+        if changed and fields:
+            with transaction.atomic():
+                Item.objects.bulk_update(changed.values(), sorted(fields), batch_size=settings.ITEM_BULK_BATCH_SIZE)
+        errors.sort(key=lambda error: error["index"])
+        return Response({"updated": sorted(changed), "errors": errors}, status=_batch_status(changed, errors))
+
+    @bulk.mapping.delete
+    def bulk_destroy(self, request):
+        """Delete the items whose ids are given as a JSON list."""
+        rows = _batch(request, settings.ITEM_BULK_MAX_ROWS, "ids")
+        errors, targets = [], []
+        for index, pk in enumerate(rows):
+            if _is_id(pk):
+                targets.append((index, pk))
+            else:
+                errors.append({"index": index, "errors": {"id": ["An integer id is required."]}})
+        ids = {pk for _, pk in targets}
+        owners = dict(Item.objects.filter(id__in=ids).values_list("id", "owner_id"))
+        allowed, problems = self._check_owners(owners, ids)
+        errors += [
+            {"index": index, "id": pk, "errors": {"detail": [problems[pk]]}}
+            for index, pk in targets if pk in problems
+        ]
+        # Item has no dependents or delete signals, so this is a single DELETE ... WHERE id IN (...).
+        Item.objects.filter(id__in=allowed).delete()
+        errors.sort(key=lambda error: error["index"])
+        return Response({"deleted": sorted(allowed), "errors": errors}, status=_batch_status(allowed, errors))
+
+
+class ContactViewSet(viewsets.GenericViewSet):
+    """Bulk import and streaming export of contact-form leads (staff only)."""
+
+    queryset = Contact.objects.all()
+    serializer_class = ContactSerializer
+    permission_classes = [permissions.IsAdminUser]
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """Insert a JSON list of contacts; invalid rows are skipped and reported by index.
+
+        Valid rows are written with ``bulk_create`` in chunks inside one
+        transaction, so either all of them are stored or none are.
+        """
+        rows = _batch(request, settings.CONTACT_BULK_MAX_ROWS, "contacts")
+        valid, errors = _validate_rows(self.get_serializer(), rows)
+        contacts = [Contact(**data) for _, data in valid]
+        with transaction.atomic():
+            Contact.objects.bulk_create(contacts, batch_size=settings.CONTACT_BULK_BATCH_SIZE)
+        return Response(
+            {"created": len(contacts), "errors": errors},
+            status=_batch_status(contacts, errors, status.HTTP_201_CREATED),
+        )
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """Stream contacts as ``?as=csv`` (default) or ``?as=ndjson``, optionally ``?since=<ISO datetime>``."""
+        # Not ``?format=``: DRF reserves it for renderer selection.
+        export_format = request.query_params.get("as", "csv")
+        if export_format not in exports.FORMATS:
+            raise ValidationError({"as": f"Choose one of: {', '.join(exports.FORMATS)}."})
+        queryset = self.get_queryset()
+        if request.query_params.get("since"):
+            since = parse_datetime(request.query_params["since"])
+            if since is None:
+                raise ValidationError({"since": "Expected an ISO 8601 datetime."})
+            # Ordered to match ``core_contact_created_idx`` so the range is an index seek.
+            queryset = queryset.filter(created_at__gte=since).order_by("created_at", "pk")
+        return exports.export_response(queryset, exports.CONTACT_FIELDS, export_format, "contacts")
+
+    @action(detail=False, methods=["get"], url_path="spam-stats")
+    def spam_stats(self, request):
+        """Contact-form screening outcomes counted since the cache was last cleared."""
+        totals = spam.counters()
+        submitted = sum(totals.values())
+        rejected = submitted - totals[spam.ACCEPTED] - totals[spam.QUARANTINED]
+        return Response({
+            "counters": totals,
+            "submitted": submitted,
+            "rejection_rate": rejected / submitted if submitted else 0.0,
+        })
+
+
+# Read-only content API
+def _flag(value):
+    return value.lower() in ("1", "true", "yes")
+
+
+class ServiceViewSet(HTTPCacheMixin, viewsets.ReadOnlyModelViewSet):
+    """Services, filterable with ``?expertise=``."""
+
+    queryset = Service.objects.all()
+    serializer_class = ServiceSerializer
+
+    def filter_queryset(self, queryset):
+        expertise = self.request.query_params.get("expertise")
+        return queryset.filter(expertise=expertise) if expertise else queryset
+
+
+class TeamMemberViewSet(HTTPCacheMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = TeamMember.objects.all()
+    serializer_class = TeamMemberSerializer
+
+
+class PortfolioProjectViewSet(HTTPCacheMixin, viewsets.ReadOnlyModelViewSet):
+    """Projects, filterable with ``?expertise=``, ``?technology=<slug>`` and ``?featured=true``."""
+
+    queryset = PortfolioProject.objects.prefetch_related("technologies")
+    serializer_class = PortfolioProjectSerializer
+    pagination_class = ContentPagination
+
+    def filter_queryset(self, queryset):
+        params = self.request.query_params
+        if params.get("expertise"):
+            queryset = queryset.filter(expertise=params["expertise"])
+        if params.get("technology"):
+            queryset = queryset.filter(technologies__slug=params["technology"])
+        if params.get("featured"):
+            queryset = queryset.filter(featured=_flag(params["featured"]))
+        return queryset
+
+
+class BlogPostViewSet(HTTPCacheMixin, viewsets.ReadOnlyModelViewSet):
+    """Published posts by slug, filterable with ``?category=`` and ``?tag=<slug>``."""
+
+    lookup_field = "slug"
+    pagination_class = ContentPagination
+
+    def get_queryset(self):
+        if self.action == "retrieve":
+            return BlogPost.objects.published().with_author().prefetch_related("tags")
+        return BlogPost.objects.published().for_listing()
+
+    def get_serializer_class(self):
+        return BlogPostDetailSerializer if self.action == "retrieve" else BlogPostSerializer
+
+    def filter_queryset(self, queryset):
+        params = self.request.query_params
+        if params.get("category"):
+            queryset = queryset.filter(category=params["category"])
+        if params.get("tag"):
+            queryset = queryset.filter(tags__slug=params["tag"])
+        return queryset
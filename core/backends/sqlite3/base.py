@@ -0,0 +1,38 @@
+"""SQLite backend with per-connection PRAGMAs and ``BEGIN IMMEDIATE`` transactions.
+
+Backports the ``init_command`` and ``transaction_mode`` OPTIONS that Django
+5.1 adds to its own SQLite backend, so settings stay valid after an upgrade
+(switch ``ENGINE`` back to ``django.db.backends.sqlite3`` then):
+
+* ``init_command``: ``;``-separated statements run on every new connection,
+  used for ``journal_mode=WAL``, ``synchronous=NORMAL`` and ``mmap_size``.
+* ``transaction_mode``: ``"IMMEDIATE"`` takes the write lock when an atomic
+  block starts. With the default deferred ``BEGIN`` a transaction that reads
+  before it writes (every admin save) fails at once with "database is locked"
+  if another connection wrote in between; an immediate one waits for the
+  lock for up to ``timeout`` seconds instead.
+"""
+
+from django.db.backends.sqlite3 import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_connection_params(self):
+        kwargs = super().get_connection_params()
+        self.transaction_mode = (kwargs.pop("transaction_mode", None) or "").upper()
+        self.init_commands = [
+            command.strip() for command in kwargs.pop("init_command", "").split(";") if command.strip()
+        ]
+        return kwargs
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for command in self.init_commands:
+            conn.execute(command)
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        if self.transaction_mode:
+            self.cursor().execute(f"BEGIN {self.transaction_mode}")
+        else:
+            super()._start_transaction_under_autocommit()
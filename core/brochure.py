@@ -0,0 +1,222 @@
+"""Company brochure PDF, rendered once per distinct content and stored on disk.
+
+The brochure lists the live ``Service`` rows and the portfolio highlights.
+Its file name embeds a hash of everything that goes into it, so an unchanged
+brochure is never rebuilt and a changed one can't be confused with the old
+file. ``current()`` maps the model generation counters (see ``core.cache``)
+to that hash, which makes the common download path one cache lookup and an
+``open()``. Saves to services or projects queue a ``brochure.rebuild`` job
+(see ``core.signals`` and ``core.tasks``); ``python manage.py build_brochure``
+pre-builds it at deploy time.
+
+Builds take an exclusive lock on a file in ``BROCHURE_ROOT`` so workers and
+web processes never render the same PDF twice, and a superseded file is only
+deleted ``BROCHURE_RETENTION_SECONDS`` after its replacement was written, so a
+download that resolved the old digest can still open it.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from io import BytesIO
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .cache import versions_key
+from .models import PortfolioProject, Service
+
+try:
+    import fcntl
+except ImportError:  # Windows: builds are only serialised within one process.
+    fcntl = None
+
+FILENAME = "nexussphere_brochure.pdf"
+
+# Bump when the layout in ``render_pdf`` changes so stored files are rebuilt.
+LAYOUT_VERSION = 1
+
+PROJECT_LIMIT = 8
+
+CONTACT = [
+    "Email: info@nexusspheresolutions.com",
+    "Phone: +1 (555) 123-4567",
+    "Website: https://nexusspheresolutions.com",
+]
+
+_thread_lock = threading.Lock()
+
+
+def brochure_root():
+    return Path(settings.BROCHURE_ROOT)
+
+
+def collect_inputs():
+    """Everything the brochure renders, as plain JSON-serializable data."""
+    services = [
+        {
+            "title": service.title,
+            "description": service.description,
+            "expertise": service.get_expertise_display(),
+            "features": [str(feature) for feature in service.features or []],
+        }
+        for service in Service.objects.all()
+    ]
+    projects = [
+        {
+            "title": project.title,
+            "client": project.client,
+            "expertise": project.get_expertise_display(),
+            "technologies": [technology.name for technology in project.technologies.all()],
+        }
+        for project in PortfolioProject.objects.prefetch_related("technologies")
+        .defer("description")
+        .order_by("-featured", "-completion_date", "-created_at")[:PROJECT_LIMIT]
+    ]
+    return {"layout": LAYOUT_VERSION, "services": services, "projects": projects, "contact": CONTACT}
+
+
+def digest_of(inputs):
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()[:20]
+
+
+def path_for(digest):
+    return brochure_root() / f"brochure-{digest}.pdf"
+
+
+def render_pdf(inputs):
+    """Lay out the brochure with ReportLab and return the PDF bytes."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+    from django.utils.html import escape
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, title="NexusSphere Solutions - Company Brochure")
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=20,
+        spaceAfter=30,
+        alignment=1  # center
+    )
+
+    content = [
+        Paragraph("NexusSphere Solutions - Company Brochure", title_style),
+        Spacer(1, 12),
+        Paragraph("Empowering Businesses with Innovative Technology Solutions", styles['Heading2']),
+    ]
+
+    if inputs["services"]:
+        content.append(Paragraph("Our Services", styles['Heading3']))
+        for service in inputs["services"]:
+            content.append(Paragraph(f"<b>{escape(service['title'])}</b>", styles['Normal']))
+            content.append(Paragraph(escape(service["description"]), styles['Normal']))
+            for feature in service["features"]:
+                content.append(Paragraph(f"• {escape(feature)}", styles['Normal']))
+            content.append(Spacer(1, 8))
+
+    if inputs["projects"]:
+        content.append(Paragraph("Selected Projects", styles['Heading3']))
+        for project in inputs["projects"]:
+            heading = escape(project["title"])
+            if project["client"]:
+                heading += f" — {escape(project['client'])}"
+            content.append(Paragraph(f"<b>{heading}</b>", styles['Normal']))
+            details = project["expertise"]
+            if project["technologies"]:
+                details += " · " + ", ".join(project["technologies"])
+            content.append(Paragraph(escape(details), styles['Normal']))
+            content.append(Spacer(1, 6))
+
+    content.append(Spacer(1, 12))
+    content.append(Paragraph("Contact Us", styles['Heading3']))
+    for line in inputs["contact"]:
+        content.append(Paragraph(escape(line), styles['Normal']))
+
+    doc.build(content)
+    return buffer.getvalue()
+
+
+def _write_atomically(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".brochure-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _prune(keep):
+    """Delete brochures that were superseded more than ``BROCHURE_RETENTION_SECONDS`` ago.
+
+    A file counts as superseded when the next newer file was written.
+    """
+    cutoff = time.time() - settings.BROCHURE_RETENTION_SECONDS
+    files = sorted(
+        ((path.stat().st_mtime, path) for path in brochure_root().glob("brochure-*.pdf")),
+        reverse=True,
+    )
+    for (replaced_at, _), (_, old) in zip(files, files[1:]):
+        if old != keep and replaced_at < cutoff:
+            old.unlink(missing_ok=True)
+
+
+@contextmanager
+def _build_lock():
+    root = brochure_root()
+    root.mkdir(parents=True, exist_ok=True)
+    with _thread_lock, open(root / ".build.lock", "a") as handle:
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _cache_key():
+    return f"brochure:{versions_key((Service, PortfolioProject))}"
+
+
+def build():
+    """Make sure the brochure for the current data exists on disk.
+
+    Returns ``(path, digest)``; the PDF is only rendered when no file for this
+    content exists yet.
+    """
+    # Read the counters first: a save landing mid-build must not be masked.
+    key = _cache_key()
+    inputs = collect_inputs()
+    digest = digest_of(inputs)
+    path = path_for(digest)
+    with _build_lock():
+        if path.exists():
+            # Content went back to an earlier brochure: it is the newest one again.
+            os.utime(path)
+        else:
+            _write_atomically(path, render_pdf(inputs))
+        _prune(keep=path)
+    cache.set(key, digest, None)
+    return path, digest
+
+
+def current():
+    """``(path, digest)`` of the brochure for the current data, building it if needed."""
+    digest = cache.get(_cache_key())
+    if digest is not None:
+        path = path_for(digest)
+        if path.exists():
+            return path, digest
+    return build()
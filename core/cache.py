@@ -0,0 +1,132 @@
+"""Response caching helpers for the public pages.
+
+Cached entries embed per-model generation counters (see ``model_version``).
+Saving or deleting a model bumps its counter from ``core.signals``, so every
+key built from the old counter simply stops being read: pages can be cached
+for a long time and still change the moment an editor saves in the admin,
+without flushing unrelated entries.
+"""
+
+import hashlib
+import time
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from . import metrics
+
+
+def _version_key(model):
+    return f"version:{model._meta.label_lower}"
+
+
+def model_version(model):
+    """Current generation counter of ``model``.
+
+    A missing counter (first use, eviction, cache restart) is seeded from the
+    clock rather than 1, so it can never fall back to a value that older
+    cached entries were built with.
+    """
+    key = _version_key(model)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_model_version(model):
+    key = _version_key(model)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # No counter yet; seeding one is enough to invalidate.
+        return model_version(model)
+
+
+def versions_key(models):
+    """Compact string of the current counters of ``models``, for use in cache keys."""
+    return ".".join(str(model_version(model)) for model in models)
+
+
+class ModelVersions:
+    """Template helper: ``{{ cache_versions.service }}`` is the counter of ``core.Service``."""
+
+    def __getitem__(self, model_name):
+        try:
+            model = apps.get_model("core", model_name)
+        except LookupError:
+            raise KeyError(model_name)
+        return model_version(model)
+
+
+def page_cache_key(request, query_params=None, models=()):
+    """Cache key for an anonymous GET of ``request``.
+
+    Only the query parameters named in ``query_params`` take part in the key, so
+    tracking parameters such as ``?utm_source=`` don't fragment the cache. Pass
+    ``None`` to key on every parameter.
+    """
+    if query_params is None:
+        items = sorted((name, value) for name, values in request.GET.lists() for value in values)
+    else:
+        items = [(name, value) for name in sorted(query_params) for value in request.GET.getlist(name)]
+    url = f"{request.scheme}://{request.get_host()}{request.path}?{urlencode(items)}"
+    return f"page:{versions_key(models)}:{hashlib.md5(url.encode()).hexdigest()}"
+
+
+def _is_cacheable(request, response):
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        # A rendered {% csrf_token %} must never be shared between visitors.
+        and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+    )
+
+
+def cache_public_page(timeout=None, query_params=None, models=()):
+    """Cache a view's full response for anonymous visitors.
+
+    ``models`` lists the models the page renders; a save to any of them
+    invalidates the cached copy. Authenticated users (whose header shows
+    admin/logout links) and non-GET requests always reach the view. Responses
+    carry ``X-Cache: HIT``/``MISS``.
+    For class-based views apply it with ``method_decorator(..., name="dispatch")``.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD") or request.user.is_authenticated:
+                return view_func(request, *args, **kwargs)
+
+            key = page_cache_key(request, query_params, models)
+            cached = cache.get(key)
+            metrics.cache_lookup("page", cached is not None)
+            if cached is not None:
+                content, headers = cached
+                response = HttpResponse(content)
+                for header, value in headers:
+                    response[header] = value
+                response["X-Cache"] = "HIT"
+                return response
+
+            response = view_func(request, *args, **kwargs)
+            if hasattr(response, "render") and callable(response.render):
+                response.render()
+            if _is_cacheable(request, response):
+                cache.set(
+                    key,
+                    (response.content, list(response.items())),
+                    settings.PAGE_CACHE_TIMEOUT if timeout is None else timeout,
+                )
+            response["X-Cache"] = "MISS"
+            return response
+
+        return _wrapped_view
+
+    return decorator
@@ -0,0 +1,138 @@
+"""Conditional GET support (ETag / Last-Modified -> 304 Not Modified).
+
+Validators are derived from cheap aggregate queries over ``updated_at`` so a
+revalidating crawler or browser costs one small query instead of a full page
+render. Only anonymous requests get validators: the header of an
+authenticated page differs per user. ``file_response`` adds byte-range
+support for downloads served from disk.
+"""
+
+import hashlib
+import os
+import re
+
+from django.db.models import Count, Max
+from django.http import FileResponse, HttpResponse
+from django.utils.http import quote_etag
+from django.views.decorators.http import condition
+
+from .cache import model_version
+
+
+def latest_change(queryset, field="updated_at"):
+    """``(newest timestamp, row count)`` of ``queryset`` in a single query.
+
+    The count makes deletions visible in the ETag even though they don't move
+    the newest timestamp.
+    """
+    result = queryset.order_by().aggregate(latest=Max(field), count=Count("pk"))
+    return result["latest"], result["count"]
+
+
+def conditional_page(validators):
+    """Decorate a view so it answers conditional GETs with ``304 Not Modified``.
+
+    ``validators(request, *args, **kwargs)`` returns ``(last_modified,
+    fingerprint)`` or ``None`` to skip validation (e.g. the object doesn't
+    exist, letting the view raise 404). ``fingerprint`` is anything else the
+    page depends on; it only feeds the ETag. Apply it outside
+    ``cache_public_page`` so cached hits are revalidated too.
+    """
+    def _validators(request, *args, **kwargs):
+        if not hasattr(request, "_conditional_validators"):
+            request._conditional_validators = (
+                None if request.user.is_authenticated else validators(request, *args, **kwargs)
+            )
+        return request._conditional_validators
+
+    def etag_func(request, *args, **kwargs):
+        result = _validators(request, *args, **kwargs)
+        if result is None:
+            return None
+        last_modified, fingerprint = result
+        raw = f"{request.get_full_path()}|{last_modified and last_modified.isoformat()}|{fingerprint}"
+        return hashlib.md5(raw.encode()).hexdigest()
+
+    def last_modified_func(request, *args, **kwargs):
+        result = _validators(request, *args, **kwargs)
+        return result[0] if result else None
+
+    return condition(etag_func=etag_func, last_modified_func=last_modified_func)
+
+
+class ConditionalGetMixin:
+    """Class-based view counterpart of ``conditional_page``.
+
+    By default the validators are ``latest_change(self.get_queryset())`` plus
+    the version counter of ``self.model``, which also moves for changes that
+    don't touch ``updated_at`` (tags/technologies set through the M2M
+    managers); override ``conditional_validators`` for anything else.
+    """
+
+    def conditional_validators(self):
+        latest, count = latest_change(self.get_queryset())
+        return latest, (count, model_version(self.model))
+
+    def dispatch(self, request, *args, **kwargs):
+        view = conditional_page(lambda *a, **kw: self.conditional_validators())(super().dispatch)
+        return view(request, *args, **kwargs)
+
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _requested_range(request, size, etag):
+    """``(start, end)`` of a satisfiable single ``Range`` header, ``None`` for the whole file.
+
+    Raises ``ValueError`` for a range that lies outside the file. Multi-range
+    and malformed headers are ignored, as RFC 9110 allows.
+    """
+    match = _RANGE_RE.match(request.headers.get("Range", "").replace(" ", ""))
+    if match is None or request.method != "GET":
+        return None
+    if_range = request.headers.get("If-Range")
+    if if_range is not None and if_range != quote_etag(etag):
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("unsatisfiable range")
+    return start, end
+
+
+def file_response(request, path, etag, filename=None, content_type=None):
+    """Serve ``path`` with a strong ETag, ``Accept-Ranges`` and single-range ``206`` support.
+
+    ``etag`` must change whenever the file content does (e.g. a content hash).
+    Pair it with ``conditional_page``/``condition`` for ``304`` handling.
+    """
+    size = os.path.getsize(path)
+    try:
+        byte_range = _requested_range(request, size, etag)
+    except ValueError:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    if byte_range is None:
+        response = FileResponse(
+            open(path, "rb"), as_attachment=filename is not None, filename=filename or "",
+            content_type=content_type,
+        )
+    else:
+        start, end = byte_range
+        with open(path, "rb") as handle:
+            handle.seek(start)
+            body = handle.read(end - start + 1)
+        response = HttpResponse(body, status=206, content_type=content_type)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        if filename:
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = quote_etag(etag)
+    return response
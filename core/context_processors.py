@@ -0,0 +1,11 @@
+from django.conf import settings
+
+from .cache import ModelVersions
+
+
+def caching(request):
+    """Expose cache timeouts and model generation counters to ``{% cache %}`` fragments."""
+    return {
+        "fragment_cache_timeout": settings.FRAGMENT_CACHE_TIMEOUT,
+        "cache_versions": ModelVersions(),
+    }
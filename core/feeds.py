@@ -0,0 +1,128 @@
+"""RSS and Atom feeds of published blog posts: all, per category and per tag.
+
+Feed readers poll every few minutes, so ``feed_view`` answers each request
+from one aggregate query (newest ``updated_at`` and row count of the feed's
+posts): ``304 Not Modified`` when the reader's ETag or date still matches,
+otherwise the rendered body cached under those values, and only a changed
+feed is rendered again.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.contrib.syndication.views import Feed
+from django.core.cache import cache
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.http import http_date, quote_etag
+
+from . import metrics
+from .cache import model_version
+from .conditional import latest_change
+from .models import BlogPost, Tag
+
+ITEMS = 20
+
+_CATEGORIES = dict(BlogPost._meta.get_field("category").choices)
+
+
+def scope(category=None, slug=None):
+    """Published posts of the feed selected by the URL kwargs."""
+    posts = BlogPost.objects.published()
+    if category is not None:
+        posts = posts.filter(category=category)
+    if slug is not None:
+        posts = posts.filter(tags__slug=slug)
+    return posts
+
+
+class BlogPostsFeed(Feed):
+    """RSS 2.0 feed; ``get_object`` returns ``(title suffix, scope kwargs, link)``."""
+
+    description = "Technology insights and company news from NexusSphere Solutions."
+
+    def get_object(self, request, category=None, slug=None):
+        if category is not None:
+            if category not in _CATEGORIES:
+                raise Http404("No such category.")
+            return _CATEGORIES[category], {"category": category}, f"{reverse('core:blog')}?category={category}"
+        if slug is not None:
+            tag = get_object_or_404(Tag, slug=slug)
+            return tag.name, {"slug": slug}, reverse("core:blog_tag", args=[slug])
+        return None, {}, reverse("core:blog")
+
+    def title(self, obj):
+        suffix, _, _ = obj
+        return f"NexusSphere Blog: {suffix}" if suffix else "NexusSphere Blog"
+
+    def link(self, obj):
+        return obj[2]
+
+    def items(self, obj):
+        return (
+            scope(**obj[1]).with_author()
+            .only(
+                "title", "slug", "plain_excerpt", "category", "published_date", "created_at", "updated_at",
+                "author__username", "author__first_name", "author__last_name",
+            )[:ITEMS]
+        )
+
+    def item_title(self, item):
+        return item.title
+
+    def item_description(self, item):
+        return item.plain_excerpt
+
+    def item_pubdate(self, item):
+        return item.published_date or item.created_at
+
+    def item_updateddate(self, item):
+        return item.updated_at
+
+    def item_author_name(self, item):
+        return item.author.get_full_name() or item.author.username
+
+    def item_categories(self, item):
+        return [_CATEGORIES[item.category]] if item.category else []
+
+
+class BlogPostsAtomFeed(BlogPostsFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description
+
+
+def feed_view(feed_class):
+    """View serving ``feed_class`` with conditional GET and a cached body."""
+    feed = feed_class()
+
+    def view(request, **kwargs):
+        latest, count = latest_change(scope(**kwargs))
+        if not count:
+            return feed(request, **kwargs)  # Unknown tag/category 404s; an empty feed is cheap.
+        url = f"{request.scheme}://{request.get_host()}{request.path}"
+        raw = f"{url}|{latest.isoformat()}|{count}|{model_version(BlogPost)}"
+        etag = quote_etag(hashlib.md5(raw.encode()).hexdigest())
+        timestamp = int(latest.timestamp())
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            key = f"feed:{etag}"
+            cached = cache.get(key)
+            metrics.cache_lookup("feed", cached is not None)
+            if cached is None:
+                response = feed(request, **kwargs)
+                cache.set(key, (response.content, response["Content-Type"]), settings.PAGE_CACHE_TIMEOUT)
+            else:
+                content, content_type = cached
+                response = HttpResponse(content, content_type=content_type)
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(timestamp)
+        patch_cache_control(response, public=True, max_age=settings.FEED_MAX_AGE)
+        return response
+
+    return view
@@ -0,0 +1,189 @@
+"""Responsive image derivatives for uploaded media and bundled static images.
+
+Every source image gets resized copies at ``WIDTHS`` (never upscaled) in WebP,
+AVIF when Pillow supports it, and a JPEG/PNG fallback. They are written under
+``IMAGE_DERIVATIVES_ROOT`` next to a small JSON manifest, and file names
+embed a signature of the source so browsers can cache them forever.
+
+Derivatives are produced when a model image is saved (see ``core.signals``)
+and by ``python manage.py process_images`` for existing media and the static
+images. Rendering never resizes anything: ``{% responsive_image %}`` (in
+``core.templatetags.responsive_images``) reads the manifest and falls back to
+the original file until derivatives exist.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.cache import cache
+from django.templatetags.static import static
+
+WIDTHS = (320, 640, 960, 1280)
+
+QUALITY = {"avif": 55, "webp": 80, "jpeg": 82}
+
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp", "jpeg": "image/jpeg", "png": "image/png"}
+
+EXTENSIONS = {"avif": "avif", "webp": "webp", "jpeg": "jpg", "png": "png"}
+
+# A missing manifest is re-checked after this many seconds, so derivatives
+# built by the management command in another process show up promptly.
+MISSING_TIMEOUT = 60
+
+
+class ImageSource:
+    """An image to derive from: an uploaded file (``media``) or a bundled static file."""
+
+    def __init__(self, kind, name, path, url):
+        self.kind = kind
+        self.name = name
+        self.path = path
+        self.url = url
+
+    @classmethod
+    def from_value(cls, value):
+        """Accept an ``ImageFieldFile`` or a static path such as ``"images/logo.png"``."""
+        if isinstance(value, str):
+            return cls("static", value, finders.find(value), static(value))
+        if not value:
+            return None
+        try:
+            path = value.path
+        except NotImplementedError:
+            path = None  # Remote storage; served as-is.
+        return cls("media", value.name, path, value.url)
+
+    def signature(self):
+        stat = os.stat(self.path)
+        raw = f"{self.name}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha1(raw.encode()).hexdigest()[:10]
+
+    @property
+    def cache_key(self):
+        return f"image:{self.kind}:{hashlib.md5(self.name.encode()).hexdigest()}"
+
+    @property
+    def manifest_path(self):
+        return derivatives_root() / self.kind / f"{self.name}.json"
+
+
+def derivatives_root():
+    return Path(settings.IMAGE_DERIVATIVES_ROOT)
+
+
+def formats():
+    """Derivative formats, best first; AVIF only when this Pillow can encode it."""
+    from PIL import features
+
+    return (["avif"] if features.check("avif") else []) + ["webp"]
+
+
+def target_widths(width):
+    widths = [w for w in WIDTHS if w < width]
+    widths.append(min(width, WIDTHS[-1]))
+    return widths
+
+
+def _save(image, path, image_format):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".derivative-")
+    options = {"optimize": True}
+    if image_format in QUALITY:
+        options["quality"] = QUALITY[image_format]
+    if image_format == "jpeg":
+        options["progressive"] = True
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            image.save(handle, format=image_format.upper(), **options)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def generate(source, force=False):
+    """Write the derivatives and manifest of ``source`` unless they are current.
+
+    Returns the manifest, or ``None`` when the source isn't a local file.
+    """
+    if source is None or not source.path or not os.path.exists(source.path):
+        return None
+    signature = source.signature()
+    if not force:
+        manifest = _read_manifest(source)
+        if manifest is not None and manifest["signature"] == signature:
+            cache.set(source.cache_key, manifest, None)
+            return manifest
+
+    from PIL import Image, ImageOps
+
+    with Image.open(source.path) as original:
+        image = ImageOps.exif_transpose(original)
+        has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        fallback = "png" if has_alpha else "jpeg"
+        width, height = image.size
+
+        stem = os.path.splitext(source.name)[0]
+        variants = {}
+        for image_format in formats() + [fallback]:
+            variants[image_format] = []
+            for target in target_widths(width):
+                resized = image if target == width else image.resize(
+                    (target, max(1, round(height * target / width))), Image.LANCZOS,
+                )
+                name = f"{source.kind}/{stem}-{signature}-{target}w.{EXTENSIONS[image_format]}"
+                _save(resized, derivatives_root() / name, image_format)
+                variants[image_format].append([target, name])
+
+    manifest = {
+        "signature": signature,
+        "width": width,
+        "height": height,
+        "fallback": fallback,
+        "variants": variants,
+    }
+    _prune(source, signature)
+    source.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    source.manifest_path.write_text(json.dumps(manifest))
+    cache.set(source.cache_key, manifest, None)
+    return manifest
+
+
+def _prune(source, signature):
+    """Remove derivatives left over from an earlier version of the source."""
+    stem = os.path.basename(os.path.splitext(source.name)[0])
+    folder = derivatives_root() / source.kind / os.path.dirname(source.name)
+    for old in folder.glob(f"{stem}-*w.*"):
+        parts = old.stem[len(stem) + 1:].split("-")
+        if len(parts) == 2 and parts[0] != signature:
+            old.unlink(missing_ok=True)
+
+
+def _read_manifest(source):
+    try:
+        return json.loads(source.manifest_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def manifest_for(source):
+    """Manifest of ``source`` if its derivatives have been generated, else ``None``."""
+    manifest = cache.get(source.cache_key)
+    if manifest is None:
+        manifest = _read_manifest(source) or {}
+        cache.set(source.cache_key, manifest, None if manifest else MISSING_TIMEOUT)
+    return manifest or None
+
+
+def variant_url(name):
+    return settings.IMAGE_DERIVATIVES_URL + name
+
+
+def srcset(entries):
+    return ", ".join(f"{variant_url(name)} {width}w" for width, name in entries)
@@ -0,0 +1,135 @@
+"""A small database-backed job queue.
+
+Request code calls ``enqueue("task.name", key=value)``; the row is written in
+the caller's transaction, so a job only becomes visible once the data it
+refers to has committed. ``python manage.py runworker`` claims ready jobs in
+batches and runs the functions registered with ``@task``. A failing job is
+retried with exponential backoff until ``max_attempts``, then left as
+``failed`` with its traceback for inspection in the admin.
+
+Claiming is a conditional ``UPDATE``, so several workers (or a worker and a
+cron-driven ``runworker --once``) can share the table without running a job
+twice. Jobs held by a worker that died are reclaimed after ``JOB_LOCK_TIMEOUT``.
+"""
+
+import logging
+import os
+import random
+import socket
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+
+
+def task(name, max_attempts=5):
+    """Register a function as the job ``name``. Payload items become keyword arguments."""
+    def decorator(func):
+        func.task_name = name
+        func.max_attempts = max_attempts
+        _registry[name] = func
+        return func
+    return decorator
+
+
+def enqueue(name, delay=0, unique=False, **payload):
+    """Queue a call of the task ``name``.
+
+    With ``unique=True`` nothing is added when an identical job is already
+    waiting, which coalesces bursts of "rebuild X" requests into one run.
+    """
+    if name not in _registry:
+        raise KeyError(f"Unknown task {name!r}")
+    if unique and Job.objects.filter(task=name, payload=payload, status=Job.QUEUED).exists():
+        return None
+    return Job.objects.create(
+        task=name,
+        payload=payload,
+        max_attempts=_registry[name].max_attempts,
+        run_after=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def backoff(attempts):
+    """Seconds to wait before retry number ``attempts`` (1-based): 30s, 60s, 120s, ... capped, with jitter."""
+    base = settings.JOB_RETRY_DELAY * 2 ** (attempts - 1)
+    return min(base, settings.JOB_RETRY_MAX_DELAY) * random.uniform(0.8, 1.2)
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def claim(batch_size, worker):
+    """Mark up to ``batch_size`` ready jobs as running for ``worker`` and return them."""
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT)
+    ready = Q(status=Job.QUEUED, run_after__lte=now) | Q(status=Job.RUNNING, locked_at__lt=stale)
+    ids = list(Job.objects.filter(ready).order_by("run_after", "id").values_list("id", flat=True)[:batch_size])
+    if not ids:
+        return []
+    # Re-checking the condition in the UPDATE keeps a competing worker from taking the same rows.
+    Job.objects.filter(ready, id__in=ids).update(status=Job.RUNNING, locked_by=worker, locked_at=now)
+    return list(Job.objects.filter(id__in=ids, status=Job.RUNNING, locked_by=worker, locked_at=now))
+
+
+def run(job):
+    """Run one claimed job and record the outcome."""
+    job.attempts += 1
+    func = _registry.get(job.task)
+    try:
+        if func is None:
+            raise KeyError(f"Unknown task {job.task!r}")
+        with transaction.atomic():
+            func(**job.payload)
+    except Exception:
+        job.last_error = traceback.format_exc()
+        if func is None or job.attempts >= job.max_attempts:
+            job.status = Job.FAILED
+            job.finished_at = timezone.now()
+            logger.error("Job %s failed permanently", job, exc_info=True)
+        else:
+            job.status = Job.QUEUED
+            job.run_after = timezone.now() + timedelta(seconds=backoff(job.attempts))
+            logger.warning("Job %s failed, retrying at %s", job, job.run_after, exc_info=True)
+    else:
+        job.status = Job.DONE
+        job.finished_at = timezone.now()
+        job.last_error = ""
+    job.locked_by = ""
+    job.locked_at = None
+    job.save(update_fields=[
+        "attempts", "status", "run_after", "last_error", "finished_at", "locked_by", "locked_at",
+    ])
+    return job.status == Job.DONE
+
+
+def run_pending(batch_size=20, worker=None, limit=None):
+    """Work through ready jobs batch by batch. Returns the number of jobs run."""
+    worker = worker or worker_name()
+    processed = 0
+    while limit is None or processed < limit:
+        size = batch_size if limit is None else min(batch_size, limit - processed)
+        jobs = claim(size, worker)
+        if not jobs:
+            break
+        for job in jobs:
+            run(job)
+        processed += len(jobs)
+    return processed
+
+
+def prune(older_than_days):
+    """Delete finished jobs older than ``older_than_days``; failed ones are kept."""
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    deleted, _ = Job.objects.filter(status=Job.DONE, finished_at__lt=cutoff).delete()
+    return deleted
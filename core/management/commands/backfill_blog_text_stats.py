@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from core.models import BlogPost
+
+
+class Command(BaseCommand):
+    help = "Recompute stored excerpt, word count and reading time for existing blog posts."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=500,
+            help="Number of posts written per UPDATE batch (default: 500).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        fields = ["plain_excerpt", "word_count", "reading_minutes"]
+        batch = []
+        total = 0
+
+        posts = BlogPost.objects.only("id", "content").order_by("pk")
+        for post in posts.iterator(chunk_size=batch_size):
+            post.refresh_text_stats()
+            batch.append(post)
+            if len(batch) >= batch_size:
+                BlogPost.objects.bulk_update(batch, fields)
+                total += len(batch)
+                batch = []
+        if batch:
+            BlogPost.objects.bulk_update(batch, fields)
+            total += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Updated text stats for {total} blog post(s)."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from core import brochure
+
+
+class Command(BaseCommand):
+    help = "Render the company brochure PDF for the current services and projects."
+
+    def handle(self, *args, **options):
+        path, digest = brochure.build()
+        self.stdout.write(self.style.SUCCESS(f"Brochure {digest} is at {path}."))
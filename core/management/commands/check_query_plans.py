@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core import query_plans
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN every registered list query and fail if any of them scans a whole table."
+
+    def handle(self, *args, **options):
+        failures = []
+        for name, build in query_plans.LIST_QUERIES.items():
+            queryset = build()
+            scans = query_plans.full_scans(queryset)
+            if options["verbosity"] > 1:
+                self.stdout.write(f"{name}:")
+                for line in query_plans.plan(queryset):
+                    self.stdout.write(f"    {line}")
+            if scans:
+                failures.append(name)
+                self.stderr.write(f"Full scan in {name!r}: {'; '.join(scans)}")
+
+        if failures:
+            raise CommandError(f"{len(failures)} list quer{'y' if len(failures) == 1 else 'ies'} without a usable index.")
+        self.stdout.write(self.style.SUCCESS(f"All {len(query_plans.LIST_QUERIES)} list queries use an index."))
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from core import images
+from core.models import BlogPost, PortfolioProject, TeamMember
+
+STATIC_IMAGES = [
+    "images/logo.png",
+    "images/nexus2.png",
+    "images/Geonexus.png",
+    "images/school.png",
+    "images/CRM.png",
+]
+
+
+class Command(BaseCommand):
+    help = "Generate responsive image derivatives for uploaded media and the bundled static images."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force", action="store_true",
+            help="Regenerate derivatives even if they are up to date.",
+        )
+
+    def handle(self, *args, **options):
+        values = list(STATIC_IMAGES)
+        for model in (TeamMember, PortfolioProject, BlogPost):
+            for record in model.objects.exclude(image="").exclude(image__isnull=True).only("image"):
+                values.append(record.image)
+
+        processed = 0
+        for value in values:
+            source = images.ImageSource.from_value(value)
+            if images.generate(source, force=options["force"]) is None:
+                self.stderr.write(f"Skipped {source.name}: no local file.")
+                continue
+            processed += 1
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} image(s)."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from core import related
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored related-content neighbours for every post and project."
+
+    def handle(self, *args, **options):
+        total = related.rebuild_all()
+        self.stdout.write(self.style.SUCCESS(f"Stored {total} related-content row(s)."))
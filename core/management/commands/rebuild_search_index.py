@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from core import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for blog posts and portfolio projects."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=500,
+            help="Number of rows inserted per batch (default: 500).",
+        )
+
+    def handle(self, *args, **options):
+        if not search.fts_available():
+            self.stdout.write("Full-text index is only used on SQLite; nothing to rebuild.")
+            return
+        total = search.rebuild_index(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} document(s)."))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from core.smtp_sink import SMTPSink
+
+
+class Command(BaseCommand):
+    help = "Run a local SMTP server that prints every message instead of delivering it."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=1025)
+
+    def handle(self, *args, **options):
+        def show(message):
+            self.stdout.write(
+                f"--- {message.sender} -> {', '.join(message.recipients)}\n"
+                f"Subject: {message['Subject']}\n\n{message.body}"
+            )
+
+        sink = SMTPSink(options["host"], options["port"], on_message=show)
+        self.stdout.write(
+            f"SMTP sink listening on {sink.host}:{sink.port}. Point DJANGO_EMAIL_BACKEND at "
+            f"django.core.mail.backends.smtp.EmailBackend with DJANGO_EMAIL_PORT={sink.port}."
+        )
+        try:
+            sink.serve_forever()
+        except KeyboardInterrupt:
+            pass
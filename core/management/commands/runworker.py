@@ -0,0 +1,59 @@
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core import jobs
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs (contact notifications, brochure rebuilds, ...)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=20,
+            help="Number of jobs claimed at a time (default: 20).",
+        )
+        parser.add_argument(
+            "--interval", type=float, default=2.0,
+            help="Seconds to sleep when the queue is empty (default: 2).",
+        )
+        parser.add_argument(
+            "--once", action="store_true",
+            help="Run the jobs that are ready now, then exit (e.g. from cron).",
+        )
+        parser.add_argument(
+            "--prune-days", type=int, default=7,
+            help="Delete finished jobs older than this many days on start-up (default: 7).",
+        )
+
+    def handle(self, *args, **options):
+        worker = jobs.worker_name()
+        pruned = jobs.prune(options["prune_days"])
+        if pruned:
+            self.stdout.write(f"Pruned {pruned} finished job(s).")
+
+        if options["once"]:
+            total = jobs.run_pending(options["batch_size"], worker)
+            self.stdout.write(self.style.SUCCESS(f"Ran {total} job(s)."))
+            return
+
+        stopping = False
+
+        def stop(signum, frame):
+            nonlocal stopping
+            stopping = True
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        self.stdout.write(f"Worker {worker} started.")
+        while not stopping:
+            close_old_connections()
+            # One batch per iteration so a stop request is honoured between batches.
+            total = jobs.run_pending(options["batch_size"], worker, limit=options["batch_size"])
+            if total:
+                self.stdout.write(f"Ran {total} job(s).")
+            else:
+                time.sleep(options["interval"])
+        self.stdout.write("Worker stopped.")
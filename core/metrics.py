@@ -0,0 +1,81 @@
+"""Prometheus metrics, scraped from ``/metrics``.
+
+``PerfMiddleware`` observes every request's latency and query count; the
+contact form, brochure view and the cache-aside helpers count their own
+events. Metrics are process-local unless ``PROMETHEUS_MULTIPROC_DIR`` names a
+directory: ``prometheus_client`` then keeps every metric in memory-mapped
+files there, and ``/metrics`` sums the files of all worker processes, so any
+gunicorn worker can answer the scrape with the totals of the whole server.
+The directory must exist and be emptied before the server starts (see
+``config/gunicorn.conf.py``); the files of exited workers are kept, so the
+counters never go backwards when gunicorn recycles a worker.
+"""
+
+import hmac
+import os
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_safe
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram, multiprocess
+from prometheus_client.exposition import choose_encoder
+
+REQUEST_LATENCY = Histogram(
+    "nexussphere_http_request_duration_seconds",
+    "Time spent serving a request, by URL name and response status.",
+    ["view", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+DB_QUERIES = Counter(
+    "nexussphere_db_queries",
+    "SQL statements run while serving requests, by URL name.",
+    ["view"],
+)
+CACHE_LOOKUPS = Counter(
+    "nexussphere_cache_lookups",
+    "Cache-aside lookups, by cache and result (hit or miss).",
+    ["cache", "result"],
+)
+CONTACT_SUBMISSIONS = Counter(
+    "nexussphere_contact_submissions",
+    "Contact-form posts, by screening outcome (see core.spam).",
+    ["outcome"],
+)
+BROCHURE_DOWNLOADS = Counter(
+    "nexussphere_brochure_downloads",
+    "Brochure PDFs sent in full (revalidations answered 304 are not counted).",
+)
+
+
+def observe_request(view_name, status, stats):
+    REQUEST_LATENCY.labels(view_name, str(status)).observe(stats.total)
+    DB_QUERIES.labels(view_name).inc(stats.queries)
+
+
+def cache_lookup(name, hit):
+    CACHE_LOOKUPS.labels(name, "hit" if hit else "miss").inc()
+
+
+def registry():
+    """Registry to scrape: the whole server's in multiprocess mode, else this process's."""
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+    collected = CollectorRegistry()
+    multiprocess.MultiProcessCollector(collected)
+    return collected
+
+
+def _authorized(request):
+    if not settings.METRICS_TOKEN:
+        return True
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    return hmac.compare_digest(supplied.encode(), settings.METRICS_TOKEN.encode())
+
+
+@require_safe
+def metrics_view(request):
+    """The metrics in the exposition format the scraper's ``Accept`` asks for (plain text by default)."""
+    if not _authorized(request):
+        return HttpResponseForbidden()
+    encoder, content_type = choose_encoder(request.headers.get("Accept", ""))
+    return HttpResponse(encoder(registry()), content_type=content_type)
@@ -0,0 +1,55 @@
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from . import metrics, perf, routers
+
+
+class PerfMiddleware:
+    """Measure each request's SQL, template and total time (see ``core.perf`` and ``core.metrics``)."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        perf.install_template_timing()
+
+    def __call__(self, request):
+        if not settings.PERF_ENABLED:
+            return self.get_response(request)
+        stats, token = perf.start()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(perf.record_query))
+                response = self.get_response(request)
+        finally:
+            perf.stop(token)
+        stats.finish()
+
+        match = getattr(request, "resolver_match", None)
+        view_name = match.view_name if match else "<unresolved>"
+        perf.record(view_name, request.method, response.status_code, stats)
+        metrics.observe_request(view_name, response.status_code, stats)
+        response["Server-Timing"] = stats.server_timing()
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    """Route the request's reads (see ``core.routers``) and pin writers to the primary."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = routers.RoutingState(routers.replica_for(request))
+        token = routers.activate(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            routers.deactivate(token)
+        if state.wrote and settings.DATABASE_REPLICAS:
+            response.set_cookie(
+                routers.STICKY_COOKIE, "1", max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True, samesite="Lax",
+            )
+        return response
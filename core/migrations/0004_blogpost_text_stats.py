@@ -0,0 +1,38 @@
+# Generated by Django 4.2.25 on 2026-10-18 11:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_contact_portfolioproject_service_teammember_blogpost'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='plain_excerpt',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='reading_minutes',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='portfolioproject',
+            name='expertise',
+            field=models.CharField(choices=[('web_apps', 'Web Applications'), ('enterprise_saas', 'Learning Management System'), ('mobile_apps', 'Mobile Applications'), ('geoscience', 'Geoscience Platforms'), ('school_mgmt', 'School Management Systems'), ('crm', 'CRM Solutions')], max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='service',
+            name='expertise',
+            field=models.CharField(choices=[('web_apps', 'Web Applications'), ('enterprise_saas', 'Learning Management System'), ('mobile_apps', 'Mobile Applications'), ('geoscience', 'Geoscience Platforms'), ('school_mgmt', 'School Management Systems'), ('crm', 'CRM Solutions')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    from core.search import create_index
+    create_index(schema_editor)
+
+
+def drop_search_index(apps, schema_editor):
+    from core.search import drop_index
+    drop_index(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_blogpost_text_stats"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
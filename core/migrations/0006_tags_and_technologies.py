@@ -0,0 +1,174 @@
+from django.db import migrations, models
+import django.db.models.deletion
+from django.utils.text import slugify
+
+
+# Frozen copies of core.models.term_slug/term_key, so later changes there can't alter this migration.
+def _slug(name):
+    for symbol, word in {"+": " plus ", "#": " sharp "}.items():
+        name = name.replace(symbol, word)
+    return slugify(name)
+
+
+def _key(name):
+    return " ".join(name.split()).casefold()
+
+
+def _terms(Model, value, cache):
+    """Map a comma-separated string to term rows, creating them on first sight.
+
+    ``cache`` maps case-folded names to rows; its ``None`` entry holds the
+    slugs handed out so far, so "C", "C++" and "C#" stay distinct terms and
+    names that don't transliterate get ``tag``/``tag-2``... instead of being
+    dropped.
+    """
+    taken = cache.setdefault(None, set())
+    terms = []
+    for part in (value or "").split(","):
+        name = " ".join(part.split())[:50].strip()
+        key = _key(name)
+        if not name or any(_key(term.name) == key for term in terms):
+            continue
+        if key not in cache:
+            base = _slug(name)[:56].strip("-") or Model._meta.model_name
+            slug, number = base, 1
+            while slug in taken:
+                number += 1
+                slug = f"{base}-{number}"
+            taken.add(slug)
+            cache[key] = Model.objects.create(name=name, slug=slug)
+        terms.append(cache[key])
+    return terms
+
+
+def split_comma_separated_fields(apps, schema_editor):
+    BlogPost = apps.get_model("core", "BlogPost")
+    BlogPostTag = apps.get_model("core", "BlogPostTag")
+    Tag = apps.get_model("core", "Tag")
+    PortfolioProject = apps.get_model("core", "PortfolioProject")
+    ProjectTechnology = apps.get_model("core", "ProjectTechnology")
+    Technology = apps.get_model("core", "Technology")
+
+    tags, links = {}, []
+    for post_id, value in BlogPost.objects.values_list("id", "tags").iterator():
+        links += [BlogPostTag(post_id=post_id, tag=tag) for tag in _terms(Tag, value, tags)]
+    BlogPostTag.objects.bulk_create(links, batch_size=500)
+
+    technologies, links = {}, []
+    for project_id, value in PortfolioProject.objects.values_list("id", "technologies").iterator():
+        links += [
+            ProjectTechnology(project_id=project_id, technology=technology)
+            for technology in _terms(Technology, value, technologies)
+        ]
+    ProjectTechnology.objects.bulk_create(links, batch_size=500)
+
+
+def join_comma_separated_fields(apps, schema_editor):
+    BlogPost = apps.get_model("core", "BlogPost")
+    BlogPostTag = apps.get_model("core", "BlogPostTag")
+    PortfolioProject = apps.get_model("core", "PortfolioProject")
+    ProjectTechnology = apps.get_model("core", "ProjectTechnology")
+
+    names = {}
+    for post_id, name in BlogPostTag.objects.values_list("post_id", "tag__name").order_by("id"):
+        names.setdefault(post_id, []).append(name)
+    for post_id, values in names.items():
+        BlogPost.objects.filter(pk=post_id).update(tags=", ".join(values)[:200])
+
+    names = {}
+    for project_id, name in ProjectTechnology.objects.values_list("project_id", "technology__name").order_by("id"):
+        names.setdefault(project_id, []).append(name)
+    for project_id, values in names.items():
+        PortfolioProject.objects.filter(pk=project_id).update(technologies=", ".join(values)[:300])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('slug', models.SlugField(max_length=60, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Technology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('slug', models.SlugField(max_length=60, unique=True)),
+            ],
+            options={
+                'verbose_name_plural': 'technologies',
+                'ordering': ['name'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectTechnology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('project', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='core.portfolioproject')),
+                ('technology', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='core.technology')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='BlogPostTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('post', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='core.blogpost')),
+                ('tag', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='core.tag')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='projecttechnology',
+            index=models.Index(fields=['technology', 'project'], name='core_projecttech_tech_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='projecttechnology',
+            constraint=models.UniqueConstraint(fields=('project', 'technology'), name='core_projecttech_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='blogposttag',
+            index=models.Index(fields=['tag', 'post'], name='core_blogposttag_tag_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='blogposttag',
+            constraint=models.UniqueConstraint(fields=('post', 'tag'), name='core_blogposttag_unique'),
+        ),
+        migrations.RunPython(split_comma_separated_fields, join_comma_separated_fields),
+        # Lets the reverse migration re-add the column on tables that already have rows.
+        migrations.AlterField(
+            model_name='portfolioproject',
+            name='technologies',
+            field=models.CharField(blank=True, help_text='Comma-separated technologies', max_length=300),
+        ),
+        migrations.RemoveField(
+            model_name='blogpost',
+            name='tags',
+        ),
+        migrations.RemoveField(
+            model_name='portfolioproject',
+            name='technologies',
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='tags',
+            field=models.ManyToManyField(blank=True, related_name='posts', through='core.BlogPostTag', to='core.tag'),
+        ),
+        migrations.AddField(
+            model_name='portfolioproject',
+            name='technologies',
+            field=models.ManyToManyField(blank=True, related_name='projects', through='core.ProjectTechnology', to='core.technology'),
+        ),
+    ]
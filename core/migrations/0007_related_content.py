@@ -0,0 +1,30 @@
+# Generated by Django 4.2.25 on 2026-10-18 11:11
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_tags_and_technologies'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedContent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_kind', models.CharField(choices=[('post', 'Blog post'), ('project', 'Portfolio project')], max_length=10)),
+                ('source_id', models.PositiveBigIntegerField()),
+                ('score', models.FloatField()),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('post', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.blogpost')),
+                ('project', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.portfolioproject')),
+            ],
+            options={
+                'ordering': ['source_kind', 'source_id', 'rank'],
+                'indexes': [models.Index(fields=['source_kind', 'source_id', 'rank'], name='core_related_source_idx')],
+            },
+        ),
+    ]
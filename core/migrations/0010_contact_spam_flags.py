@@ -0,0 +1,23 @@
+# Generated by Django 4.2.25 on 2026-10-18 11:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='quarantined',
+            field=models.BooleanField(default=False, help_text='Held back by the spam filter; no emails were sent'),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='spam_score',
+            field=models.FloatField(default=0),
+        ),
+    ]
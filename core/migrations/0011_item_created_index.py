@@ -0,0 +1,17 @@
+# Generated by Django 4.2.25 on 2026-10-18 11:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_contact_spam_flags'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['created_at', 'id'], name='core_item_created_idx'),
+        ),
+    ]
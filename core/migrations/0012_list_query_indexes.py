@@ -0,0 +1,49 @@
+# Generated by Django 4.2.25 on 2026-10-18 11:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_item_created_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(condition=models.Q(('published', True)), fields=['-published_date', '-created_at'], name='core_blog_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(condition=models.Q(('published', True)), fields=['category', '-published_date', '-created_at'], name='core_blog_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['-created_at'], name='core_contact_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='portfolioproject',
+            index=models.Index(fields=['-completion_date', '-created_at'], name='core_portfolio_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='portfolioproject',
+            index=models.Index(fields=['expertise', '-completion_date', '-created_at'], name='core_portfolio_expertise_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='portfolioproject',
+            index=models.Index(condition=models.Q(('featured', True)), fields=['-completion_date', '-created_at'], name='core_portfolio_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['order', 'title'], name='core_service_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['expertise', 'order', 'title'], name='core_service_expertise_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teammember',
+            index=models.Index(fields=['order', 'name'], name='core_team_order_idx'),
+        ),
+    ]
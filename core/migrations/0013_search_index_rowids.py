@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+def rekey_search_index(apps, schema_editor):
+    from core.search import rekey_index
+    rekey_index(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0012_list_query_indexes"),
+    ]
+
+    operations = [
+        # The previous code finds rows by kind/object_id, so re-keyed rows need no reverse step.
+        migrations.RunPython(rekey_search_index, migrations.RunPython.noop),
+    ]
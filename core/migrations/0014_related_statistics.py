@@ -0,0 +1,49 @@
+# Generated by Django 4.2.25 on 2026-10-18 12:24
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_search_index_rowids'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_kind', models.CharField(choices=[('post', 'Blog post'), ('project', 'Portfolio project')], max_length=10)),
+                ('source_id', models.PositiveBigIntegerField()),
+                ('group', models.CharField(blank=True, max_length=60)),
+                ('terms', models.JSONField(default=list)),
+                ('norm', models.FloatField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RelatedTerm',
+            fields=[
+                ('token', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('documents', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RelatedPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=64)),
+                ('count', models.PositiveIntegerField()),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='postings', to='core.relateddocument')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='relateddocument',
+            constraint=models.UniqueConstraint(fields=('source_kind', 'source_id'), name='core_relateddoc_source_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='relatedposting',
+            index=models.Index(fields=['token', 'document'], name='core_relatedposting_token_idx'),
+        ),
+    ]
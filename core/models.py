@@ -1,5 +1,9 @@
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
+from django.utils.html import strip_tags
+from django.utils.text import Truncator, slugify
+from django.urls import reverse
 
 
 # Contact model for lead capture
@@ -10,6 +14,14 @@ class Contact(models.Model):
     company = models.CharField(max_length=200, blank=True)
     message = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    spam_score = models.FloatField(default=0)
+    quarantined = models.BooleanField(default=False, help_text="Held back by the spam filter; no emails were sent")
+
+    class Meta:
+        indexes = [
+            # Admin changelist (newest first) and ``/api/contacts/export/?since=``.
+            models.Index(fields=["-created_at"], name="core_contact_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.email}"
@@ -26,9 +38,13 @@ class TeamMember(models.Model):
     linkedin = models.URLField(blank=True)
     github = models.URLField(blank=True)
     order = models.PositiveIntegerField(default=0)  # for ordering
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['order', 'name']
+        indexes = [
+            models.Index(fields=["order", "name"], name="core_team_order_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -53,14 +69,105 @@ class Service(models.Model):
     features = models.JSONField(default=list, help_text="List of key features")
     price_range = models.CharField(max_length=50, blank=True, help_text="e.g. $10k-$50k")
     order = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['order', 'title']
+        indexes = [
+            models.Index(fields=["order", "title"], name="core_service_order_idx"),
+            # ``/services/?type=`` and ``/api/services/?expertise=``.
+            models.Index(fields=["expertise", "order", "title"], name="core_service_expertise_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
 
+# Normalized tag/technology lookups
+# Symbols that tell technologies apart ("C", "C++", "C#") but that slugify drops.
+_SLUG_SYMBOLS = {"+": " plus ", "#": " sharp "}
+
+
+def term_slug(name):
+    """ASCII slug for a term name; empty when nothing in it transliterates."""
+    for symbol, word in _SLUG_SYMBOLS.items():
+        name = name.replace(symbol, word)
+    return slugify(name)
+
+
+def term_key(name):
+    """What makes two term names the same term: case and inner whitespace are ignored."""
+    return " ".join(name.split()).casefold()
+
+
+class TaxonomyTerm(models.Model):
+    """Shared fields for tag-like lookup tables."""
+    name = models.CharField(max_length=50, unique=True)
+    slug = models.SlugField(max_length=60, unique=True)
+
+    class Meta:
+        abstract = True
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        if not self.slug:
+            self.slug = self.unique_slug(self.name)
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def unique_slug(cls, name):
+        """``term_slug(name)``, suffixed ``-2``, ``-3``... past slugs already taken.
+
+        Names with nothing to transliterate (e.g. non-Latin scripts) get the
+        model name as a base, so they're never left without a slug.
+        """
+        max_length = cls._meta.get_field("slug").max_length
+        base = term_slug(name)[:max_length - 4].strip("-") or cls._meta.model_name
+        taken = set(cls.objects.filter(slug__startswith=base).values_list("slug", flat=True))
+        slug, number = base, 1
+        while slug in taken:
+            number += 1
+            slug = f"{base}-{number}"
+        return slug
+
+    @classmethod
+    def from_string(cls, value):
+        """Get or create terms for a comma-separated string, e.g. ``"Django, React"``.
+
+        Names are matched case-insensitively, so "django" reuses "Django".
+        """
+        max_length = cls._meta.get_field("name").max_length
+        names = {}
+        for part in value.split(","):
+            name = " ".join(part.split())[:max_length].strip()
+            if name:
+                names.setdefault(term_key(name), name)
+        if not names:
+            return []
+        lookup = models.Q()
+        for name in names.values():
+            lookup |= models.Q(name__iexact=name)
+        existing = {term_key(term.name): term for term in cls.objects.filter(lookup)}
+        return [
+            existing.get(key) or cls.objects.create(name=name, slug=cls.unique_slug(name))
+            for key, name in names.items()
+        ]
+
+
+class Technology(TaxonomyTerm):
+    """Technology used on a portfolio project."""
+
+    class Meta(TaxonomyTerm.Meta):
+        verbose_name_plural = "technologies"
+
+
+class Tag(TaxonomyTerm):
+    """Blog post tag."""
+
+
 # Portfolio model for project showcase
 class PortfolioProject(models.Model):
     """Model for portfolio projects."""
@@ -77,21 +184,50 @@ class PortfolioProject(models.Model):
     client = models.CharField(max_length=200, blank=True)
     description = models.TextField()
     expertise = models.CharField(max_length=20, choices=EXPERTISE_CHOICES)
-    technologies = models.CharField(max_length=300, help_text="Comma-separated technologies")
+    technologies = models.ManyToManyField(
+        Technology, through="ProjectTechnology", related_name="projects", blank=True,
+    )
     image = models.ImageField(upload_to='portfolio/', blank=True, null=True)
     live_url = models.URLField(blank=True, help_text="Live project URL")
     github_url = models.URLField(blank=True, help_text="GitHub repository URL")
     featured = models.BooleanField(default=False)
     completion_date = models.DateField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-completion_date', '-created_at']
+        indexes = [
+            models.Index(fields=["-completion_date", "-created_at"], name="core_portfolio_list_idx"),
+            # ``/portfolio/?expertise=``.
+            models.Index(
+                fields=["expertise", "-completion_date", "-created_at"], name="core_portfolio_expertise_idx",
+            ),
+            # Home page; only a handful of projects are featured, so keep the index to those rows.
+            models.Index(
+                fields=["-completion_date", "-created_at"], name="core_portfolio_featured_idx",
+                condition=models.Q(featured=True),
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
 
+class BlogPostQuerySet(models.QuerySet):
+    """Query helpers shared by the blog views, feeds and sitemap."""
+
+    def published(self):
+        return self.filter(published=True)
+
+    def with_author(self):
+        return self.select_related("author")
+
+    def for_listing(self):
+        """Rows for blog cards: author joined, tags prefetched, ``content`` left in the database."""
+        return self.with_author().prefetch_related("tags").defer("content")
+
+
 # Blog/News model
 class BlogPost(models.Model):
     """Model for blog posts and news."""
@@ -109,17 +245,204 @@ class BlogPost(models.Model):
                                ])
     published = models.BooleanField(default=False)
     published_date = models.DateTimeField(blank=True, null=True)
-    tags = models.CharField(max_length=200, blank=True, help_text="Comma-separated tags")
+    tags = models.ManyToManyField(Tag, through="BlogPostTag", related_name="posts", blank=True)
     image = models.ImageField(upload_to='blog/', blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Derived from ``content`` on save so list pages never parse the HTML body.
+    plain_excerpt = models.TextField(blank=True, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_minutes = models.PositiveIntegerField(default=1, editable=False)
+
+    EXCERPT_WORDS = 30
+    WORDS_PER_MINUTE = 200
+
+    objects = BlogPostQuerySet.as_manager()
+
     class Meta:
         ordering = ['-published_date', '-created_at']
+        # Every public listing filters on ``published``; drafts stay out of these indexes.
+        indexes = [
+            models.Index(
+                fields=["-published_date", "-created_at"], name="core_blog_published_idx",
+                condition=models.Q(published=True),
+            ),
+            models.Index(
+                fields=["category", "-published_date", "-created_at"], name="core_blog_category_idx",
+                condition=models.Q(published=True),
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
+    def get_absolute_url(self):
+        return reverse("core:blog_detail", kwargs={"slug": self.slug})
+
+    def refresh_text_stats(self):
+        """Recompute ``plain_excerpt``, ``word_count`` and ``reading_minutes`` from ``content``."""
+        text = " ".join(strip_tags(self.content).split())
+        self.word_count = len(text.split())
+        self.reading_minutes = max(1, -(-self.word_count // self.WORDS_PER_MINUTE))
+        self.plain_excerpt = Truncator(text).words(self.EXCERPT_WORDS)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "content" in update_fields:
+            self.refresh_text_stats()
+            if update_fields is not None:
+                kwargs["update_fields"] = set(update_fields) | {
+                    "plain_excerpt", "word_count", "reading_minutes",
+                }
+        super().save(*args, **kwargs)
+
+
+# Through tables: the unique constraint serves lookups by owner, the extra
+# index serves "all posts/projects for this tag/technology" listings.
+class ProjectTechnology(models.Model):
+    project = models.ForeignKey(PortfolioProject, on_delete=models.CASCADE, db_index=False)
+    technology = models.ForeignKey(Technology, on_delete=models.CASCADE, db_index=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["project", "technology"], name="core_projecttech_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["technology", "project"], name="core_projecttech_tech_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.project} - {self.technology}"
+
+
+class BlogPostTag(models.Model):
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, db_index=False)
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, db_index=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["post", "tag"], name="core_blogposttag_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["tag", "post"], name="core_blogposttag_tag_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.post} - {self.tag}"
+
+
+# Precomputed "related content" neighbours, maintained by core.related
+class RelatedContent(models.Model):
+    """One ranked neighbour of a blog post or portfolio project."""
+    SOURCE_POST = "post"
+    SOURCE_PROJECT = "project"
+    SOURCE_CHOICES = [
+        (SOURCE_POST, "Blog post"),
+        (SOURCE_PROJECT, "Portfolio project"),
+    ]
+
+    source_kind = models.CharField(max_length=10, choices=SOURCE_CHOICES)
+    source_id = models.PositiveBigIntegerField()
+    # Exactly one of the two targets is set.
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, null=True, blank=True, related_name="+")
+    project = models.ForeignKey(
+        PortfolioProject, on_delete=models.CASCADE, null=True, blank=True, related_name="+",
+    )
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+
+    class Meta:
+        ordering = ['source_kind', 'source_id', 'rank']
+        indexes = [
+            models.Index(fields=["source_kind", "source_id", "rank"], name="core_related_source_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.source_kind}:{self.source_id} -> {self.target}"
+
+    @property
+    def target(self):
+        return self.post if self.post_id else self.project
+
+
+class RelatedDocument(models.Model):
+    """Stored text statistics of a post or project (see core.related)."""
+    source_kind = models.CharField(max_length=10, choices=RelatedContent.SOURCE_CHOICES)
+    source_id = models.PositiveBigIntegerField()
+    group = models.CharField(max_length=60, blank=True)
+    terms = models.JSONField(default=list)
+    # Length of the TF-IDF vector under the document frequencies it was stored with.
+    norm = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["source_kind", "source_id"], name="core_relateddoc_source_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.source_kind}:{self.source_id}"
+
+
+class RelatedPosting(models.Model):
+    """How often a token occurs in a document; tag/technology slugs are stored as ``#slug``."""
+    document = models.ForeignKey(RelatedDocument, on_delete=models.CASCADE, related_name="postings")
+    token = models.CharField(max_length=64)
+    count = models.PositiveIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["token", "document"], name="core_relatedposting_token_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.token} x{self.count}"
+
+
+class RelatedTerm(models.Model):
+    """Number of stored documents containing a token."""
+    token = models.CharField(max_length=64, primary_key=True)
+    documents = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return self.token
+
+
+# Background jobs, run by ``manage.py runworker`` (see core.jobs)
+class Job(models.Model):
+    """A queued call of a registered task."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+    ]
+
+    task = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['run_after', 'id']
+        indexes = [
+            models.Index(fields=["status", "run_after"], name="core_job_ready_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.status})"
+
 
 class Item(models.Model):
 	"""Legacy demo model - can be removed once other models are fully implemented."""
@@ -135,5 +458,11 @@ class Item(models.Model):
 		blank=True,
 	)
 
+	class Meta:
+		indexes = [
+			# Keyset pagination of the items API walks (created_at, id).
+			models.Index(fields=["created_at", "id"], name="core_item_created_idx"),
+		]
+
 	def __str__(self):
 		return self.name
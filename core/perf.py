@@ -0,0 +1,173 @@
+"""Per-request performance instrumentation.
+
+``PerfMiddleware`` (``core.middleware``) opens a ``RequestStats`` for every
+request. A ``connection.execute_wrapper`` hook counts and times each SQL
+statement, and a wrapper around ``Template.render`` times template
+rendering, including any queries that lazy querysets run from the template.
+At the end of the request the figures are:
+
+* sent back in a ``Server-Timing`` header, which browser dev tools display;
+* logged as one ``key=value`` line on the ``core.perf`` logger, with a
+  warning when one SELECT ran ``PERF_REPEATED_QUERY_THRESHOLD`` times or
+  more, the usual sign of an N+1 query;
+* kept per URL name (``core:blog``, ``api:item-list``) in a rolling window
+  of ``PERF_WINDOW`` requests, summarised with percentiles on ``/__perf__/``.
+
+The rolling window lives in the worker process's memory, so each worker
+reports its own traffic.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.template import base as template_base
+
+logger = logging.getLogger(__name__)
+
+_current = ContextVar("core.perf.stats", default=None)
+
+
+class RequestStats:
+    """Counters for the request being served."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.total = 0.0
+        self.queries = 0
+        self.sql_time = 0.0
+        self.template_time = 0.0
+        self.statements = Counter()
+        self._template_depth = 0
+
+    def finish(self):
+        self.total = time.perf_counter() - self.started
+
+    def repeated_statements(self):
+        """``{sql: executions}`` for statements that ran suspiciously often."""
+        threshold = settings.PERF_REPEATED_QUERY_THRESHOLD
+        return {sql: count for sql, count in self.statements.items() if count >= threshold}
+
+    def server_timing(self):
+        return ", ".join([
+            f'db;dur={self.sql_time * 1000:.1f};desc="{self.queries} queries"',
+            f"tpl;dur={self.template_time * 1000:.1f}",
+            f"total;dur={self.total * 1000:.1f}",
+        ])
+
+
+def start():
+    stats = RequestStats()
+    return stats, _current.set(stats)
+
+
+def stop(token):
+    _current.reset(token)
+
+
+def record_query(execute, sql, params, many, context):
+    """``execute_wrapper`` hook; a no-op outside an instrumented request."""
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.sql_time += time.perf_counter() - started
+        stats.queries += 1
+        # Batched writes (bulk_create) legitimately repeat; N+1 patterns are reads.
+        if sql.lstrip()[:6].upper() == "SELECT":
+            stats.statements[sql] += 1
+
+
+def _timed_render(render):
+    @wraps(render)
+    def wrapper(self, context):
+        stats = _current.get()
+        if stats is None:
+            return render(self, context)
+        # Includes and extends render nested templates; time the outermost only.
+        stats._template_depth += 1
+        started = time.perf_counter()
+        try:
+            return render(self, context)
+        finally:
+            stats._template_depth -= 1
+            if not stats._template_depth:
+                stats.template_time += time.perf_counter() - started
+
+    wrapper.perf_timed = True
+    return wrapper
+
+
+def install_template_timing():
+    if not getattr(template_base.Template.render, "perf_timed", False):
+        template_base.Template.render = _timed_render(template_base.Template.render)
+
+
+# Rolling per-view samples
+_samples = defaultdict(deque)
+_lock = threading.Lock()
+
+
+def record(view_name, method, status, stats):
+    """Log ``stats`` and add them to ``view_name``'s rolling window."""
+    repeated = stats.repeated_statements()
+    logger.info(
+        "view=%s method=%s status=%s total_ms=%.1f queries=%d sql_ms=%.1f template_ms=%.1f repeated=%d",
+        view_name, method, status, stats.total * 1000, stats.queries, stats.sql_time * 1000,
+        stats.template_time * 1000, len(repeated),
+        extra={"perf": {
+            "view": view_name, "method": method, "status": status, "total_ms": stats.total * 1000,
+            "queries": stats.queries, "sql_ms": stats.sql_time * 1000, "template_ms": stats.template_time * 1000,
+        }},
+    )
+    for sql, count in repeated.items():
+        logger.warning("Repeated query in %s (%d times, possible N+1): %s", view_name, count, sql[:300])
+
+    with _lock:
+        window = _samples[view_name]
+        window.append((stats.total, stats.queries, stats.sql_time, stats.template_time, bool(repeated)))
+        while len(window) > settings.PERF_WINDOW:
+            window.popleft()
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a sorted list."""
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(pct / 100 * len(values)) - 1)]
+
+
+def summary():
+    """Per-view figures over the rolling window, slowest p95 first. Times in ms."""
+    with _lock:
+        windows = {view: list(window) for view, window in _samples.items()}
+    rows = []
+    for view, samples in windows.items():
+        totals = sorted(sample[0] * 1000 for sample in samples)
+        queries = [sample[1] for sample in samples]
+        rows.append({
+            "view": view,
+            "requests": len(samples),
+            "p50": percentile(totals, 50),
+            "p95": percentile(totals, 95),
+            "p99": percentile(totals, 99),
+            "avg_queries": sum(queries) / len(samples),
+            "max_queries": max(queries),
+            "avg_sql_ms": sum(sample[2] for sample in samples) * 1000 / len(samples),
+            "avg_template_ms": sum(sample[3] for sample in samples) * 1000 / len(samples),
+            "repeated": sum(sample[4] for sample in samples),
+        })
+    return sorted(rows, key=lambda row: row["p95"], reverse=True)
+
+
+def reset():
+    with _lock:
+        _samples.clear()
@@ -0,0 +1,71 @@
+"""Query-plan checks for the list queries behind the site and the API.
+
+``LIST_QUERIES`` reproduces the filters, ordering and page size of every list
+page and list endpoint. ``full_scans`` runs one through ``EXPLAIN QUERY PLAN``
+(SQLite) or ``EXPLAIN`` (PostgreSQL) and returns the plan lines that read a
+whole table; the ``check_query_plans`` command fails if any query has one.
+Register new list views here together with the index that serves them.
+"""
+
+import re
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import BlogPost, Contact, Item, Job, PortfolioProject, Service, TeamMember
+
+# A filter value that stands in for "some row"; only the plan shape matters.
+_SAMPLE_ID = 1
+_SAMPLE_EXPERTISE = Service.EXPERTISE_CHOICES[0][0]
+
+
+def _item_cursor_page():
+    # Second page of ``KeysetCursorPagination`` on ``/api/items/``.
+    now = timezone.now()
+    before = Q(created_at__lt=now) | Q(id__lt=_SAMPLE_ID)
+    return Item.objects.filter(before, created_at__lte=now).order_by("-created_at", "-id")[:51]
+
+
+LIST_QUERIES = {
+    "home: featured projects": lambda: PortfolioProject.objects.filter(featured=True)[:3],
+    "services": lambda: Service.objects.all(),
+    "services: by expertise": lambda: Service.objects.filter(expertise=_SAMPLE_EXPERTISE),
+    "team": lambda: TeamMember.objects.all(),
+    "portfolio": lambda: PortfolioProject.objects.all()[:12],
+    "portfolio: by expertise": lambda: PortfolioProject.objects.filter(expertise=_SAMPLE_EXPERTISE)[:12],
+    "portfolio: by technology": lambda: PortfolioProject.objects.filter(technologies=_SAMPLE_ID)[:12],
+    "blog": lambda: BlogPost.objects.published().for_listing()[:10],
+    "blog: by category": lambda: BlogPost.objects.published().for_listing().filter(category="news")[:10],
+    "blog: by tag": lambda: BlogPost.objects.published().for_listing().filter(tags=_SAMPLE_ID)[:10],
+    "api items": lambda: Item.objects.order_by("-created_at", "-id")[:51],
+    "api items: next page": _item_cursor_page,
+    "admin contacts": lambda: Contact.objects.order_by("-created_at")[:100],
+    "contacts export: since": lambda: (
+        Contact.objects.filter(created_at__gte=timezone.now()).order_by("created_at", "pk")
+    ),
+    "jobs: ready": lambda: Job.objects.filter(status=Job.QUEUED, run_after__lte=timezone.now())[:20],
+}
+
+# ``SCAN core_service`` is a full table scan; ``SCAN core_service USING INDEX ...``
+# walks an index in order and stops at the LIMIT.
+_SQLITE_SCAN_RE = re.compile(r"\bSCAN (?:TABLE )?(\w+)(?!.*\bUSING\b)")
+_POSTGRES_SCAN_RE = re.compile(r"\bSeq Scan on (\w+)")
+
+
+def plan(queryset):
+    """The database's plan for ``queryset`` as a list of lines."""
+    if connection.vendor != "postgresql":
+        return queryset.explain().splitlines()
+    # Small tables make a sequential scan the cheapest plan whatever the
+    # indexes; discourage it so the plan shows whether an index *can* serve the query.
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain().splitlines()
+
+
+def full_scans(queryset):
+    """Lines of ``queryset``'s plan that scan a whole table."""
+    pattern = _POSTGRES_SCAN_RE if connection.vendor == "postgresql" else _SQLITE_SCAN_RE
+    return [line for line in plan(queryset) if pattern.search(line)]
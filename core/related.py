@@ -0,0 +1,412 @@
+"""Related-content engine for blog posts and portfolio projects.
+
+Every published post and every project is scored against the others by:
+
+* TF-IDF cosine similarity of their text,
+* overlap (Jaccard) of tag/technology slugs, which share one namespace so a
+  post tagged ``django`` can point at a project built with Django,
+* a flat bonus for sharing a blog category (posts) or expertise (projects).
+
+The top ``LIMIT`` neighbours of each item are stored in ``RelatedContent`` so
+``blog_detail_view`` reads them with a single indexed query. ``rebuild_all``
+recomputes everything in memory (see the ``rebuild_related_content`` command)
+and stores each item's token counts (``RelatedDocument``/``RelatedPosting``)
+and the corpus-wide document frequencies (``RelatedTerm``). ``refresh_for``
+then updates one item from those tables: it swaps the item's statistics, scores
+only the candidates that share its strongest tokens or terms, and merges it
+into their lists. The signal handlers in ``core.signals`` queue it as the
+``related.refresh`` job after each committed save.
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils.html import strip_tags
+
+from .cache import bump_model_version
+from .models import BlogPost, PortfolioProject, RelatedContent, RelatedDocument, RelatedPosting, RelatedTerm
+
+LIMIT = 6
+
+TEXT_WEIGHT = 0.6
+TERM_WEIGHT = 0.3
+CATEGORY_WEIGHT = 0.1
+
+# Only the strongest terms of each document are used to find candidates, and
+# only the candidates sharing the most of them (plus tags) are scored; this
+# keeps a refresh bounded instead of all-pairs.
+QUERY_TERMS = 25
+MAX_CANDIDATES = 500
+
+# Tag/technology slugs are stored alongside text tokens under this prefix,
+# which the token pattern can never produce.
+TERM_PREFIX = "#"
+MAX_TOKEN_LENGTH = 64
+
+_TOKEN_RE = re.compile(r"[a-z0-9]{3,}")
+_STOP_WORDS = frozenset(
+    "the and for are but not you all any can had her was one our out has have "
+    "with this that from they will would there their what about which when "
+    "your into than then them these some could other more also its just been "
+    "were how who".split()
+)
+
+POST = RelatedContent.SOURCE_POST
+PROJECT = RelatedContent.SOURCE_PROJECT
+
+
+def _count_tokens(text):
+    return Counter(
+        token for token in _TOKEN_RE.findall(text.lower())
+        if token not in _STOP_WORDS and len(token) <= MAX_TOKEN_LENGTH
+    )
+
+
+def _idf(documents, total):
+    return math.log((total + 1) / (documents + 1)) + 1
+
+
+class Document:
+    __slots__ = ("key", "group", "terms", "counts", "vector")
+
+    def __init__(self, key, group, terms, counts):
+        self.key = key
+        self.group = group
+        self.terms = terms
+        self.counts = counts
+        self.vector = {}
+
+    def weigh(self, doc_freqs, total):
+        """Set ``vector`` to the normalised TF-IDF weights and return their norm."""
+        weights = {
+            token: (1 + math.log(count)) * _idf(doc_freqs.get(token, 0), total)
+            for token, count in self.counts.items()
+        }
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        self.vector = {token: w / norm for token, w in weights.items()}
+        return norm
+
+    def probes(self):
+        """Postings that lead to candidates: the strongest tokens and every term."""
+        strongest = sorted(self.vector.items(), key=lambda item: (-item[1], item[0]))[:QUERY_TERMS]
+        return [token for token, _ in strongest] + [TERM_PREFIX + term for term in sorted(self.terms)]
+
+
+def _post_document(post):
+    text = " ".join([post.title, post.title, post.excerpt, strip_tags(post.content)])
+    group = f"category:{post.category}" if post.category else None
+    return Document((POST, post.pk), group, {tag.slug for tag in post.tags.all()}, _count_tokens(text))
+
+
+def _project_document(project):
+    text = " ".join([project.title, project.title, project.client, project.description])
+    group = f"expertise:{project.expertise}"
+    terms = {technology.slug for technology in project.technologies.all()}
+    return Document((PROJECT, project.pk), group, terms, _count_tokens(text))
+
+
+def load_corpus():
+    posts = BlogPost.objects.published().prefetch_related("tags").order_by("pk")
+    projects = PortfolioProject.objects.prefetch_related("technologies").order_by("pk")
+    documents = [_post_document(post) for post in posts.iterator(chunk_size=500)]
+    documents += [_project_document(project) for project in projects.iterator(chunk_size=500)]
+    return Corpus(documents)
+
+
+def score(a, b):
+    """Symmetric similarity of two weighed documents."""
+    if len(a.vector) > len(b.vector):
+        a, b = b, a
+    text = sum(weight * b.vector.get(token, 0.0) for token, weight in a.vector.items())
+    union = a.terms | b.terms
+    terms = len(a.terms & b.terms) / len(union) if union else 0.0
+    category = 1.0 if a.group and a.group == b.group else 0.0
+    return TEXT_WEIGHT * text + TERM_WEIGHT * terms + CATEGORY_WEIGHT * category
+
+
+def _ranked(scored, limit=None):
+    scored = [item for item in scored if item[0] > 0]
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return scored[:limit]
+
+
+class Corpus:
+    """TF-IDF weighted documents plus an inverted index over their tokens and terms."""
+
+    def __init__(self, documents):
+        self.documents = {doc.key: doc for doc in documents}
+        self.doc_freqs = Counter()
+        for doc in documents:
+            self.doc_freqs.update(doc.counts.keys())
+        total = len(documents)
+        self.norms = {}
+        self.postings = defaultdict(list)
+        for doc in documents:
+            self.norms[doc.key] = doc.weigh(self.doc_freqs, total)
+            for token in doc.vector:
+                self.postings[token].append(doc.key)
+            for term in doc.terms:
+                self.postings[TERM_PREFIX + term].append(doc.key)
+
+    def __contains__(self, key):
+        return key in self.documents
+
+    def candidates(self, doc):
+        shared = Counter()
+        for probe in doc.probes():
+            shared.update(self.postings.get(probe, ()))
+        shared.pop(doc.key, None)
+        return [key for key, _ in sorted(shared.items(), key=lambda item: (-item[1], item[0]))[:MAX_CANDIDATES]]
+
+    def neighbours(self, key, limit=LIMIT):
+        doc = self.documents[key]
+        return _ranked([(score(doc, self.documents[other]), other) for other in self.candidates(doc)], limit)
+
+
+def _rows(source, neighbours):
+    kind, source_id = source
+    rows = []
+    for rank, (score, (target_kind, target_id)) in enumerate(neighbours, start=1):
+        row = RelatedContent(source_kind=kind, source_id=source_id, score=score, rank=rank)
+        if target_kind == POST:
+            row.post_id = target_id
+        else:
+            row.project_id = target_id
+        rows.append(row)
+    return rows
+
+
+def _source_filter(keys):
+    by_kind = defaultdict(list)
+    for kind, pk in keys:
+        by_kind[kind].append(pk)
+    condition = Q(pk__in=[])
+    for kind, pks in by_kind.items():
+        condition |= Q(source_kind=kind, source_id__in=pks)
+    return condition
+
+
+def _replace_lists(lists):
+    """Store ``{source: [(score, target), ...]}`` in place of those sources' current lists."""
+    rows = []
+    for source, neighbours in lists.items():
+        rows += _rows(source, neighbours)
+    RelatedContent.objects.filter(_source_filter(lists)).delete()
+    RelatedContent.objects.bulk_create(rows, batch_size=500)
+    _changed()
+
+
+def _changed():
+    # Pages showing stored lists (the blog sidebar) fingerprint this counter.
+    transaction.on_commit(partial(bump_model_version, RelatedContent))
+
+
+def _postings(document_id, doc):
+    rows = [RelatedPosting(document_id=document_id, token=token, count=count) for token, count in doc.counts.items()]
+    rows += [RelatedPosting(document_id=document_id, token=TERM_PREFIX + term, count=1) for term in doc.terms]
+    return rows
+
+
+def rebuild_all():
+    """Recompute every neighbour list and the stored statistics. Returns the number of stored rows."""
+    corpus = load_corpus()
+    with transaction.atomic():
+        for model in (RelatedContent, RelatedPosting, RelatedDocument, RelatedTerm):
+            model.objects.all().delete()
+        RelatedTerm.objects.bulk_create(
+            (RelatedTerm(token=token, documents=documents) for token, documents in corpus.doc_freqs.items()),
+            batch_size=500,
+        )
+        RelatedDocument.objects.bulk_create(
+            (
+                RelatedDocument(
+                    source_kind=kind, source_id=pk, group=doc.group or "", terms=sorted(doc.terms),
+                    norm=corpus.norms[doc.key],
+                )
+                for (kind, pk), doc in corpus.documents.items()
+            ),
+            batch_size=500,
+        )
+        ids = RelatedDocument.objects.values_list("source_kind", "source_id", "pk")
+        postings = []
+        for kind, source_id, document_id in ids.iterator(chunk_size=500):
+            postings += _postings(document_id, corpus.documents[kind, source_id])
+            if len(postings) >= 5000:
+                RelatedPosting.objects.bulk_create(postings, batch_size=500)
+                postings = []
+        RelatedPosting.objects.bulk_create(postings, batch_size=500)
+
+        rows = []
+        for key in corpus.documents:
+            rows += _rows(key, corpus.neighbours(key))
+        RelatedContent.objects.bulk_create(rows, batch_size=500)
+        _changed()
+    return len(rows)
+
+
+def key_for(obj):
+    return (POST, obj.pk) if isinstance(obj, BlogPost) else (PROJECT, obj.pk)
+
+
+def _target_filter(key):
+    kind, pk = key
+    return {"post_id": pk} if kind == POST else {"project_id": pk}
+
+
+def holders_of(key):
+    """Sources whose stored lists currently include ``key``."""
+    return {
+        (kind, source_id)
+        for kind, source_id in RelatedContent.objects.filter(**_target_filter(key))
+        .values_list("source_kind", "source_id")
+    }
+
+
+# Incremental updates from the stored statistics.
+def _live_document(key):
+    """The current document of ``key``, or ``None`` when it is deleted or unpublished."""
+    kind, pk = key
+    if kind == POST:
+        post = BlogPost.objects.published().prefetch_related("tags").filter(pk=pk).first()
+        return post and _post_document(post)
+    project = PortfolioProject.objects.prefetch_related("technologies").filter(pk=pk).first()
+    return project and _project_document(project)
+
+
+def _doc_freqs(tokens):
+    return dict(RelatedTerm.objects.filter(token__in=list(tokens)).values_list("token", "documents"))
+
+
+def _count_documents(tokens, step):
+    if not tokens:
+        return
+    if step > 0:
+        RelatedTerm.objects.bulk_create((RelatedTerm(token=token) for token in tokens), ignore_conflicts=True)
+    RelatedTerm.objects.filter(token__in=tokens).update(documents=F("documents") + step)
+    if step < 0:
+        RelatedTerm.objects.filter(token__in=tokens, documents=0).delete()
+
+
+def _store(key, doc):
+    """Replace the statistics stored for ``key`` with those of ``doc`` (dropped when ``None``)."""
+    kind, pk = key
+    stored = RelatedDocument.objects.filter(source_kind=kind, source_id=pk).first()
+    if stored is not None:
+        tokens = list(stored.postings.exclude(token__startswith=TERM_PREFIX).values_list("token", flat=True))
+        stored.delete()
+        _count_documents(tokens, -1)
+    if doc is None:
+        return
+    _count_documents(list(doc.counts), 1)
+    norm = doc.weigh(_doc_freqs(doc.counts), RelatedDocument.objects.count() + 1)
+    stored = RelatedDocument.objects.create(
+        source_kind=kind, source_id=pk, group=doc.group or "", terms=sorted(doc.terms), norm=norm,
+    )
+    RelatedPosting.objects.bulk_create(_postings(stored.pk, doc), batch_size=500)
+
+
+def _stored_document(key):
+    kind, pk = key
+    stored = RelatedDocument.objects.filter(source_kind=kind, source_id=pk).first()
+    if stored is None:
+        return None
+    counts = Counter(dict(
+        stored.postings.exclude(token__startswith=TERM_PREFIX).values_list("token", "count")
+    ))
+    doc = Document(key, stored.group or None, set(stored.terms), counts)
+    doc.weigh(_doc_freqs(counts), RelatedDocument.objects.count())
+    return doc
+
+
+def _stored_neighbours(doc):
+    """All positively scored candidates of ``doc`` among the stored documents, best first.
+
+    Candidates are weighed from their stored counts for ``doc``'s tokens only,
+    which is all the cosine needs, over their stored norm.
+    """
+    kind, pk = doc.key
+    ranked = (
+        RelatedPosting.objects.filter(token__in=doc.probes())
+        .exclude(document__source_kind=kind, document__source_id=pk)
+        .values("document_id")
+        .annotate(shared=Count("id"))
+        .order_by("-shared", "document__source_kind", "document__source_id")
+    )
+    ids = [row["document_id"] for row in ranked[:MAX_CANDIDATES]]
+    counts = defaultdict(dict)
+    for document_id, token, count in RelatedPosting.objects.filter(
+        document_id__in=ids, token__in=list(doc.vector),
+    ).values_list("document_id", "token", "count"):
+        counts[document_id][token] = count
+    doc_freqs = _doc_freqs(doc.vector)
+    total = RelatedDocument.objects.count()
+    scored = []
+    for stored in RelatedDocument.objects.filter(pk__in=ids):
+        other = Document((stored.source_kind, stored.source_id), stored.group or None, set(stored.terms), {})
+        other.vector = {
+            token: (1 + math.log(count)) * _idf(doc_freqs.get(token, 0), total) / stored.norm
+            for token, count in counts[stored.pk].items()
+        }
+        scored.append((score(doc, other), other.key))
+    return _ranked(scored)
+
+
+def _current_lists(keys):
+    lists = defaultdict(list)
+    for row in RelatedContent.objects.filter(_source_filter(keys)).values(
+        "source_kind", "source_id", "post_id", "project_id", "score",
+    ):
+        target = (POST, row["post_id"]) if row["post_id"] else (PROJECT, row["project_id"])
+        lists[row["source_kind"], row["source_id"]].append((row["score"], target))
+    return lists
+
+
+def refresh_for(key, holders=()):
+    """Update the neighbours of ``key`` and every list whose membership it may change.
+
+    Lists that currently include the item are recomputed (it may have dropped
+    out); a candidate's list only gains it if it now outscores that list's
+    weakest entry. ``holders`` lets callers pass lists captured before a delete
+    cascaded the item's rows away.
+    """
+    holders = (holders_of(key) | {tuple(holder) for holder in holders}) - {key}
+
+    with transaction.atomic():
+        doc = _live_document(key)
+        _store(key, doc)
+        lists = {}
+        for holder in holders:
+            holder_doc = _stored_document(holder)
+            if holder_doc is not None:
+                lists[holder] = _stored_neighbours(holder_doc)[:LIMIT]
+        if doc is None:
+            # Deleted or unpublished: drop its own list and the rows that pointed at it.
+            _replace_lists({key: []})
+            RelatedContent.objects.filter(**_target_filter(key)).delete()
+            _replace_lists(lists)
+            return
+
+        scored = _stored_neighbours(doc)
+        lists[key] = scored[:LIMIT]
+        gains = {other: value for value, other in scored if other not in lists}
+        current = _current_lists(gains)
+        for other, value in gains.items():
+            entries = current.get(other, [])
+            if len(entries) < LIMIT or value > min(entry[0] for entry in entries):
+                lists[other] = _ranked(entries + [(value, key)], LIMIT)
+        _replace_lists(lists)
+
+
+def related_for(obj, limit=LIMIT):
+    """Stored neighbours of ``obj`` with their targets joined in, best first."""
+    kind, pk = key_for(obj)
+    return (
+        RelatedContent.objects.filter(source_kind=kind, source_id=pk)
+        .select_related("post", "project")
+        .defer("post__content")
+        .order_by("rank")[:limit]
+    )
@@ -0,0 +1,66 @@
+"""Primary/replica database routing.
+
+Reads made while serving a GET/HEAD/OPTIONS request go to one of
+``settings.DATABASE_REPLICAS``; everything else uses ``default``: writes,
+unsafe requests, the paths in ``DATABASE_PRIMARY_PATHS`` (admin, accounts),
+management commands and the job worker. ``ReplicaRoutingMiddleware`` picks
+the replica once per request, so all of its reads see one snapshot, and
+after a request that wrote it sets a cookie that keeps the client on the
+primary for ``REPLICA_STICKY_SECONDS`` so it reads its own writes while the
+replicas catch up.
+"""
+
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+
+PRIMARY = "default"
+STICKY_COOKIE = "db_primary"
+
+_state = ContextVar("core.routers.state", default=None)
+
+
+class RoutingState:
+    """Database choice for the request being served."""
+
+    def __init__(self, replica=None):
+        self.replica = replica
+        self.wrote = False
+
+
+def replica_for(request):
+    """The replica alias ``request`` may read from, or ``None`` for the primary."""
+    if not settings.DATABASE_REPLICAS or request.method not in ("GET", "HEAD", "OPTIONS"):
+        return None
+    if request.path.startswith(tuple(settings.DATABASE_PRIMARY_PATHS)) or STICKY_COOKIE in request.COOKIES:
+        return None
+    return random.choice(settings.DATABASE_REPLICAS)
+
+
+def activate(state):
+    return _state.set(state)
+
+
+def deactivate(token):
+    _state.reset(token)
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        return state.replica if state is not None and state.replica else PRIMARY
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get their schema through replication.
+        return db == PRIMARY
@@ -0,0 +1,258 @@
+"""Full-text search over blog posts and portfolio projects.
+
+On SQLite the index is an FTS5 virtual table (``core_search_index``) kept in
+sync by the signal handlers in ``core.signals``. Other database backends fall
+back to ``icontains`` filtering so the search page keeps working, just without
+ranking or snippets.
+"""
+
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.urls import reverse
+from django.utils.html import escape, strip_tags
+from django.utils.safestring import mark_safe
+
+from .models import BlogPost, PortfolioProject
+
+INDEX_TABLE = "core_search_index"
+
+KIND_POST = "post"
+KIND_PROJECT = "project"
+# Rows are keyed by ``rowid = object_id * 2 + kind bit``. ``kind`` and
+# ``object_id`` are UNINDEXED columns, so filtering on them scans the whole
+# table; a rowid lookup is a b-tree seek.
+_KIND_BITS = {KIND_POST: 0, KIND_PROJECT: 1}
+
+# bm25() weights, one per column: kind, object_id, title, body, tags.
+_BM25_WEIGHTS = "0.0, 0.0, 10.0, 1.0, 5.0"
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+# Control characters delimit highlights so the snippet can be escaped before <mark> is added.
+_HIGHLIGHT_START = "\x02"
+_HIGHLIGHT_END = "\x03"
+
+
+def fts_available(conn=None):
+    conn = conn or connection
+    return conn.vendor == "sqlite"
+
+
+def _create_table(schema_editor, table):
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5("
+        "kind UNINDEXED, object_id UNINDEXED, title, body, tags, "
+        "tokenize='porter unicode61')"
+    )
+
+
+def create_index(schema_editor):
+    """Create the FTS5 table (used by the migration)."""
+    if not fts_available(schema_editor.connection):
+        return
+    _create_table(schema_editor, INDEX_TABLE)
+
+
+def rekey_index(schema_editor):
+    """Copy the index into a new table keyed by ``_rowid`` (used by the migration)."""
+    if not fts_available(schema_editor.connection):
+        return
+    rekeyed = f"{INDEX_TABLE}_rekeyed"
+    _create_table(schema_editor, rekeyed)
+    schema_editor.execute(
+        f"INSERT OR REPLACE INTO {rekeyed} (rowid, kind, object_id, title, body, tags) "
+        f"SELECT CAST(object_id AS INTEGER) * 2 + (kind = '{KIND_PROJECT}'), kind, object_id, title, body, tags "
+        f"FROM {INDEX_TABLE}"
+    )
+    schema_editor.execute(f"DROP TABLE {INDEX_TABLE}")
+    schema_editor.execute(f"ALTER TABLE {rekeyed} RENAME TO {INDEX_TABLE}")
+
+
+def drop_index(schema_editor):
+    if not fts_available(schema_editor.connection):
+        return
+    schema_editor.execute(f"DROP TABLE IF EXISTS {INDEX_TABLE}")
+
+
+def _document(obj):
+    """Return ``(kind, title, body, tags)`` for an indexable instance."""
+    if isinstance(obj, BlogPost):
+        body = " ".join(strip_tags(f"{obj.excerpt} {obj.content}").split())
+        return KIND_POST, obj.title, body, " ".join(tag.name for tag in obj.tags.all())
+    technologies = " ".join(technology.name for technology in obj.technologies.all())
+    return KIND_PROJECT, obj.title, f"{obj.client} {obj.description}", technologies
+
+
+def _rowid(kind, pk):
+    return int(pk) * 2 + _KIND_BITS[kind]
+
+
+def _is_indexable(obj):
+    return not isinstance(obj, BlogPost) or obj.published
+
+
+def index_object(obj):
+    """Insert or replace ``obj`` in the index; unpublished posts are removed."""
+    if not fts_available():
+        return
+    kind, title, body, tags = _document(obj)
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {INDEX_TABLE} WHERE rowid = %s", [_rowid(kind, obj.pk)])
+        if _is_indexable(obj):
+            _insert_rows(cursor, [[kind, obj.pk, title, body, tags]])
+
+
+def remove_object(obj):
+    if not fts_available():
+        return
+    kind = KIND_POST if isinstance(obj, BlogPost) else KIND_PROJECT
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {INDEX_TABLE} WHERE rowid = %s", [_rowid(kind, obj.pk)])
+
+
+def rebuild_index(batch_size=500):
+    """Drop every row and re-index all posts and projects. Returns the row count."""
+    if not fts_available():
+        return 0
+    total = 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {INDEX_TABLE}")
+        querysets = [
+            BlogPost.objects.published().prefetch_related("tags").order_by("pk"),
+            PortfolioProject.objects.prefetch_related("technologies").order_by("pk"),
+        ]
+        for queryset in querysets:
+            rows = []
+            for obj in queryset.iterator(chunk_size=batch_size):
+                kind, title, body, tags = _document(obj)
+                rows.append([kind, obj.pk, title, body, tags])
+                if len(rows) >= batch_size:
+                    _insert_rows(cursor, rows)
+                    total += len(rows)
+                    rows = []
+            if rows:
+                _insert_rows(cursor, rows)
+                total += len(rows)
+    return total
+
+
+def _insert_rows(cursor, rows):
+    """Insert ``[kind, object_id, title, body, tags]`` rows under their ``_rowid``."""
+    cursor.executemany(
+        f"INSERT INTO {INDEX_TABLE} (rowid, kind, object_id, title, body, tags) "
+        "VALUES (%s, %s, %s, %s, %s, %s)",
+        [[_rowid(row[0], row[1]), *row] for row in rows],
+    )
+
+
+def build_match_expression(query):
+    """Turn free text into a safe FTS5 expression: every term required, last one as a prefix."""
+    terms = _TERM_RE.findall(query)
+    if not terms:
+        return ""
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _highlight(snippet):
+    html = escape(snippet)
+    return mark_safe(html.replace(_HIGHLIGHT_START, "<mark>").replace(_HIGHLIGHT_END, "</mark>"))
+
+
+class SearchHit:
+    """A single ranked result, wrapping the matched model instance."""
+
+    def __init__(self, kind, obj, snippet=""):
+        self.kind = kind
+        self.object = obj
+        self.snippet = snippet
+
+    @property
+    def title(self):
+        return self.object.title
+
+    def get_absolute_url(self):
+        if self.kind == KIND_POST:
+            return self.object.get_absolute_url()
+        return reverse("core:portfolio_detail", kwargs={"project_id": self.object.pk})
+
+
+class SearchResults:
+    """Lazy, sliceable result list so it can be handed straight to ``Paginator``."""
+
+    def __init__(self, query):
+        self.query = query
+        self.match = build_match_expression(query)
+        self._count = None
+
+    def count(self):
+        if self._count is None:
+            if not self.match:
+                self._count = 0
+            elif fts_available():
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"SELECT count(*) FROM {INDEX_TABLE} WHERE {INDEX_TABLE} MATCH %s",
+                        [self.match],
+                    )
+                    self._count = cursor.fetchone()[0]
+            else:
+                self._count = sum(qs.count() for qs in self._fallback_querysets())
+        return self._count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        start = index.start or 0
+        stop = index.stop if index.stop is not None else self.count()
+        if not self.match or stop <= start:
+            return []
+        if fts_available():
+            return self._fts_page(start, stop - start)
+        return self._fallback_page(start, stop - start)
+
+    def _fts_page(self, offset, limit):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT kind, object_id, "
+                f"snippet({INDEX_TABLE}, 3, %s, %s, '…', 24) "
+                f"FROM {INDEX_TABLE} WHERE {INDEX_TABLE} MATCH %s "
+                f"ORDER BY bm25({INDEX_TABLE}, {_BM25_WEIGHTS}) LIMIT %s OFFSET %s",
+                [_HIGHLIGHT_START, _HIGHLIGHT_END, self.match, limit, offset],
+            )
+            rows = cursor.fetchall()
+        post_ids = [int(pk) for kind, pk, _ in rows if kind == KIND_POST]
+        project_ids = [int(pk) for kind, pk, _ in rows if kind == KIND_PROJECT]
+        objects = {
+            KIND_POST: BlogPost.objects.published().for_listing().in_bulk(post_ids),
+            KIND_PROJECT: PortfolioProject.objects.in_bulk(project_ids),
+        }
+        hits = []
+        for kind, pk, snippet in rows:
+            obj = objects[kind].get(int(pk))
+            if obj is not None:
+                hits.append(SearchHit(kind, obj, _highlight(snippet)))
+        return hits
+
+    def _fallback_querysets(self):
+        terms = _TERM_RE.findall(self.query)
+        posts = BlogPost.objects.published().for_listing()
+        projects = PortfolioProject.objects.all()
+        for term in terms:
+            posts = posts.filter(Q(title__icontains=term) | Q(plain_excerpt__icontains=term))
+            projects = projects.filter(Q(title__icontains=term) | Q(description__icontains=term))
+        return posts, projects
+
+    def _fallback_page(self, offset, limit):
+        posts, projects = self._fallback_querysets()
+        hits = [SearchHit(KIND_POST, post) for post in posts[:offset + limit]]
+        hits += [SearchHit(KIND_PROJECT, project) for project in projects[:offset + limit]]
+        return hits[offset:offset + limit]
+
+
+def search(query):
+    return SearchResults(query)
@@ -0,0 +1,193 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from . import jobs, related, search
+from .cache import bump_model_version
+from .models import (
+    BlogPost, BlogPostTag, PortfolioProject, ProjectTechnology, Service, Tag, TeamMember, Technology,
+)
+
+
+# Search index maintenance
+@receiver(post_save, sender=BlogPost)
+@receiver(post_save, sender=PortfolioProject)
+def update_search_index(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    search.index_object(instance)
+
+
+@receiver(post_delete, sender=BlogPost)
+@receiver(post_delete, sender=PortfolioProject)
+def remove_from_search_index(sender, instance, **kwargs):
+    search.remove_object(instance)
+
+
+@receiver(m2m_changed, sender=BlogPostTag)
+@receiver(m2m_changed, sender=ProjectTechnology)
+def update_search_index_terms(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """Re-index when tags/technologies are changed through the related manager."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        search.index_object(instance)
+    elif pk_set:
+        for obj in model.objects.filter(pk__in=pk_set):
+            search.index_object(obj)
+
+
+class _OnCommitOnce:
+    """An on-commit callback scheduled at most once per key and transaction."""
+
+    def __init__(self, key, func, *args):
+        self.key = key
+        self.func = func
+        self.args = args
+        self.pending = True
+
+    def __call__(self):
+        self.pending = False
+        self.func(*self.args)
+
+
+def _on_commit_once(key, func, *args):
+    """``transaction.on_commit(func(*args))`` unless a callback for ``key`` is already pending.
+
+    Returns the pending callback. Pending callbacks live in the connection's
+    own on-commit list, so a rollback discards them along with the writes.
+    """
+    connection = transaction.get_connection()
+    if connection.in_atomic_block:
+        for _, callback, _ in connection.run_on_commit:
+            if isinstance(callback, _OnCommitOnce) and callback.pending and callback.key == key:
+                return callback
+    callback = _OnCommitOnce(key, func, *args)
+    transaction.on_commit(callback)
+    return callback
+
+
+def _deleting(origin, model):
+    """Whether a cascade started from deleting ``model`` instances (their own handlers clean up)."""
+    if isinstance(origin, QuerySet):
+        return origin.model is model
+    return isinstance(origin, model)
+
+
+def _reindex_terms(model, pk):
+    obj = model.objects.filter(pk=pk).first()
+    if obj is not None:
+        search.index_object(obj)
+        _schedule_related_refresh(obj)
+
+
+@receiver(post_save, sender=BlogPostTag)
+@receiver(post_delete, sender=BlogPostTag)
+def update_search_index_post_tag(sender, instance, raw=False, origin=None, **kwargs):
+    """Admin inlines save through rows directly, bypassing ``m2m_changed``.
+
+    Each row only marks its post; the post is re-indexed once after commit.
+    """
+    if raw or _deleting(origin, BlogPost):
+        return
+    _on_commit_once(("terms", BlogPost, instance.post_id), _reindex_terms, BlogPost, instance.post_id)
+
+
+@receiver(post_save, sender=ProjectTechnology)
+@receiver(post_delete, sender=ProjectTechnology)
+def update_search_index_project_technology(sender, instance, raw=False, origin=None, **kwargs):
+    if raw or _deleting(origin, PortfolioProject):
+        return
+    _on_commit_once(
+        ("terms", PortfolioProject, instance.project_id), _reindex_terms, PortfolioProject, instance.project_id,
+    )
+
+
+# Related-content neighbours are recomputed by the ``related.refresh`` job, queued
+# once per item and transaction however often the item changed in it.
+def _enqueue_related_refresh(key, holders):
+    kind, pk = key
+    jobs.enqueue("related.refresh", unique=True, kind=kind, pk=pk, holders=sorted(holders))
+
+
+def _schedule_related_refresh(obj, holders=()):
+    key = related.key_for(obj)
+    pending = _on_commit_once(("related", key), _enqueue_related_refresh, key, set())
+    # A delete in the same transaction adds the lists captured before its cascade.
+    pending.args[1].update(holders)
+
+
+@receiver(post_save, sender=BlogPost)
+@receiver(post_save, sender=PortfolioProject)
+def update_related_content(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _schedule_related_refresh(instance)
+
+
+@receiver(pre_delete, sender=BlogPost)
+@receiver(pre_delete, sender=PortfolioProject)
+def remove_related_content(sender, instance, **kwargs):
+    # The delete cascades this item's rows away, so capture who listed it first.
+    _schedule_related_refresh(instance, related.holders_of(related.key_for(instance)))
+
+
+@receiver(m2m_changed, sender=BlogPostTag)
+@receiver(m2m_changed, sender=ProjectTechnology)
+def update_related_content_terms(sender, instance, action, reverse, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear") and not reverse:
+        _schedule_related_refresh(instance)
+
+
+# Responsive image derivatives for newly uploaded images, rendered by the worker.
+@receiver(post_save, sender=TeamMember)
+@receiver(post_save, sender=PortfolioProject)
+@receiver(post_save, sender=BlogPost)
+def generate_image_derivatives(sender, instance, raw=False, **kwargs):
+    if raw or not instance.image:
+        return
+    jobs.enqueue("images.generate", unique=True, model=instance._meta.label, pk=instance.pk)
+
+
+# Cache invalidation: a write bumps the generation counter of the model whose
+# pages it changes (tags/technologies count as part of their post/project).
+CACHE_DEPENDENCIES = {
+    Service: Service,
+    TeamMember: TeamMember,
+    PortfolioProject: PortfolioProject,
+    ProjectTechnology: PortfolioProject,
+    Technology: PortfolioProject,
+    BlogPost: BlogPost,
+    BlogPostTag: BlogPost,
+    Tag: BlogPost,
+}
+
+
+def invalidate_cached_pages(sender, **kwargs):
+    if kwargs.get("action", "post_").startswith("post_"):
+        transaction.on_commit(partial(bump_model_version, CACHE_DEPENDENCIES[sender]))
+
+
+for _sender in CACHE_DEPENDENCIES:
+    post_save.connect(invalidate_cached_pages, sender=_sender, dispatch_uid=f"cache-save-{_sender.__name__}")
+    post_delete.connect(invalidate_cached_pages, sender=_sender, dispatch_uid=f"cache-delete-{_sender.__name__}")
+for _sender in (BlogPostTag, ProjectTechnology):
+    m2m_changed.connect(invalidate_cached_pages, sender=_sender, dispatch_uid=f"cache-m2m-{_sender.__name__}")
+
+
+# The brochure lists services and projects; queue a rebuild once their counters have moved.
+def rebuild_brochure(sender, **kwargs):
+    if kwargs.get("action", "post_").startswith("post_"):
+        transaction.on_commit(partial(jobs.enqueue, "brochure.rebuild", unique=True))
+
+
+# Connected after the cache handlers so the rebuild sees the bumped counters.
+for _sender, _model in CACHE_DEPENDENCIES.items():
+    if _model not in (Service, PortfolioProject):
+        continue
+    post_save.connect(rebuild_brochure, sender=_sender, dispatch_uid=f"brochure-save-{_sender.__name__}")
+    post_delete.connect(rebuild_brochure, sender=_sender, dispatch_uid=f"brochure-delete-{_sender.__name__}")
+m2m_changed.connect(rebuild_brochure, sender=ProjectTechnology, dispatch_uid="brochure-m2m-ProjectTechnology")
@@ -1,52 +1,184 @@
+"""Sitemap index and paginated per-section sitemaps.
+
+``/sitemap.xml`` is an index of ``/sitemap-<section>-<page>.xml`` files of at
+most ``Sitemap.limit`` URLs each. Sections read only the columns they print
+(``values_list``) and are written straight to XML rather than through a
+template. Each file is cached by ``cache_public_page`` under its own
+section's model counters, so saving a blog post regenerates the blog files
+and nothing else, and every response carries ``Last-Modified``/``ETag`` from
+the section's newest ``updated_at`` for conditional GETs.
+
+Services and team members have no pages of their own; ``/services/`` and
+``/team/`` are listed in the ``static`` section.
+"""
+
+import math
+from xml.sax.saxutils import escape
+
+from django.conf import settings
 from django.contrib.sitemaps import Sitemap
+from django.core.cache import cache
+from django.core.paginator import InvalidPage
+from django.http import Http404, HttpResponse
 from django.urls import reverse
-from .models import PortfolioProject, Service, TeamMember, BlogPost
 
+from . import metrics
+from .cache import cache_public_page, versions_key
+from .conditional import conditional_page, latest_change
+from .models import BlogPost, PortfolioProject
+
+# 5,000 URLs render to well under 1 MB, which fits memcached's default item size.
+PAGE_SIZE = 5000
+
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+_XMLNS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+class SectionSitemap(Sitemap):
+    """A sitemap section; ``models`` are the models whose saves change it."""
+
+    limit = PAGE_SIZE
+    models = ()
+
+    def changes(self):
+        """``(newest lastmod, number of URLs)`` of the section."""
+        raise NotImplementedError
+
+    def latest_change(self):
+        """``changes()``, cached until one of ``models`` changes.
 
-class StaticViewSitemap(Sitemap):
+        Counting a large section costs a full scan, which would otherwise be
+        paid by every crawler revalidation.
+        """
+        if not self.models:
+            return self.changes()
+        key = f"sitemap:changes:{type(self).__name__}:{versions_key(self.models)}"
+        result = cache.get(key)
+        metrics.cache_lookup("sitemap", result is not None)
+        if result is None:
+            result = self.changes()
+            cache.set(key, result, settings.PAGE_CACHE_TIMEOUT)
+        return result
+
+
+class StaticViewSitemap(SectionSitemap):
     changefreq = "weekly"
     priority = 0.8
 
     def items(self):
-        return ['core:index', 'core:contact', 'core:services', 'core:portfolio', 'core:team', 'core:blog']
+        return [
+            'core:index', 'core:services', 'core:portfolio', 'core:team', 'core:blog',
+            'core:contact', 'core:about', 'core:privacy', 'core:terms',
+        ]
 
     def location(self, item):
         return reverse(item)
 
-
-class ServiceSitemap(Sitemap):
-    changefreq = "monthly"
-    priority = 0.6
-
-    def items(self):
-        return Service.objects.all()
+    def changes(self):
+        return None, len(self.items())
 
 
-class PortfolioSitemap(Sitemap):
+class PortfolioSitemap(SectionSitemap):
     changefreq = "weekly"
     priority = 0.7
+    models = (PortfolioProject,)
 
     def items(self):
-        return PortfolioProject.objects.all()
-
-    def lastmod(self, obj):
-        return obj.created_at
+        return PortfolioProject.objects.order_by("pk").values_list("pk", "updated_at")
 
+    def location(self, item):
+        return reverse("core:portfolio_detail", args=[item[0]])
 
-class TeamSitemap(Sitemap):
-    changefreq = "monthly"
-    priority = 0.5
+    def lastmod(self, item):
+        return item[1]
 
-    def items(self):
-        return TeamMember.objects.all()
+    def changes(self):
+        return latest_change(PortfolioProject.objects.all())
 
 
-class BlogSitemap(Sitemap):
+class BlogSitemap(SectionSitemap):
     changefreq = "daily"
     priority = 0.8
+    models = (BlogPost,)
 
     def items(self):
-        return BlogPost.objects.all()
+        return BlogPost.objects.published().order_by("pk").values_list("slug", "updated_at")
+
+    def location(self, item):
+        return reverse("core:blog_detail", kwargs={"slug": item[0]})
+
+    def lastmod(self, item):
+        return item[1]
+
+    def changes(self):
+        return latest_change(BlogPost.objects.published())
+
+
+SITEMAPS = {
+    "static": StaticViewSitemap,
+    "portfolio": PortfolioSitemap,
+    "blog": BlogSitemap,
+}
+
+
+def _lastmod_tag(value):
+    return f"<lastmod>{value.isoformat(timespec='seconds')}</lastmod>" if value else ""
+
+
+def render_section(request, sitemap, page):
+    """The ``<urlset>`` of one page of ``sitemap``; raises ``Http404`` past the last page."""
+    try:
+        rows = sitemap.paginator.page(page).object_list
+    except InvalidPage:
+        raise Http404("No such sitemap page.")
+    base = f"{request.scheme}://{request.get_host()}"
+    lastmod = getattr(sitemap, "lastmod", lambda item: None)
+    suffix = f"<changefreq>{sitemap.changefreq}</changefreq><priority>{sitemap.priority}</priority></url>"
+    parts = [_XML_HEADER, f"<urlset {_XMLNS}>\n"]
+    for item in rows:
+        parts.append(f"<url><loc>{escape(base + sitemap.location(item))}</loc>{_lastmod_tag(lastmod(item))}{suffix}\n")
+    parts.append("</urlset>\n")
+    return "".join(parts)
+
+
+def render_index(request):
+    """The ``<sitemapindex>`` listing every page of every section."""
+    parts = [_XML_HEADER, f"<sitemapindex {_XMLNS}>\n"]
+    for section, sitemap_class in SITEMAPS.items():
+        sitemap = sitemap_class()
+        latest, count = sitemap.latest_change()
+        for page in range(1, max(1, math.ceil(count / sitemap.limit)) + 1):
+            location = request.build_absolute_uri(reverse("sitemap_section", args=[section, page]))
+            parts.append(f"<sitemap><loc>{escape(location)}</loc>{_lastmod_tag(latest)}</sitemap>\n")
+    parts.append("</sitemapindex>\n")
+    return "".join(parts)
+
+
+def _all_changes(request):
+    changes = [sitemap_class().latest_change() for sitemap_class in SITEMAPS.values()]
+    timestamps = [latest for latest, _ in changes if latest is not None]
+    return (max(timestamps) if timestamps else None), [count for _, count in changes]
+
+
+@conditional_page(_all_changes)
+@cache_public_page(query_params=(), models=tuple(model for cls in SITEMAPS.values() for model in cls.models))
+def sitemap_index_view(request):
+    return HttpResponse(render_index(request), content_type="application/xml")
+
+
+def _section_view(sitemap_class):
+    @conditional_page(lambda request, page: sitemap_class().latest_change())
+    @cache_public_page(query_params=(), models=sitemap_class.models)
+    def view(request, page):
+        return HttpResponse(render_section(request, sitemap_class(), page), content_type="application/xml")
+
+    return view
+
+
+_SECTION_VIEWS = {section: _section_view(sitemap_class) for section, sitemap_class in SITEMAPS.items()}
+
 
-    def lastmod(self, obj):
-        return obj.created_at
+def sitemap_section_view(request, section, page):
+    if section not in _SECTION_VIEWS:
+        raise Http404("No such sitemap section.")
+    return _SECTION_VIEWS[section](request, page)
@@ -0,0 +1,116 @@
+"""A minimal in-process SMTP server that accepts and records every message.
+
+It stands in for a mail relay in tests and local development, so the real
+``smtp.EmailBackend`` code path (connection, envelope, DATA) is exercised
+without sending anything::
+
+    with SMTPSink() as sink:
+        with override_settings(EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+                               EMAIL_HOST=sink.host, EMAIL_PORT=sink.port):
+            ...
+        sink.messages[0]["Subject"]
+
+``python manage.py runsmtpsink`` runs one in the foreground and prints what
+it receives.
+"""
+
+import email
+import email.policy
+import socketserver
+import threading
+
+
+class ReceivedMessage:
+    def __init__(self, sender, recipients, data):
+        self.sender = sender
+        self.recipients = recipients
+        self.message = email.message_from_bytes(data, policy=email.policy.default)
+
+    def __getitem__(self, header):
+        return self.message[header]
+
+    @property
+    def body(self):
+        return self.message.get_body(preferencelist=("plain", "html")).get_content()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        sender, recipients = None, []
+        self.reply("220 localhost SMTP sink ready")
+        for raw in self.rfile:
+            command = raw.decode("utf-8", "replace").rstrip("\r\n")
+            verb = command[:4].upper()
+            if verb in ("HELO", "EHLO"):
+                self.reply("250 localhost")
+            elif verb == "MAIL":
+                sender, recipients = command.split(":", 1)[1].strip().split()[0].strip("<>"), []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                recipients.append(command.split(":", 1)[1].strip().strip("<>"))
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                for line in self.rfile:
+                    if line in (b".\r\n", b".\n"):
+                        break
+                    lines.append(line[1:] if line.startswith(b"..") else line)
+                self.server.sink.record(ReceivedMessage(sender, recipients, b"".join(lines)))
+                sender, recipients = None, []
+                self.reply("250 OK: queued")
+            elif verb == "RSET":
+                sender, recipients = None, []
+                self.reply("250 OK")
+            elif verb == "NOOP":
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SMTPSink:
+    """SMTP server on ``host``:``port`` (an ephemeral port by default) that keeps what it receives."""
+
+    def __init__(self, host="127.0.0.1", port=0, on_message=None):
+        self.messages = []
+        self.on_message = on_message
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), _Handler)
+        self._server.sink = self
+        self.host, self.port = self._server.server_address
+        self._thread = None
+
+    def record(self, message):
+        with self._lock:
+            self.messages.append(message)
+        if self.on_message is not None:
+            self.on_message(message)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="smtp-sink", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
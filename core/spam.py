@@ -0,0 +1,225 @@
+"""Spam and abuse screening for the contact form.
+
+Every POST to ``contact_view`` passes through ``screen()`` before anything is
+written to the database:
+
+1. token-bucket rate limits per client IP and per submitted email address,
+   kept in the cache so all web processes share them;
+2. a honeypot field that people never see and bots fill in;
+3. a signed, single-use timing token rendered with the form, which rejects
+   forged or replayed forms and submissions made faster than a person can type;
+4. a keyword/n-gram scorer that rejects obvious spam and quarantines
+   borderline messages (stored, but flagged and without follow-up emails).
+
+Each outcome increments a counter in the cache; ``counters()`` returns them
+for monitoring (see ``/api/contacts/spam-stats/``).
+"""
+
+import hashlib
+import re
+import secrets
+import time
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+
+from . import metrics
+
+HONEYPOT_FIELD = "website"
+TOKEN_FIELD = "form_token"
+
+ACCEPTED = "accepted"
+QUARANTINED = "quarantined"
+RATE_LIMITED = "rate_limited"
+HONEYPOT = "honeypot"
+BAD_TOKEN = "bad_token"
+TOO_FAST = "too_fast"
+SPAM = "spam"
+OUTCOMES = (ACCEPTED, QUARANTINED, RATE_LIMITED, HONEYPOT, BAD_TOKEN, TOO_FAST, SPAM)
+
+_TOKEN_SALT = "core.spam.contact-form"
+
+
+class Verdict:
+    """Outcome of screening one submission."""
+
+    def __init__(self, outcome, score=0.0, retry_after=None):
+        self.outcome = outcome
+        self.score = score
+        self.retry_after = retry_after
+
+    @property
+    def allowed(self):
+        return self.outcome in (ACCEPTED, QUARANTINED)
+
+    @property
+    def quarantined(self):
+        return self.outcome == QUARANTINED
+
+    def __repr__(self):
+        return f"<Verdict {self.outcome} score={self.score:.1f}>"
+
+
+# Rate limiting
+def _bucket_key(scope, identity):
+    return f"ratelimit:{scope}:{hashlib.md5(identity.encode()).hexdigest()}"
+
+
+def take_token(scope, identity, capacity, period, now=None):
+    """Take one token from the ``scope``/``identity`` bucket.
+
+    The bucket holds ``capacity`` tokens and refills completely over
+    ``period`` seconds. Returns ``0`` on success, otherwise the seconds until
+    a token is available. Read-modify-write on the cache is not atomic, so a
+    burst of simultaneous requests may slip one or two extra through.
+    """
+    now = time.time() if now is None else now
+    key = _bucket_key(scope, identity)
+    rate = capacity / period
+    tokens, updated = cache.get(key, (capacity, now))
+    tokens = min(capacity, tokens + (now - updated) * rate)
+    if tokens < 1:
+        return (1 - tokens) / rate
+    cache.set(key, (tokens - 1, now), period)
+    return 0
+
+
+def client_ip(request):
+    """The visitor's address, as seen by the outermost of ``SPAM_TRUSTED_PROXY_COUNT`` proxies.
+
+    Each trusted proxy appends the address it received the request from to
+    ``X-Forwarded-For``, so the client is the entry that many places from
+    the right. Entries further left were sent by the client and could be
+    forged. Without trusted proxies, or when the header has fewer entries
+    than expected, ``REMOTE_ADDR`` is used.
+    """
+    proxies = settings.SPAM_TRUSTED_PROXY_COUNT
+    forwarded = [hop.strip() for hop in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",") if hop.strip()]
+    if proxies and len(forwarded) >= proxies:
+        return forwarded[-proxies]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+# Timing token
+def make_form_token(issued_at=None):
+    """Signed timestamp plus a nonce, to embed in the rendered form."""
+    issued_at = int(time.time() if issued_at is None else issued_at)
+    return signing.Signer(salt=_TOKEN_SALT).sign(f"{issued_at}.{secrets.token_urlsafe(9)}")
+
+
+def token_age(token, now=None):
+    """Seconds since ``token`` was issued, or ``None`` if it is missing or forged."""
+    try:
+        issued_at = int(signing.Signer(salt=_TOKEN_SALT).unsign(token or "").split(".")[0])
+    except (signing.BadSignature, ValueError):
+        return None
+    return (time.time() if now is None else now) - issued_at
+
+
+def claim_token(token):
+    """Mark ``token`` as used. ``False`` if it already was, i.e. the form is being replayed."""
+    key = f"spam:token:{hashlib.sha256(token.encode()).hexdigest()}"
+    return cache.add(key, 1, settings.CONTACT_FORM_MAX_AGE)
+
+
+# Content scoring
+_WORD_RE = re.compile(r"[a-z0-9']+")
+_URL_RE = re.compile(r"https?://|www\.", re.IGNORECASE)
+_MARKUP_RE = re.compile(r"\[url[=\]]|<a\s+href", re.IGNORECASE)
+_REPEAT_RE = re.compile(r"(.)\1{6,}")
+
+# Words and two-word phrases typical of contact-form spam, with their weight.
+SPAM_TERMS = {
+    "viagra": 4.0, "cialis": 4.0, "casino": 3.0, "porn": 4.0, "xxx": 3.0, "loan": 1.5,
+    "bitcoin": 2.0, "crypto": 1.5, "forex": 2.0, "backlinks": 3.0, "seo": 1.0, "unsubscribe": 1.5,
+    "whatsapp": 1.0, "telegram": 1.0, "rankings": 1.0, "traffic": 0.5, "dofollow": 3.0,
+    "seo services": 2.0, "guest post": 2.5, "link building": 2.5, "first page": 1.5,
+    "click here": 2.0, "buy now": 2.0, "limited offer": 2.0, "make money": 2.5,
+    "work from home": 2.5, "investment opportunity": 2.5, "dear sir": 1.0, "google ranking": 2.0,
+    "increase your": 1.0, "lead generation": 1.0, "per month": 0.5, "opt out": 1.5,
+}
+
+
+def score_message(name, email, company, message):
+    """Spam score of a submission; higher is spammier."""
+    text = f"{name} {company} {message}"
+    words = _WORD_RE.findall(text.lower())
+    score = 0.0
+    for index, word in enumerate(words):
+        score += SPAM_TERMS.get(word, 0.0)
+        if index:
+            score += SPAM_TERMS.get(f"{words[index - 1]} {word}", 0.0)
+
+    links = len(_URL_RE.findall(message))
+    score += 0.5 * links + max(0, links - 2) * 1.0
+    if _URL_RE.search(name) or _URL_RE.search(company):
+        score += 3.0
+    if _MARKUP_RE.search(message):
+        score += 3.0
+    if _REPEAT_RE.search(message):
+        score += 1.0
+    letters = [char for char in message if char.isalpha()]
+    if len(letters) > 20 and sum(char.isupper() for char in letters) / len(letters) > 0.6:
+        score += 1.5
+    return score
+
+
+# Counters
+def _counter_key(outcome):
+    return f"spam:count:{outcome}"
+
+
+def count(outcome):
+    key = _counter_key(outcome)
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+def counters():
+    """Screening outcomes since the cache was last cleared."""
+    values = cache.get_many([_counter_key(outcome) for outcome in OUTCOMES])
+    return {outcome: values.get(_counter_key(outcome), 0) for outcome in OUTCOMES}
+
+
+def _verdict(outcome, **kwargs):
+    count(outcome)
+    metrics.CONTACT_SUBMISSIONS.labels(outcome).inc()
+    return Verdict(outcome, **kwargs)
+
+
+def screen(request, name, email, company, message):
+    """Decide what to do with a contact-form POST. Never touches the database."""
+    capacity, period = settings.CONTACT_RATE_LIMITS["ip"]
+    wait = take_token("ip", client_ip(request), capacity, period)
+    if wait:
+        return _verdict(RATE_LIMITED, retry_after=wait)
+
+    if request.POST.get(HONEYPOT_FIELD):
+        return _verdict(HONEYPOT)
+
+    token = request.POST.get(TOKEN_FIELD)
+    age = token_age(token)
+    if age is None or age > settings.CONTACT_FORM_MAX_AGE:
+        return _verdict(BAD_TOKEN)
+    if age < settings.CONTACT_FORM_MIN_SECONDS:
+        return _verdict(TOO_FAST)
+
+    capacity, period = settings.CONTACT_RATE_LIMITS["email"]
+    wait = take_token("email", email.strip().lower(), capacity, period)
+    if wait:
+        return _verdict(RATE_LIMITED, retry_after=wait)
+
+    # Claimed only now, so a visitor turned away by a rate limit can resend the same form.
+    if not claim_token(token):
+        return _verdict(BAD_TOKEN)
+
+    score = score_message(name, email, company, message)
+    if score >= settings.SPAM_REJECT_SCORE:
+        return _verdict(SPAM, score=score)
+    if score >= settings.SPAM_QUARANTINE_SCORE:
+        return _verdict(QUARANTINED, score=score)
+    return _verdict(ACCEPTED, score=score)
@@ -0,0 +1,65 @@
+"""Static files: content-hashed names plus precompressed siblings.
+
+``collectstatic`` with ``CompressedManifestStaticFilesStorage`` writes every
+asset as ``style.<hash>.css`` (templates get that name from ``{% static %}``)
+and, for text formats, ``style.<hash>.css.gz`` and ``.br`` next to it.
+``core.views.static_view`` then serves the smallest encoding the client
+accepts without compressing anything per request, and marks hashed files
+``immutable`` so browsers cache them for a year.
+"""
+
+import gzip
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+# Formats that compress well; images and fonts are compressed already.
+COMPRESSIBLE = (".css", ".js", ".mjs", ".map", ".json", ".svg", ".txt", ".xml", ".html", ".ico")
+MIN_SIZE = 256
+ENCODINGS = {"br": ".br", "gzip": ".gz"}
+
+
+def _gzip(data):
+    # mtime=0 keeps the output identical between builds.
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _brotli(data):
+    import brotli
+
+    return brotli.compress(data, quality=11)
+
+
+_COMPRESSORS = {"br": _brotli, "gzip": _gzip}
+
+
+def precompressed_variants(data):
+    """``{encoding: bytes}`` for the encodings that actually shrink ``data``."""
+    variants = {}
+    for encoding, compress in _COMPRESSORS.items():
+        try:
+            encoded = compress(data)
+        except ImportError:
+            continue  # brotli is not installed; gzip still works.
+        if len(encoded) < len(data):
+            variants[encoding] = encoded
+    return variants
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    def post_process(self, paths, dry_run=False, **options):
+        for name, hashed_name, processed in super().post_process(paths, dry_run, **options):
+            if not dry_run and hashed_name and not isinstance(processed, Exception):
+                self._compress(hashed_name)
+            yield name, hashed_name, processed
+
+    def _compress(self, name):
+        if not name.lower().endswith(COMPRESSIBLE) or self.size(name) < MIN_SIZE:
+            return
+        with self.open(name) as handle:
+            data = handle.read()
+        for encoding, encoded in precompressed_variants(data).items():
+            target = name + ENCODINGS[encoding]
+            if self.exists(target):
+                self.delete(target)
+            self._save(target, ContentFile(encoded))
@@ -0,0 +1,89 @@
+"""Background tasks run by ``manage.py runworker`` (see ``core.jobs``)."""
+
+import json
+import urllib.request
+
+from django.apps import apps
+from django.conf import settings
+from django.core.mail import send_mail
+from django.template.loader import render_to_string
+
+from . import brochure, images, related
+from .jobs import enqueue, task
+from .models import Contact
+
+
+def enqueue_contact_followups(contact):
+    """Queue everything that happens after a contact form submission."""
+    if settings.CONTACT_NOTIFY_EMAILS:
+        enqueue("contact.notify_staff", contact_id=contact.pk)
+    enqueue("contact.auto_reply", contact_id=contact.pk)
+    if settings.CRM_WEBHOOK_URL:
+        enqueue("contact.crm_webhook", contact_id=contact.pk)
+
+
+# Contact form follow-ups
+@task("contact.notify_staff")
+def notify_staff(contact_id):
+    contact = Contact.objects.filter(pk=contact_id).first()
+    if contact is None:
+        return
+    send_mail(
+        f"New contact form message from {contact.name}",
+        render_to_string("emails/contact_notification.txt", {"contact": contact}),
+        settings.DEFAULT_FROM_EMAIL,
+        settings.CONTACT_NOTIFY_EMAILS,
+    )
+
+
+@task("contact.auto_reply")
+def auto_reply(contact_id):
+    contact = Contact.objects.filter(pk=contact_id).first()
+    if contact is None:
+        return
+    send_mail(
+        "Thanks for contacting NexusSphere Solutions",
+        render_to_string("emails/contact_auto_reply.txt", {"contact": contact}),
+        settings.DEFAULT_FROM_EMAIL,
+        [contact.email],
+    )
+
+
+@task("contact.crm_webhook")
+def crm_webhook(contact_id):
+    contact = Contact.objects.filter(pk=contact_id).first()
+    if contact is None:
+        return
+    body = json.dumps({
+        "id": contact.pk,
+        "name": contact.name,
+        "email": contact.email,
+        "company": contact.company,
+        "message": contact.message,
+        "created_at": contact.created_at.isoformat(),
+    }).encode()
+    request = urllib.request.Request(
+        settings.CRM_WEBHOOK_URL, data=body, headers={"Content-Type": "application/json"}, method="POST",
+    )
+    # Any non-2xx status raises HTTPError, which schedules a retry.
+    with urllib.request.urlopen(request, timeout=settings.CRM_WEBHOOK_TIMEOUT):
+        pass
+
+
+# Cached assets
+@task("brochure.rebuild", max_attempts=3)
+def rebuild_brochure():
+    brochure.build()
+
+
+@task("images.generate", max_attempts=3)
+def generate_image_derivatives(model, pk):
+    instance = apps.get_model(model).objects.filter(pk=pk).first()
+    if instance is not None and instance.image:
+        images.generate(images.ImageSource.from_value(instance.image))
+
+
+# Related content
+@task("related.refresh", max_attempts=3)
+def refresh_related(kind, pk, holders=()):
+    related.refresh_for((kind, pk), holders)
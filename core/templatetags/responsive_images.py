@@ -0,0 +1,47 @@
+from django import template
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from core import images
+
+register = template.Library()
+
+
+@register.simple_tag
+def responsive_image(value, alt="", sizes="100vw", **attrs):
+    """Render ``<picture>`` with AVIF/WebP ``srcset`` candidates for an image.
+
+    ``value`` is an ``ImageField`` value or a static path (``"images/logo.png"``);
+    any other keyword becomes an ``<img>`` attribute::
+
+        {% responsive_image project.image alt=project.title sizes="(min-width: 992px) 33vw, 100vw" class="card-img-top" loading="lazy" %}
+
+    Until derivatives exist (see ``core.images``) the original file is used.
+    """
+    source = images.ImageSource.from_value(value)
+    if source is None:
+        return ""
+    manifest = images.manifest_for(source)
+    if manifest is None:
+        return format_html('<img src="{}" alt="{}"{}>', source.url, alt, flatatt(attrs))
+
+    fallback = manifest["variants"][manifest["fallback"]]
+    img_attrs = {
+        "src": images.variant_url(fallback[-1][1]),
+        "srcset": images.srcset(fallback),
+        "sizes": sizes,
+        "alt": alt,
+        **attrs,
+    }
+    sources = [
+        format_html(
+            '<source type="{}" srcset="{}" sizes="{}">',
+            images.MIME_TYPES[image_format], images.srcset(entries), sizes,
+        )
+        for image_format, entries in manifest["variants"].items()
+        if image_format != manifest["fallback"]
+    ]
+    return format_html(
+        "<picture>{}<img{}></picture>", mark_safe("".join(sources)), flatatt(img_attrs),
+    )
@@ -1,7 +1,44 @@
-from django.test import TestCase
+import base64
+import gzip
+import importlib
+import importlib.util
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from io import BytesIO, StringIO
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.template import Context, Template
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
 from django.contrib.auth.models import User
-from .models import Item
+from django.db import connection, router
+from django.test.utils import CaptureQueriesContext
+from prometheus_client import REGISTRY
+from benchmarks import compare as bench_compare, runner as bench_runner, seed as bench_seed, targets as bench_targets
+from . import brochure, images, jobs, perf, query_plans, related, search, signals, sitemaps, spam
+from .cache import bump_model_version, model_version
+from .middleware import ReplicaRoutingMiddleware
+from .smtp_sink import SMTPSink
+from .models import (
+    BlogPost, BlogPostTag, Contact, Item, Job, PortfolioProject, RelatedContent, RelatedPosting, RelatedTerm,
+    Service, Tag, TeamMember, Technology,
+)
 from rest_framework.test import APIClient
 from rest_framework import status
 
@@ -102,3 +139,1399 @@ class ItemAPITests(TestCase):
 from django.test import TestCase
 
 # Create your tests here.
+
+
+class BlogQueryCountTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(username="writer", password="pass")
+
+    def _create_posts(self, count, start=0):
+        for i in range(start, start + count):
+            BlogPost.objects.create(
+                title=f"Post {i}",
+                slug=f"post-{i}",
+                content=f"<p>Body of post {i}</p>",
+                author=self.author,
+                published=True,
+            )
+
+    def _blog_page_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(reverse("core:blog"))
+        self.assertEqual(resp.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_blog_list_query_count_does_not_grow_with_posts(self):
+        self._create_posts(2)
+        small = self._blog_page_queries()
+        self._create_posts(8, start=2)
+        self.assertEqual(self._blog_page_queries(), small)
+
+    def test_blog_list_excludes_unpublished(self):
+        self._create_posts(1)
+        BlogPost.objects.create(title="Draft", slug="draft", content="x", author=self.author)
+        resp = self.client.get(reverse("core:blog"))
+        self.assertContains(resp, "Post 0")
+        self.assertNotContains(resp, "Draft")
+
+    def test_blog_detail_loads_author_in_same_query(self):
+        self._create_posts(1)
+        # Conditional GET validator, post and author, prefetched tags, stored related items.
+        with self.assertNumQueries(4):
+            resp = self.client.get(reverse("core:blog_detail", args=["post-0"]))
+        self.assertContains(resp, "writer")
+
+
+class BlogTextStatsTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(username="writer", password="pass")
+
+    def test_save_computes_excerpt_word_count_and_reading_time(self):
+        body = "<p>" + " ".join(["word"] * 450) + "</p>"
+        post = BlogPost.objects.create(title="Long", slug="long", content=body, author=self.author)
+        self.assertEqual(post.word_count, 450)
+        self.assertEqual(post.reading_minutes, 3)
+        self.assertNotIn("<p>", post.plain_excerpt)
+        self.assertEqual(len(post.plain_excerpt.rstrip("…").split()), BlogPost.EXCERPT_WORDS)
+
+    def test_blog_list_does_not_load_content_column(self):
+        BlogPost.objects.create(
+            title="Card", slug="card", content="<p>Secret body</p>", author=self.author, published=True,
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(reverse("core:blog"))
+        self.assertContains(resp, "Secret body")
+        for query in ctx.captured_queries:
+            self.assertNotIn('"core_blogpost"."content"', query["sql"])
+
+    def test_backfill_command_populates_existing_rows(self):
+        post = BlogPost.objects.create(title="Old", slug="old", content="<b>one two three</b>", author=self.author)
+        BlogPost.objects.filter(pk=post.pk).update(plain_excerpt="", word_count=0)
+        call_command("backfill_blog_text_stats", stdout=StringIO())
+        post.refresh_from_db()
+        self.assertEqual(post.word_count, 3)
+        self.assertEqual(post.plain_excerpt, "one two three")
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(username="writer", password="pass")
+        self.post = BlogPost.objects.create(
+            title="Scaling Django applications",
+            slug="scaling-django",
+            content="<p>Caching and database indexes keep pages fast.</p>",
+            author=self.author,
+            published=True,
+        )
+        self.post.tags.set(Tag.from_string("django, performance"))
+        self.project = PortfolioProject.objects.create(
+            title="Geoscience Data Platform",
+            description="Interactive maps for <survey> data.",
+            expertise="geoscience",
+        )
+        self.project.technologies.set(Technology.from_string("Django, PostGIS"))
+
+    def test_search_ranks_title_matches_and_highlights_snippet(self):
+        resp = self.client.get(reverse("core:search"), {"q": "index"})
+        self.assertEqual(resp.status_code, 200)
+        hits = list(resp.context["results"])
+        self.assertEqual([hit.object for hit in hits], [self.post])
+        self.assertIn("<mark>indexes</mark>", hits[0].snippet)
+
+    def test_search_covers_projects_and_escapes_snippets(self):
+        resp = self.client.get(reverse("core:search"), {"q": "survey"})
+        hits = list(resp.context["results"])
+        self.assertEqual([hit.object for hit in hits], [self.project])
+        self.assertIn("&lt;<mark>survey</mark>&gt;", hits[0].snippet)
+
+    def test_index_follows_publish_state_and_deletes(self):
+        self.post.published = False
+        self.post.save()
+        self.assertEqual(search.search("caching").count(), 0)
+        self.post.published = True
+        self.post.save()
+        self.assertEqual(search.search("caching").count(), 1)
+        self.project.delete()
+        self.assertEqual(search.search("geoscience").count(), 0)
+
+    def test_search_paginates_and_ignores_fts_syntax(self):
+        for i in range(12):
+            BlogPost.objects.create(
+                title=f"Django tip {i}", slug=f"tip-{i}", content="<p>tip</p>",
+                author=self.author, published=True,
+            )
+        resp = self.client.get(reverse("core:search"), {"q": '"tip(', "page": 2})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.context["page_obj"].paginator.count, 12)
+        self.assertEqual(len(resp.context["results"]), 2)
+
+    def _index_rows(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT rowid, kind, object_id FROM {search.INDEX_TABLE} ORDER BY kind")
+            return cursor.fetchall()
+
+    def test_rows_are_keyed_by_rowid_and_rekeyed_by_the_migration(self):
+        expected = [(self.post.pk * 2, "post", self.post.pk), (self.project.pk * 2 + 1, "project", self.project.pk)]
+        self.assertEqual(self._index_rows(), expected)
+        self.post.save()
+        self.assertEqual(self._index_rows(), expected)
+
+        # Rows written before 0013 carry arbitrary rowids.
+        with connection.cursor() as cursor:
+            cursor.execute(f"UPDATE {search.INDEX_TABLE} SET rowid = rowid + 1000")
+            editor = SimpleNamespace(connection=connection, execute=cursor.execute)
+            search.rekey_index(editor)
+        self.assertEqual(self._index_rows(), expected)
+        self.assertEqual(search.search("django").count(), 2)
+
+    def test_through_rows_reindex_their_parent_once_per_transaction(self):
+        tags = Tag.from_string("kubernetes, helm, terraform")
+        with mock.patch.object(search, "index_object", wraps=search.index_object) as index_object:
+            with self.captureOnCommitCallbacks(execute=True):
+                for tag in tags:
+                    BlogPostTag.objects.create(post=self.post, tag=tag)
+                BlogPostTag.objects.filter(post=self.post, tag=tags[0]).delete()
+            self.assertEqual(index_object.call_args_list, [mock.call(self.post)])
+            self.assertEqual(search.search("helm").count(), 1)
+            self.assertEqual(search.search("kubernetes").count(), 0)
+
+            index_object.reset_mock()
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                self.post.delete()
+                self.project.delete()
+            index_object.assert_not_called()
+        self.assertFalse(any(isinstance(callback, signals._OnCommitOnce) for callback in callbacks))
+        self.assertEqual(self._index_rows(), [])
+
+    def test_rebuild_command_reindexes_everything(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {search.INDEX_TABLE}")
+        call_command("rebuild_search_index", stdout=StringIO())
+        self.assertEqual(search.search("django").count(), 2)
+
+
+class TaxonomyTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(username="writer", password="pass")
+
+    def _post(self, slug, tags):
+        post = BlogPost.objects.create(
+            title=slug.title(), slug=slug, content="<p>x</p>", author=self.author, published=True,
+        )
+        post.tags.set(Tag.from_string(tags))
+        return post
+
+    def test_from_string_dedupes_by_name_and_reuses_rows(self):
+        first = Tag.from_string("Django, python , ,django")
+        self.assertEqual([tag.name for tag in first], ["Django", "python"])
+        self.assertEqual(Tag.from_string("DJANGO")[0].pk, first[0].pk)
+
+    def test_from_string_keeps_names_that_slugify_alike_apart(self):
+        terms = Technology.from_string("C, C++, C#, c., 日本語, Ελληνικά")
+        self.assertEqual(
+            [(term.name, term.slug) for term in terms],
+            [("C", "c"), ("C++", "c-plus-plus"), ("C#", "c-sharp"), ("c.", "c-2"),
+             ("日本語", "technology"), ("Ελληνικά", "technology-2")],
+        )
+        long_name = "x" * 60
+        self.assertEqual(len(Tag.from_string(f"{long_name}a, {long_name}b")), 1)
+
+    def test_migration_splits_terms_without_merging_or_dropping_them(self):
+        migration = importlib.import_module("core.migrations.0006_tags_and_technologies")
+        cache = {}
+        terms = migration._terms(Technology, "C, C++, C#, c, 日本語", cache)
+        terms += migration._terms(Technology, f"{'y' * 60}1, {'y' * 60}2, c++", cache)
+        self.assertEqual(
+            [term.slug for term in terms],
+            ["c", "c-plus-plus", "c-sharp", "technology", "y" * 50, "c-plus-plus"],
+        )
+
+    def test_tag_page_lists_only_tagged_posts(self):
+        self._post("tagged", "django, cloud")
+        self._post("untagged", "react")
+        resp = self.client.get(reverse("core:blog_tag", args=["django"]))
+        self.assertEqual([post.slug for post in resp.context["posts"]], ["tagged"])
+        self.assertEqual(self.client.get(reverse("core:blog_tag", args=["missing"])).status_code, 404)
+
+    def test_tag_page_query_count_does_not_grow_with_posts(self):
+        self._post("first", "django")
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(reverse("core:blog_tag", args=["django"]))
+        for i in range(6):
+            self._post(f"more-{i}", "django, extra")
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(reverse("core:blog_tag", args=["django"]))
+        self.assertEqual(len(large.captured_queries), len(small.captured_queries))
+
+    def test_technology_page_lists_matching_projects(self):
+        project = PortfolioProject.objects.create(title="CRM", description="d", expertise="crm")
+        project.technologies.set(Technology.from_string("Django, React"))
+        PortfolioProject.objects.create(title="Other", description="d", expertise="crm")
+        resp = self.client.get(reverse("core:portfolio_technology", args=["react"]))
+        self.assertEqual(list(resp.context["projects"]), [project])
+        self.assertContains(resp, "Projects built with React")
+
+    def test_tag_changes_update_search_index(self):
+        post = self._post("indexed", "")
+        self.assertEqual(search.search("kubernetes").count(), 0)
+        post.tags.add(*Tag.from_string("Kubernetes"))
+        self.assertEqual(search.search("kubernetes").count(), 1)
+
+
+class RelatedContentTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(username="writer", password="pass")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.caching = self._post("caching", "Caching Django pages", "Redis caching keeps Django pages fast.", "django, caching")
+            self.redis = self._post("redis", "Redis for Django caching", "Using Redis as a Django caching backend.", "django, caching")
+            self.hiring = self._post("hiring", "We are hiring designers", "Join our design team in Lagos.", "careers", category="news")
+            self.project = PortfolioProject.objects.create(
+                title="Caching layer for a CRM", description="Redis caching for a Django CRM.", expertise="crm",
+            )
+            self.project.technologies.set(Technology.from_string("Django, Redis"))
+        jobs.run_pending()
+
+    def _post(self, slug, title, body, tags, category="tech"):
+        post = BlogPost.objects.create(
+            title=title, slug=slug, content=f"<p>{body}</p>", author=self.author,
+            category=category, published=True,
+        )
+        post.tags.set(Tag.from_string(tags))
+        return post
+
+    def _targets(self, obj):
+        return [item.target for item in related.related_for(obj)]
+
+    def test_rebuild_ranks_similar_posts_and_projects(self):
+        call_command("rebuild_related_content", stdout=StringIO())
+        targets = self._targets(self.caching)
+        self.assertEqual(targets[0], self.redis)
+        self.assertIn(self.project, targets)
+        self.assertNotIn(self.hiring, targets)
+        self.assertIn(self.caching, self._targets(self.project))
+
+    def test_saving_a_post_refreshes_neighbour_lists(self):
+        related.rebuild_all()
+        with self.captureOnCommitCallbacks(execute=True):
+            newcomer = self._post("cache-tips", "Django caching tips", "More Redis caching for Django.", "django, caching")
+        self.assertEqual(Job.objects.filter(task="related.refresh", status=Job.QUEUED).count(), 1)
+        jobs.run_pending()
+        self.assertIn(newcomer, self._targets(self.caching))
+        self.assertIn(self.caching, self._targets(newcomer))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            newcomer.published = False
+            newcomer.save()
+        jobs.run_pending()
+        self.assertNotIn(newcomer, self._targets(self.caching))
+        self.assertEqual(self._targets(newcomer), [])
+
+    def test_deleting_a_post_refills_lists_that_pointed_at_it(self):
+        related.rebuild_all()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.redis.delete()
+        jobs.run_pending()
+        self.assertEqual(self._targets(self.caching)[0], self.project)
+
+    def test_refresh_job_changes_the_blog_detail_etag(self):
+        related.rebuild_all()
+        url = reverse("core:blog_detail", args=["caching"])
+        with self.captureOnCommitCallbacks(execute=True):
+            self._post("cache-tips", "Django caching tips", "More Redis caching for Django.", "django, caching")
+        before = self.client.get(url)
+        self.assertNotContains(before, "Django caching tips")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            jobs.run_pending()
+        resp = self.client.get(url, HTTP_IF_NONE_MATCH=before["ETag"])
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp["ETag"], before["ETag"])
+        self.assertContains(resp, "Django caching tips")
+
+    def test_refresh_matches_a_full_rebuild(self):
+        related.rebuild_all()
+        with self.captureOnCommitCallbacks(execute=True):
+            newcomer = self._post("cache-tips", "Django caching tips", "More Redis caching for Django.", "django, caching")
+            self.project.description = "Kubernetes hosting for a CRM."
+            self.project.save()
+            self.hiring.delete()
+        jobs.run_pending()
+
+        def stored():
+            return list(RelatedContent.objects.values_list("source_kind", "source_id", "post_id", "project_id", "rank"))
+
+        refreshed = stored()
+        self.assertIn(("post", self.caching.pk, newcomer.pk, None), [row[:4] for row in refreshed])
+        related.rebuild_all()
+        self.assertEqual(refreshed, stored())
+
+    def test_refresh_scores_only_candidates_from_the_stored_statistics(self):
+        related.rebuild_all()
+        post = self._post("cache-tips", "Django caching tips", "More Redis caching for Django.", "django, caching")
+        with mock.patch.object(related, "load_corpus") as load_corpus:
+            related.refresh_for(related.key_for(post))
+        load_corpus.assert_not_called()
+        self.assertEqual(self._targets(post)[0], self.redis)
+        self.assertIn(post, self._targets(self.caching))
+        self.assertEqual(
+            RelatedTerm.objects.get(token="caching").documents,
+            RelatedPosting.objects.filter(token="caching").count(),
+        )
+
+    def test_blog_detail_renders_stored_related_items(self):
+        related.rebuild_all()
+        resp = self.client.get(reverse("core:blog_detail", args=["caching"]))
+        self.assertContains(resp, "Redis for Django caching")
+        self.assertNotContains(resp, "Digital Transformation Strategies for 2024")
+
+
+class PageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Service.objects.create(
+            title="Web Apps", description="Custom web apps", expertise="web_apps", icon="fas fa-globe",
+        )
+
+    def test_anonymous_repeat_request_is_served_from_cache(self):
+        first = self.client.get(reverse("core:services"))
+        self.assertEqual(first["X-Cache"], "MISS")
+        # Only the conditional GET validator query runs; the page itself is not rendered.
+        with self.assertNumQueries(1):
+            second = self.client.get(reverse("core:services"))
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.content, first.content)
+
+    def test_cache_key_varies_on_whitelisted_query_params_only(self):
+        self.client.get(reverse("core:services"), {"type": "web_apps"})
+        self.assertEqual(self.client.get(reverse("core:services"), {"type": "crm"})["X-Cache"], "MISS")
+        resp = self.client.get(reverse("core:services"), {"type": "web_apps", "utm_source": "mail"})
+        self.assertEqual(resp["X-Cache"], "HIT")
+
+    def test_authenticated_users_bypass_page_cache(self):
+        User.objects.create_user(username="staff", password="pass")
+        self.client.get(reverse("core:about"))
+        self.client.login(username="staff", password="pass")
+        resp = self.client.get(reverse("core:about"))
+        self.assertNotIn("X-Cache", resp)
+        self.assertContains(resp, "Logout")
+
+    def test_services_grid_fragment_is_cached(self):
+        User.objects.create_user(username="staff", password="pass")
+        self.client.login(username="staff", password="pass")
+        with CaptureQueriesContext(connection) as cold:
+            self.client.get(reverse("core:services"))
+        with CaptureQueriesContext(connection) as warm:
+            resp = self.client.get(reverse("core:services"))
+        self.assertContains(resp, "Custom web apps")
+        service_queries = [q for q in warm.captured_queries if "core_service" in q["sql"]]
+        self.assertEqual(service_queries, [])
+        self.assertLess(len(warm.captured_queries), len(cold.captured_queries))
+
+
+class CacheInvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_saving_a_model_invalidates_only_pages_that_render_it(self):
+        self.client.get(reverse("core:services"))
+        self.client.get(reverse("core:team"))
+        with self.captureOnCommitCallbacks(execute=True):
+            Service.objects.create(
+                title="Mobile", description="Fresh mobile service", expertise="mobile_apps", icon="fas fa-mobile",
+            )
+        resp = self.client.get(reverse("core:services"))
+        self.assertEqual(resp["X-Cache"], "MISS")
+        self.assertContains(resp, "Fresh mobile service")
+        self.assertEqual(self.client.get(reverse("core:team"))["X-Cache"], "HIT")
+
+    def test_fragment_keys_follow_model_versions(self):
+        User.objects.create_user(username="staff", password="pass")
+        self.client.login(username="staff", password="pass")
+        self.client.get(reverse("core:services"))
+        with self.captureOnCommitCallbacks(execute=True):
+            service = Service.objects.create(
+                title="CRM", description="Original text", expertise="crm", icon="fas fa-users",
+            )
+        self.assertContains(self.client.get(reverse("core:services")), "Original text")
+        with self.captureOnCommitCallbacks(execute=True):
+            service.description = "Edited text"
+            service.save()
+        self.assertContains(self.client.get(reverse("core:services")), "Edited text")
+
+    def test_version_counter_survives_eviction_without_reusing_values(self):
+        before = model_version(Service)
+        cache.delete(f"version:{Service._meta.label_lower}")
+        self.assertGreaterEqual(model_version(Service), before)
+        self.assertEqual(bump_model_version(Service), model_version(Service))
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(username="writer", password="pass")
+        self.post = BlogPost.objects.create(
+            title="Conditional", slug="conditional", content="<p>x</p>", author=self.author, published=True,
+        )
+
+    def _revalidate(self, url, first):
+        return self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=first["ETag"],
+            HTTP_IF_MODIFIED_SINCE=first["Last-Modified"],
+        )
+
+    def test_detail_view_returns_304_for_unchanged_post(self):
+        url = reverse("core:blog_detail", args=["conditional"])
+        first = self.client.get(url)
+        self.assertIn("ETag", first)
+        with self.assertNumQueries(1):
+            second = self._revalidate(url, first)
+        self.assertEqual(second.status_code, 304)
+
+    def test_list_etag_changes_when_rows_change(self):
+        url = reverse("core:blog")
+        first = self.client.get(url)
+        self.assertEqual(self._revalidate(url, first).status_code, 304)
+        BlogPost.objects.create(title="New", slug="new", content="y", author=self.author, published=True)
+        self.assertEqual(self._revalidate(url, first).status_code, 200)
+
+    def test_list_etag_changes_when_tags_change(self):
+        url = reverse("core:blog")
+        first = self.client.get(url)
+        post = BlogPost.objects.get(slug="conditional")
+        with self.captureOnCommitCallbacks(execute=True):
+            post.tags.set(Tag.from_string("kubernetes"))
+        self.assertEqual(BlogPost.objects.get(pk=post.pk).updated_at, post.updated_at)
+        self.assertEqual(self._revalidate(url, first).status_code, 200)
+
+    def test_list_etag_varies_with_filters(self):
+        first = self.client.get(reverse("core:portfolio"))
+        resp = self.client.get(
+            reverse("core:portfolio"), {"expertise": "crm"}, HTTP_IF_NONE_MATCH=first["ETag"],
+        )
+        self.assertEqual(resp.status_code, 200)
+
+    def test_cached_marketing_pages_are_revalidated(self):
+        Service.objects.create(title="Web", description="d", expertise="web_apps", icon="fas fa-globe")
+        TeamMember.objects.create(name="Ada", position="CTO")
+        for name in ("core:services", "core:team"):
+            url = reverse(name)
+            first = self.client.get(url)
+            self.assertIn("Last-Modified", first)
+            self.assertEqual(self._revalidate(url, first).status_code, 304)
+
+    def test_authenticated_requests_get_no_validators(self):
+        self.client.login(username="writer", password="pass")
+        resp = self.client.get(reverse("core:blog_detail", args=["conditional"]))
+        self.assertNotIn("ETag", resp)
+
+
+class BrochureTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        overrides = self.settings(BROCHURE_ROOT=self.root)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        Service.objects.create(
+            title="Geo Platform", description="Maps", expertise="geoscience", icon="fas fa-globe",
+            features=["Survey import"],
+        )
+
+    def test_brochure_is_rendered_once_and_reused(self):
+        first = self.client.get(reverse("core:brochure"))
+        self.assertEqual(first["Content-Type"], "application/pdf")
+        body = b"".join(first.streaming_content)
+        self.assertTrue(body.startswith(b"%PDF"))
+        with mock.patch.object(brochure, "render_pdf") as render:
+            second = self.client.get(reverse("core:brochure"))
+        render.assert_not_called()
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertEqual(len(list(Path(self.root).glob("brochure-*.pdf"))), 1)
+
+    def test_unchanged_brochure_returns_304(self):
+        etag = self.client.get(reverse("core:brochure"))["ETag"]
+        resp = self.client.get(reverse("core:brochure"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 304)
+
+    def test_range_requests(self):
+        full = b"".join(self.client.get(reverse("core:brochure")).streaming_content)
+        resp = self.client.get(reverse("core:brochure"), HTTP_RANGE="bytes=0-9")
+        self.assertEqual(resp.status_code, 206)
+        self.assertEqual(resp.content, full[:10])
+        self.assertEqual(resp["Content-Range"], f"bytes 0-9/{len(full)}")
+        resp = self.client.get(reverse("core:brochure"), HTTP_RANGE="bytes=-5")
+        self.assertEqual(resp.content, full[-5:])
+        resp = self.client.get(reverse("core:brochure"), HTTP_RANGE=f"bytes={len(full)}-")
+        self.assertEqual(resp.status_code, 416)
+        resp = self.client.get(reverse("core:brochure"), HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"stale"')
+        self.assertEqual(resp.status_code, 200)
+
+    def test_service_changes_queue_one_rebuild(self):
+        etag = self.client.get(reverse("core:brochure"))["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Service.objects.create(title="CRM", description="d", expertise="crm", icon="fas fa-users")
+        with self.captureOnCommitCallbacks(execute=True):
+            Service.objects.filter(title="CRM").first().save()
+        self.assertEqual(Job.objects.filter(task="brochure.rebuild", status=Job.QUEUED).count(), 1)
+
+        self.assertEqual(jobs.run_pending(), 1)
+        with mock.patch.object(brochure, "render_pdf") as render:
+            resp = self.client.get(reverse("core:brochure"), HTTP_IF_NONE_MATCH=etag)
+        render.assert_not_called()
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp["ETag"], etag)
+
+    def test_superseded_brochure_is_kept_for_the_retention_period(self):
+        old_path, _ = brochure.build()
+        Service.objects.create(title="CRM", description="d", expertise="crm", icon="fas fa-users")
+        new_path, _ = brochure.build()
+        # A download that looked up the old digest just before the rebuild can still open it.
+        self.assertTrue(old_path.exists())
+
+        replaced_at = time.time() - settings.BROCHURE_RETENTION_SECONDS - 60
+        os.utime(old_path, (replaced_at - 3600, replaced_at - 3600))
+        os.utime(new_path, (replaced_at, replaced_at))
+        Service.objects.create(title="LMS", description="d", expertise="enterprise_saas", icon="fas fa-book")
+        newest, _ = brochure.build()
+        self.assertFalse(old_path.exists())
+        self.assertEqual(sorted(Path(self.root).glob("brochure-*.pdf")), sorted([new_path, newest]))
+
+    def test_brochure_reused_after_a_revert_counts_as_current(self):
+        first, _ = brochure.build()
+        crm = Service.objects.create(title="CRM", description="d", expertise="crm", icon="fas fa-users")
+        second, _ = brochure.build()
+        long_ago = time.time() - settings.BROCHURE_RETENTION_SECONDS - 3600
+        os.utime(first, (long_ago, long_ago))
+        os.utime(second, (long_ago + 60, long_ago + 60))
+
+        crm.delete()
+        with mock.patch.object(brochure, "render_pdf") as render:
+            self.assertEqual(brochure.build()[0], first)
+        render.assert_not_called()
+        Service.objects.create(title="LMS", description="d", expertise="enterprise_saas", icon="fas fa-book")
+        brochure.build()
+        # ``first`` was served until this build, so it is kept for the retention period.
+        self.assertTrue(first.exists())
+
+
+class ImageDerivativeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        overrides = self.settings(
+            MEDIA_ROOT=self.root, IMAGE_DERIVATIVES_ROOT=Path(self.root) / "derivatives",
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+    def _upload(self, size=(700, 400)):
+        from PIL import Image
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        buffer = BytesIO()
+        Image.new("RGB", size, "navy").save(buffer, format="PNG")
+        return SimpleUploadedFile("shot.png", buffer.getvalue(), content_type="image/png")
+
+    def _render(self, value):
+        template = Template('{% load responsive_images %}{% responsive_image value alt="Shot" class="w-100" %}')
+        return template.render(Context({"value": value}))
+
+    def test_upload_generates_resized_variants_without_upscaling(self):
+        project = PortfolioProject.objects.create(
+            title="Maps", description="d", expertise="geoscience", image=self._upload(),
+        )
+        project.save()
+        source = images.ImageSource.from_value(project.image)
+        self.assertEqual(Job.objects.filter(task="images.generate", status=Job.QUEUED).count(), 1)
+        self.assertIsNone(images.manifest_for(source))
+
+        self.assertEqual(jobs.run_pending(), 1)
+        manifest = images.manifest_for(source)
+        self.assertEqual(manifest["fallback"], "jpeg")
+        self.assertEqual([width for width, _ in manifest["variants"]["webp"]], [320, 640, 700])
+        for entries in manifest["variants"].values():
+            for _, name in entries:
+                self.assertTrue((Path(self.root) / "derivatives" / name).exists())
+
+        html = self._render(project.image)
+        self.assertIn('<source type="image/webp"', html)
+        self.assertIn("640w", html)
+        self.assertIn('class="w-100"', html)
+
+    def test_missing_derivatives_fall_back_to_the_original(self):
+        html = self._render("images/logo.png")
+        self.assertEqual(html, '<img src="/static/images/logo.png" alt="Shot" class="w-100">')
+
+
+def contact_form_data(**overrides):
+    """A contact-form POST that passes the spam checks."""
+    data = {
+        "name": "Grace", "email": "grace@example.com", "company": "Navy", "message": "Need a CRM.",
+        "form_token": spam.make_form_token(issued_at=time.time() - 60),
+    }
+    data.update(overrides)
+    return data
+
+
+class JobQueueTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _submit(self):
+        return self.client.post(reverse("core:contact"), contact_form_data())
+
+    def test_contact_form_queues_followups_instead_of_sending_mail(self):
+        resp = self._submit()
+        self.assertRedirects(resp, reverse("core:contact"))
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(
+            sorted(Job.objects.values_list("task", flat=True)), ["contact.auto_reply", "contact.notify_staff"],
+        )
+
+    def test_worker_delivers_mail_over_smtp(self):
+        self._submit()
+        with SMTPSink() as sink, self.settings(
+            EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+            EMAIL_HOST=sink.host, EMAIL_PORT=sink.port,
+        ):
+            call_command("runworker", "--once", stdout=StringIO())
+        self.assertEqual(Job.objects.filter(status=Job.DONE).count(), 2)
+        by_recipient = {tuple(message.recipients): message for message in sink.messages}
+        # Nothing the visitor typed is mailed back to the address they typed.
+        reply = by_recipient[("grace@example.com",)].body
+        self.assertNotIn("Need a CRM.", reply)
+        self.assertNotIn("Grace", reply)
+        self.assertIn("Grace", by_recipient[("info@nexusspheresolutions.com",)]["Subject"])
+
+    def test_failures_are_retried_with_backoff_then_given_up(self):
+        self._submit()
+        Job.objects.exclude(task="contact.auto_reply").delete()
+        with mock.patch("core.tasks.send_mail", side_effect=OSError("relay down")), \
+                self.assertLogs("core.jobs", level="WARNING"):
+            self.assertEqual(jobs.run_pending(), 1)
+            job = Job.objects.get()
+            self.assertEqual((job.status, job.attempts), (Job.QUEUED, 1))
+            self.assertIn("relay down", job.last_error)
+            self.assertGreater(job.run_after, timezone.now())
+            # Not ready yet, so nothing runs.
+            self.assertEqual(jobs.run_pending(), 0)
+
+            Job.objects.update(attempts=job.max_attempts - 1, run_after=timezone.now())
+            jobs.run_pending()
+        self.assertEqual(Job.objects.get().status, Job.FAILED)
+
+    def test_malformed_email_is_rejected_before_anything_is_queued(self):
+        for email in ("not-an-email", "a@example.com, victim@example.com", "a@example.com\nBcc: victim@example.com"):
+            resp = self.client.post(reverse("core:contact"), contact_form_data(email=email))
+            self.assertContains(resp, "Please enter a valid email address.")
+        self.assertFalse(Contact.objects.exists())
+        self.assertFalse(Job.objects.exists())
+
+    def test_claimed_jobs_are_not_handed_to_a_second_worker(self):
+        self._submit()
+        self.assertEqual(len(jobs.claim(10, "worker-a")), 2)
+        self.assertEqual(jobs.claim(10, "worker-b"), [])
+
+
+class ContactBulkAPITests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(username="staff", password="pass", is_staff=True)
+        self.client = APIClient()
+        self.client.login(username="staff", password="pass")
+
+    def test_bulk_insert_reports_invalid_rows_by_index(self):
+        rows = [{"name": f"Lead {i}", "email": f"lead{i}@example.com", "message": "Hi"} for i in range(1200)]
+        rows[3]["email"] = "not-an-email"
+        rows[7] = "garbage"
+        resp = self.client.post("/api/contacts/bulk/", rows, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(resp.data["created"], 1198)
+        self.assertEqual([error["index"] for error in resp.data["errors"]], [3, 7])
+        self.assertIn("email", resp.data["errors"][0]["errors"])
+        self.assertEqual(Contact.objects.count(), 1198)
+
+    def test_bulk_insert_requires_staff(self):
+        User.objects.create_user(username="member", password="pass")
+        self.client.login(username="member", password="pass")
+        resp = self.client.post("/api/contacts/bulk/", [], format="json")
+        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_export_streams_csv_and_ndjson(self):
+        Contact.objects.create(name="Ada", email="ada@example.com", message="=HYPERLINK()")
+        Contact.objects.create(name="Bob", email="bob@example.com", message="Hello")
+
+        resp = self.client.get("/api/contacts/export/")
+        self.assertTrue(resp.streaming)
+        lines = b"".join(resp.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], "id,name,email,company,message,created_at")
+        self.assertEqual(len(lines), 3)
+        self.assertIn("'=HYPERLINK()", lines[1])
+
+        resp = self.client.get("/api/contacts/export/", {"as": "ndjson"})
+        records = [json.loads(line) for line in b"".join(resp.streaming_content).splitlines()]
+        self.assertEqual([record["name"] for record in records], ["Ada", "Bob"])
+
+    def test_admin_action_exports_selected_contacts(self):
+        keep = Contact.objects.create(name="Ada", email="ada@example.com", message="Hi")
+        Contact.objects.create(name="Bob", email="bob@example.com", message="Hi")
+        self.staff.is_superuser = True
+        self.staff.save()
+        self.client.force_login(self.staff)
+        resp = self.client.post(
+            reverse("admin:core_contact_changelist"),
+            {"action": "export_ndjson", "_selected_action": [keep.pk]},
+        )
+        records = [json.loads(line) for line in b"".join(resp.streaming_content).splitlines()]
+        self.assertEqual([record["email"] for record in records], ["ada@example.com"])
+
+
+class SpamFilterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _post(self, **overrides):
+        return self.client.post(reverse("core:contact"), contact_form_data(**overrides))
+
+    def test_genuine_message_is_stored_and_followed_up(self):
+        self.assertRedirects(self._post(), reverse("core:contact"))
+        contact = Contact.objects.get()
+        self.assertFalse(contact.quarantined)
+        self.assertTrue(Job.objects.exists())
+
+    def test_honeypot_and_obvious_spam_are_dropped_silently(self):
+        self.assertRedirects(self._post(website="http://bots.example"), reverse("core:contact"))
+        resp = self._post(
+            email="seo@example.com",
+            message="Cheap backlinks! Guest post and link building, click here http://a.example http://b.example",
+        )
+        self.assertRedirects(resp, reverse("core:contact"))
+        self.assertFalse(Contact.objects.exists())
+        self.assertEqual(spam.counters()[spam.HONEYPOT], 1)
+        self.assertEqual(spam.counters()[spam.SPAM], 1)
+
+    def test_ip_limit_uses_forwarded_address_behind_trusted_proxies(self):
+        def ip(forwarded, proxies):
+            request = RequestFactory().post("/", HTTP_X_FORWARDED_FOR=forwarded, REMOTE_ADDR="10.0.0.1")
+            with self.settings(SPAM_TRUSTED_PROXY_COUNT=proxies):
+                return spam.client_ip(request)
+
+        self.assertEqual(ip("203.0.113.7", 0), "10.0.0.1")
+        self.assertEqual(ip("1.2.3.4, 203.0.113.7", 1), "203.0.113.7")  # leftmost entry is client-supplied
+        self.assertEqual(ip("1.2.3.4, 203.0.113.7, 10.0.0.9", 2), "203.0.113.7")
+        self.assertEqual(ip("", 1), "10.0.0.1")
+
+        with self.settings(SPAM_TRUSTED_PROXY_COUNT=1):
+            for n in range(6):
+                resp = self.client.post(
+                    reverse("core:contact"), contact_form_data(email=f"visitor{n}@example.com"),
+                    HTTP_X_FORWARDED_FOR=f"203.0.113.{n}",
+                )
+                self.assertRedirects(resp, reverse("core:contact"))
+        self.assertEqual(Contact.objects.count(), 6)
+
+    def test_borderline_message_is_quarantined_without_emails(self):
+        self._post(message="We offer SEO services to improve your rankings and traffic.")
+        contact = Contact.objects.get()
+        self.assertTrue(contact.quarantined)
+        self.assertFalse(Job.objects.exists())
+
+    def test_missing_forged_or_too_fast_tokens_are_rejected(self):
+        for token in ("", "123:forged", spam.make_form_token()):
+            resp = self._post(form_token=token)
+            self.assertEqual(resp.status_code, 400)
+            self.assertContains(resp, "Need a CRM.", status_code=400)
+        self.assertFalse(Contact.objects.exists())
+
+    def test_replayed_token_is_rejected(self):
+        data = contact_form_data()
+        self.assertRedirects(self.client.post(reverse("core:contact"), data), reverse("core:contact"))
+        resp = self.client.post(reverse("core:contact"), {**data, "email": "other@example.com"})
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(Contact.objects.count(), 1)
+        self.assertEqual(spam.counters()[spam.BAD_TOKEN], 1)
+
+    def test_rate_limits_per_email_and_ip(self):
+        with self.settings(CONTACT_RATE_LIMITS={"ip": (10, 3600), "email": (2, 3600)}):
+            self._post()
+            self._post()
+            resp = self._post()
+            self.assertEqual(resp.status_code, 429)
+            self.assertIn("Retry-After", resp)
+            self.assertEqual(self._post(email="other@example.com").status_code, 302)
+        cache.clear()
+        with self.settings(CONTACT_RATE_LIMITS={"ip": (2, 3600), "email": (10, 3600)}):
+            self.assertEqual(self._post(email="a@example.com").status_code, 302)
+            self.assertEqual(self._post(email="b@example.com").status_code, 302)
+            self.assertEqual(self._post(email="c@example.com").status_code, 429)
+        self.assertEqual(Contact.objects.count(), 5)
+
+    def test_token_bucket_refills_over_time(self):
+        self.assertEqual(spam.take_token("test", "x", 1, 60, now=1000), 0)
+        self.assertAlmostEqual(spam.take_token("test", "x", 1, 60, now=1030), 30)
+        self.assertEqual(spam.take_token("test", "x", 1, 60, now=1060), 0)
+
+    def test_spam_stats_endpoint(self):
+        self._post()
+        self._post(website="filled")
+        User.objects.create_user(username="staff", password="pass", is_staff=True)
+        client = APIClient()
+        client.login(username="staff", password="pass")
+        resp = client.get("/api/contacts/spam-stats/")
+        self.assertEqual(resp.data["submitted"], 2)
+        self.assertEqual(resp.data["rejection_rate"], 0.5)
+
+
+def load_settings(**environ):
+    """A fresh copy of ``config.settings`` evaluated under ``environ``."""
+    environ = {**{name: value for name, value in os.environ.items() if not name.startswith("DJANGO_DB_")}, **environ}
+    spec = importlib.util.spec_from_file_location("fresh_settings", Path(settings.BASE_DIR) / "config" / "settings.py")
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(os.environ, environ, clear=True):
+        spec.loader.exec_module(module)
+    return module
+
+
+class SQLiteBackendTests(TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = str(Path(directory) / "db.sqlite3")
+        self.wrapper = self._wrapper(DJANGO_DB_NAME=self.path)
+
+    def _wrapper(self, **environ):
+        from core.backends.sqlite3.base import DatabaseWrapper
+
+        settings_dict = {**connection.settings_dict, **load_settings(**environ).DATABASES["default"], "NAME": self.path}
+        wrapper = DatabaseWrapper(settings_dict, alias="sqlite-test")
+        self.addCleanup(wrapper.close)
+        return wrapper
+
+    def test_new_connections_use_wal(self):
+        with self.wrapper.cursor() as cursor:
+            cursor.execute("PRAGMA journal_mode")
+            self.assertEqual(cursor.fetchone()[0], "wal")
+            cursor.execute("PRAGMA synchronous")
+            self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+
+    def test_bundled_database_keeps_its_journal_mode(self):
+        self.assertNotIn("WAL", load_settings().DATABASES["default"]["OPTIONS"]["init_command"])
+        with self._wrapper(DJANGO_DB_WAL="0").cursor() as cursor:
+            cursor.execute("PRAGMA journal_mode")
+            self.assertEqual(cursor.fetchone()[0], "delete")
+
+    def test_transactions_take_the_write_lock_up_front(self):
+        self.wrapper.ensure_connection()
+        self.wrapper._start_transaction_under_autocommit()
+        other = sqlite3.connect(self.path, timeout=0)
+        self.addCleanup(other.close)
+        with self.assertRaisesMessage(sqlite3.OperationalError, "database is locked"):
+            other.execute("BEGIN IMMEDIATE")
+        self.wrapper.connection.rollback()
+
+
+class ReplicaRoutingTests(TestCase):
+    def setUp(self):
+        overrides = self.settings(DATABASE_REPLICAS=["replica1"])
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.factory = RequestFactory()
+
+    def _serve(self, request, write=False):
+        seen = {}
+
+        def view(request):
+            seen["read"] = router.db_for_read(Service)
+            if write:
+                seen["write"] = router.db_for_write(Contact)
+            return HttpResponse()
+
+        response = ReplicaRoutingMiddleware(view)(request)
+        return seen, response
+
+    def test_public_reads_use_a_replica(self):
+        seen, response = self._serve(self.factory.get("/services/"))
+        self.assertEqual(seen["read"], "replica1")
+        self.assertNotIn("db_primary", response.cookies)
+
+    def test_unsafe_and_admin_requests_use_the_primary(self):
+        self.assertEqual(self._serve(self.factory.post("/contact/"))[0]["read"], "default")
+        self.assertEqual(self._serve(self.factory.get("/admin/core/contact/"))[0]["read"], "default")
+        self.assertEqual(router.db_for_read(Service), "default")  # Outside a request.
+
+    def test_client_reads_its_own_writes(self):
+        seen, response = self._serve(self.factory.post("/contact/"), write=True)
+        self.assertEqual(seen["write"], "default")
+        self.assertEqual(response.cookies["db_primary"]["max-age"], settings.REPLICA_STICKY_SECONDS)
+
+        request = self.factory.get("/services/")
+        request.COOKIES["db_primary"] = "1"
+        self.assertEqual(self._serve(request)[0]["read"], "default")
+
+
+class StaticAssetTests(TestCase):
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        overrides = self.settings(
+            STATIC_ROOT=root,
+            STORAGES={**settings.STORAGES, "staticfiles": {"BACKEND": settings.STATIC_STORAGE_BACKENDS["manifest"]}},
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        # Only the project's own assets; the admin and DRF files make no difference here.
+        call_command("collectstatic", interactive=False, verbosity=0, ignore_patterns=["admin", "rest_framework"])
+        self.url = staticfiles_storage.url("css/style.css")
+
+    def test_templates_link_hashed_names(self):
+        self.assertRegex(self.url, r"^/static/css/style\.[0-9a-f]{12}\.css$")
+        self.assertContains(self.client.get(reverse("core:about")), self.url)
+
+    def test_serves_precompressed_variant_the_client_accepts(self):
+        original = (settings.BASE_DIR / "static" / "css" / "style.css").read_bytes()
+        resp = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(resp["Content-Encoding"], "br")
+        self.assertEqual(resp["Cache-Control"], "public, max-age=31536000, immutable")
+        self.assertEqual(resp["Vary"], "Accept-Encoding")
+
+        resp = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(resp["Content-Encoding"], "gzip")
+        body = gzip.decompress(b"".join(resp.streaming_content))
+        self.assertIn(b"url(", body)
+        self.assertLess(int(resp["Content-Length"]), len(original))
+
+        resp = self.client.get(self.url)
+        self.assertFalse(resp.has_header("Content-Encoding"))
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=resp["ETag"]).status_code, 304)
+
+    def test_unhashed_names_get_a_short_lifetime(self):
+        resp = self.client.get("/static/css/style.css")
+        self.assertEqual(resp["Cache-Control"], f"public, max-age={settings.STATIC_MAX_AGE}")
+        self.assertEqual(self.client.get("/static/css/missing.css").status_code, 404)
+
+
+class SitemapTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        author = User.objects.create_user(username="writer", password="pass")
+        for i in range(3):
+            BlogPost.objects.create(title=f"Post {i}", slug=f"post-{i}", content="x", author=author, published=True)
+        BlogPost.objects.create(title="Draft", slug="draft", content="x", author=author)
+        self.project = PortfolioProject.objects.create(title="CRM", description="d", expertise="crm")
+        patcher = mock.patch.object(sitemaps.BlogSitemap, "limit", 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_index_lists_each_page_of_each_section(self):
+        resp = self.client.get("/sitemap.xml")
+        self.assertEqual(resp["Content-Type"], "application/xml")
+        for name in ("static-1", "portfolio-1", "blog-1", "blog-2"):
+            self.assertContains(resp, f"http://testserver/sitemap-{name}.xml")
+        self.assertNotContains(resp, "sitemap-blog-3.xml")
+
+    def test_sections_list_published_posts_and_project_pages(self):
+        first = self.client.get("/sitemap-blog-1.xml").content.decode()
+        second = self.client.get("/sitemap-blog-2.xml").content.decode()
+        self.assertEqual((first + second).count("<url>"), 3)
+        self.assertNotIn("/blog/draft/", first + second)
+        self.assertContains(self.client.get("/sitemap-portfolio-1.xml"), f"/portfolio/{self.project.pk}/")
+        self.assertEqual(self.client.get("/sitemap-blog-3.xml").status_code, 404)
+        self.assertEqual(self.client.get("/sitemap-team-1.xml").status_code, 404)
+
+    def test_last_modified_comes_from_newest_post(self):
+        newest = BlogPost.objects.published().latest("updated_at")
+        resp = self.client.get("/sitemap-blog-1.xml")
+        self.assertEqual(resp["Last-Modified"], http_date(newest.updated_at.timestamp()))
+        resp = self.client.get("/sitemap-blog-1.xml", HTTP_IF_MODIFIED_SINCE=resp["Last-Modified"])
+        self.assertEqual(resp.status_code, 304)
+
+    def test_saving_one_section_keeps_the_others_cached(self):
+        self.client.get("/sitemap-blog-1.xml")
+        self.client.get("/sitemap-portfolio-1.xml")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.save()
+        self.assertEqual(self.client.get("/sitemap-blog-1.xml")["X-Cache"], "HIT")
+        self.assertEqual(self.client.get("/sitemap-portfolio-1.xml")["X-Cache"], "MISS")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/sitemap-blog-1.xml")["X-Cache"], "HIT")
+
+
+class FeedTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        author = User.objects.create_user(username="writer", password="pass", first_name="Ada", last_name="L")
+        self.news = BlogPost.objects.create(
+            title="Launch news", slug="launch", content="<p>We launched.</p>", author=author,
+            category="news", published=True,
+        )
+        self.news.tags.add(*Tag.from_string("Django"))
+        BlogPost.objects.create(
+            title="Tutorial", slug="tutorial", content="<p>How to.</p>", author=author, category="tutorial", published=True,
+        )
+        BlogPost.objects.create(title="Secret draft", slug="draft", content="x", author=author)
+
+    def test_rss_and_atom_list_published_posts(self):
+        resp = self.client.get(reverse("core:blog_feed_rss"))
+        self.assertEqual(resp["Content-Type"], "application/rss+xml; charset=utf-8")
+        self.assertContains(resp, "Launch news")
+        self.assertContains(resp, "Tutorial")
+        self.assertNotContains(resp, "Secret draft")
+        resp = self.client.get(reverse("core:blog_feed_atom"))
+        self.assertContains(resp, "<author><name>Ada L</name></author>")
+
+    def test_category_and_tag_feeds(self):
+        resp = self.client.get(reverse("core:blog_category_feed_atom", args=["tutorial"]))
+        self.assertContains(resp, "Tutorial")
+        self.assertNotContains(resp, "Launch news")
+        resp = self.client.get(reverse("core:blog_tag_feed_rss", args=["django"]))
+        self.assertContains(resp, "Launch news")
+        self.assertNotContains(resp, "<title>Tutorial</title>")
+        self.assertEqual(self.client.get(reverse("core:blog_tag_feed_rss", args=["missing"])).status_code, 404)
+        self.assertEqual(self.client.get(reverse("core:blog_category_feed_rss", args=["missing"])).status_code, 404)
+
+    def test_polling_costs_one_query(self):
+        url = reverse("core:blog_feed_rss")
+        first = self.client.get(url)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 304)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(url).content, first.content)
+
+        self.news.title = "Launch news, updated"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.news.save()
+        resp = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(resp.status_code, 200)
+        self.assertContains(resp, "Launch news, updated")
+
+
+class PerfInstrumentationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        perf.reset()
+        self.addCleanup(perf.reset)
+        Service.objects.create(title="Web Apps", description="d", expertise="web_apps", icon="fas fa-globe")
+
+    def test_server_timing_and_log_line(self):
+        with self.assertLogs("core.perf", "INFO") as logs:
+            resp = self.client.get(reverse("core:services"))
+        self.assertRegex(resp["Server-Timing"], r'^db;dur=[\d.]+;desc="\d+ queries", tpl;dur=[\d.]+, total;dur=[\d.]+$')
+        self.assertIn("view=core:services method=GET status=200", logs.output[0])
+
+    def test_repeated_selects_are_flagged(self):
+        stats, token = perf.start()
+        try:
+            with connection.execute_wrapper(perf.record_query):
+                for pk in range(6):
+                    list(Service.objects.filter(pk=pk))
+        finally:
+            perf.stop(token)
+        self.assertEqual(stats.queries, 6)
+        self.assertEqual(list(stats.repeated_statements().values()), [6])
+
+    def test_perf_page_is_staff_only_and_lists_views(self):
+        self.client.get(reverse("core:services"))
+        self.client.get(reverse("core:services"))
+        self.assertEqual(self.client.get("/__perf__/").status_code, 302)
+
+        User.objects.create_user(username="staff", password="pass", is_staff=True)
+        self.client.login(username="staff", password="pass")
+        resp = self.client.get("/__perf__/")
+        row = next(row for row in resp.context["rows"] if row["view"] == "core:services")
+        self.assertEqual(row["requests"], 2)
+        self.assertLessEqual(row["p50"], row["p99"])
+        self.assertContains(resp, "<code>core:services</code>", html=True)
+
+
+class MetricsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Service.objects.create(title="Web Apps", description="d", expertise="web_apps", icon="fas fa-globe")
+
+    def _sample(self, name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0.0
+
+    def test_requests_queries_and_page_cache_are_counted(self):
+        labels = {"view": "core:services", "status": "200"}
+        requests = self._sample("nexussphere_http_request_duration_seconds_count", **labels)
+        queries = self._sample("nexussphere_db_queries_total", view="core:services")
+        hits = self._sample("nexussphere_cache_lookups_total", cache="page", result="hit")
+        self.client.get(reverse("core:services"))
+        self.client.get(reverse("core:services"))
+
+        self.assertEqual(self._sample("nexussphere_http_request_duration_seconds_count", **labels), requests + 2)
+        self.assertGreater(self._sample("nexussphere_db_queries_total", view="core:services"), queries)
+        self.assertEqual(self._sample("nexussphere_cache_lookups_total", cache="page", result="hit"), hits + 1)
+
+        resp = self.client.get(reverse("metrics"))
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp["Content-Type"].startswith("text/plain"))
+        self.assertIn(
+            b'nexussphere_http_request_duration_seconds_bucket{le="+Inf",status="200",view="core:services"}',
+            resp.content,
+        )
+
+    def test_contact_outcomes_and_brochure_downloads_are_counted(self):
+        honeypot = self._sample("nexussphere_contact_submissions_total", outcome=spam.HONEYPOT)
+        self.client.post(reverse("core:contact"), contact_form_data(website="http://bots.example"))
+        self.assertEqual(self._sample("nexussphere_contact_submissions_total", outcome=spam.HONEYPOT), honeypot + 1)
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        downloads = self._sample("nexussphere_brochure_downloads_total")
+        with self.settings(BROCHURE_ROOT=root):
+            etag = self.client.get(reverse("core:brochure"))["ETag"]
+            self.client.get(reverse("core:brochure"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self._sample("nexussphere_brochure_downloads_total"), downloads + 1)
+
+    def test_token_is_required_when_configured(self):
+        with self.settings(METRICS_TOKEN="s3cret"):
+            self.assertEqual(self.client.get(reverse("metrics")).status_code, 403)
+            resp = self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer s3cret")
+        self.assertEqual(resp.status_code, 200)
+
+    def test_multiprocess_scrape_sums_every_worker(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": directory, "DJANGO_SETTINGS_MODULE": "config.settings"}
+        worker = "import django; django.setup(); from core import metrics; metrics.BROCHURE_DOWNLOADS.inc()"
+        for _ in range(2):
+            subprocess.run([sys.executable, "-c", worker], cwd=settings.BASE_DIR, env=env, check=True)
+
+        with mock.patch.dict(os.environ, {"PROMETHEUS_MULTIPROC_DIR": directory}):
+            resp = self.client.get(reverse("metrics"))
+        self.assertIn(b"nexussphere_brochure_downloads_total 2.0", resp.content)
+
+
+class BenchmarkTests(TestCase):
+    VOLUMES = {"posts": 6, "projects": 3, "contacts": 4, "items": 5}
+
+    def setUp(self):
+        cache.clear()
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        overrides = self.settings(BROCHURE_ROOT=root)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+    def test_seed_tops_up_to_the_requested_volumes(self):
+        bench_seed.seed(self.VOLUMES)
+        bench_seed.seed(dict(self.VOLUMES, posts=8))
+        self.assertEqual(BlogPost.objects.count(), 8)
+        self.assertEqual(Item.objects.count(), 5)
+        post = BlogPost.objects.first()
+        self.assertTrue(post.plain_excerpt)
+        self.assertEqual(post.tags.count(), 3)
+
+    def test_client_run_covers_every_target_without_errors(self):
+        bench_seed.seed(self.VOLUMES)
+        results = bench_runner.run("client", bench_targets.resolve(), requests=3)
+        self.assertEqual(set(results), set(bench_targets.TARGETS))
+        for name, row in results.items():
+            self.assertEqual(row["errors"], 0, name)
+            self.assertEqual(row["requests"], 3)
+            self.assertLessEqual(row["p50_ms"], row["p99_ms"])
+
+    def test_compare_reports_slowdowns_beyond_threshold_and_errors(self):
+        def document(p50=5.0, p95=20.0, rps=100.0, errors=0):
+            row = {"requests": 100, "errors": errors, "throughput_rps": rps, "p50_ms": p50, "p95_ms": p95, "p99_ms": p95}
+            return {"results": {"wsgi": {"blog_list": row}}}
+
+        baseline = document()
+        self.assertEqual(bench_compare.compare(document(p95=23.0, rps=95.0), baseline, threshold=0.2), [])
+        self.assertEqual(
+            bench_compare.compare(document(p95=30.0, rps=60.0), baseline, threshold=0.2),
+            ["wsgi blog_list: p95_ms 20.0 -> 30.0", "wsgi blog_list: throughput 100.0 -> 60.0 req/s"],
+        )
+        # Doubling a sub-millisecond cache hit is timer noise, not a regression.
+        fast = document(p50=0.2, p95=0.4, rps=2000.0)
+        self.assertEqual(bench_compare.compare(fast, document(p50=0.1, p95=0.2, rps=4000.0)), [])
+        # Failed requests fail the run even without a baseline.
+        self.assertEqual(bench_compare.compare(document(errors=2), None), ["wsgi blog_list: 2 of 100 requests failed"])
+
+
+class QueryPlanTests(TestCase):
+    def test_every_list_query_uses_an_index(self):
+        out = StringIO()
+        call_command("check_query_plans", stdout=out)
+        self.assertIn("use an index", out.getvalue())
+
+    def test_unindexed_filter_is_reported(self):
+        scans = query_plans.full_scans(Contact.objects.filter(message="hello"))
+        self.assertEqual(len(scans), 1)
+        self.assertIn("core_contact", scans[0])
+
+
+class ItemBulkAPITests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner", password="pass")
+        self.other = User.objects.create_user(username="other", password="pass")
+        self.client = APIClient()
+        self.client.login(username="owner", password="pass")
+
+    def test_bulk_create_sets_owner_and_reports_invalid_rows(self):
+        rows = [{"name": f"Item {i}"} for i in range(5)]
+        rows[2] = {"description": "no name"}
+        resp = self.client.post("/api/items/bulk/", rows, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(resp.data["created"]), 4)
+        self.assertEqual([error["index"] for error in resp.data["errors"]], [2])
+        self.assertEqual(Item.objects.filter(owner=self.user).count(), 4)
+
+    def test_bulk_update_checks_ownership_in_one_query(self):
+        mine = Item.objects.create(name="Mine", owner=self.user)
+        theirs = Item.objects.create(name="Theirs", owner=self.other)
+        rows = [
+            {"id": mine.pk, "name": "Renamed"},
+            {"id": theirs.pk, "name": "Hijacked"},
+            {"id": 999999, "name": "Ghost"},
+            {"id": mine.pk, "name": ""},
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.patch("/api/items/bulk/", rows, format="json")
+        # One SELECT for the whole batch (ownership included), one UPDATE.
+        item_queries = [query["sql"] for query in queries if "core_item" in query["sql"]]
+        self.assertEqual(len(item_queries), 2)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["updated"], [mine.pk])
+        self.assertEqual([error["index"] for error in resp.data["errors"]], [1, 2, 3])
+        mine.refresh_from_db()
+        theirs.refresh_from_db()
+        self.assertEqual((mine.name, theirs.name), ("Renamed", "Theirs"))
+
+    def test_bulk_delete_skips_items_the_user_does_not_own(self):
+        mine = Item.objects.bulk_create([Item(name=f"Mine {i}", owner=self.user) for i in range(3)])
+        theirs = Item.objects.create(name="Theirs", owner=self.other)
+        ids = [item.pk for item in mine] + [theirs.pk]
+        resp = self.client.delete("/api/items/bulk/", ids, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["deleted"], sorted(item.pk for item in mine))
+        self.assertEqual(resp.data["errors"][0]["id"], theirs.pk)
+        self.assertEqual(list(Item.objects.values_list("pk", flat=True)), [theirs.pk])
+
+    def test_bulk_delete_reports_malformed_ids_by_index(self):
+        mine = Item.objects.create(name="Mine", owner=self.user)
+        resp = self.client.delete("/api/items/bulk/", ["abc", {"x": 1}, [1], None, True, mine.pk], format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["deleted"], [mine.pk])
+        self.assertEqual([error["index"] for error in resp.data["errors"]], [0, 1, 2, 3, 4])
+
+    def test_bulk_writes_require_authentication(self):
+        self.client.logout()
+        resp = self.client.post("/api/items/bulk/", [{"name": "Anon"}], format="json")
+        self.assertIn(resp.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+        self.assertFalse(Item.objects.exists())
+
+
+class ItemAPIPaginationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="apiuser", password="pass")
+        Item.objects.bulk_create([Item(name=f"Item {i}", owner=self.user) for i in range(25)])
+        # Ties on created_at must still page without gaps or duplicates.
+        Item.objects.filter(pk__lte=Item.objects.order_by("pk")[10].pk).update(created_at=timezone.now())
+        self.client = APIClient()
+
+    def _walk(self, url):
+        names = []
+        while url:
+            resp = self.client.get(url)
+            self.assertEqual(resp.status_code, 200)
+            names += [row["name"] for row in resp.data["results"]]
+            url = resp.data["next"]
+        return names
+
+    def test_cursor_walk_visits_every_item_once(self):
+        names = self._walk("/api/items/?page_size=7")
+        self.assertEqual(len(names), 25)
+        self.assertEqual(len(set(names)), 25)
+        expected = list(Item.objects.order_by("-created_at", "-id").values_list("name", flat=True))
+        self.assertEqual(names, expected)
+
+    def test_previous_link_returns_the_same_page(self):
+        first = self.client.get("/api/items/", {"page_size": 10}).data
+        second = self.client.get(first["next"]).data
+        back = self.client.get(second["previous"]).data
+        self.assertEqual(back["results"], first["results"])
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        with self.assertNumQueries(1):
+            self.client.get("/api/items/", {"page_size": 20})
+
+    def test_sparse_fieldsets(self):
+        resp = self.client.get("/api/items/", {"fields": "id,name"})
+        self.assertEqual(set(resp.data["results"][0]), {"id", "name"})
+        resp = self.client.get("/api/items/", {"fields": "id,secret"})
+        self.assertEqual(resp.status_code, 400)
+
+    def test_sparse_fieldsets_do_not_skip_validation_on_writes(self):
+        self.client.force_authenticate(self.user)
+        resp = self.client.post("/api/items/?fields=id", {"description": "no name"}, format="json")
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn("name", resp.data)
+        resp = self.client.post("/api/items/?fields=id", {"name": "Named"}, format="json")
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(set(resp.data), {"id"})
+        self.assertEqual(Item.objects.get(pk=resp.data["id"]).name, "Named")
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get("/api/items/", {"cursor": "nonsense"}).status_code, 404)
+        for payload in (["garbage", 1, 0], [{"a": 1}, 1, 0], [None, 1, 0], ["2024-01-01T00:00:00Z", "x", 0]):
+            cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+            self.assertEqual(self.client.get("/api/items/", {"cursor": cursor}).status_code, 404, payload)
+
+
+class ContentAPITests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(username="writer", password="pass")
+        self.post = BlogPost.objects.create(
+            title="Django caching", slug="django-caching", content="<p>Body</p>",
+            author=self.author, category="development", published=True,
+        )
+        self.post.tags.add(*Tag.from_string("Django"))
+        BlogPost.objects.create(title="Draft", slug="draft", content="x", author=self.author)
+        Service.objects.create(title="CRM", description="d", expertise="crm", icon="fas fa-users")
+        Service.objects.create(title="Web", description="d", expertise="web_apps", icon="fas fa-globe")
+        self.client = APIClient()
+
+    def test_lists_filter_and_hide_drafts(self):
+        resp = self.client.get("/api/services/", {"expertise": "crm"})
+        self.assertEqual([row["title"] for row in resp.data], ["CRM"])
+        resp = self.client.get("/api/blog/", {"tag": "django"})
+        self.assertEqual([row["slug"] for row in resp.data["results"]], ["django-caching"])
+        self.assertEqual(resp.data["results"][0]["tags"], ["Django"])
+        self.assertNotIn("content", resp.data["results"][0])
+        self.assertEqual(self.client.get("/api/blog/draft/").status_code, 404)
+
+    def test_detail_includes_content(self):
+        resp = self.client.get("/api/blog/django-caching/")
+        self.assertEqual(resp.data["content"], "<p>Body</p>")
+        self.assertEqual(resp.data["url"], "/blog/django-caching/")
+
+    def test_responses_revalidate_with_etag(self):
+        first = self.client.get("/api/blog/")
+        self.assertIn("public", first["Cache-Control"])
+        with self.assertNumQueries(1):
+            second = self.client.get("/api/blog/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.tags.add(*Tag.from_string("Redis"))
+        third = self.client.get("/api/blog/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(third.status_code, 200)
+        self.assertEqual(third.data["results"][0]["tags"], ["Django", "Redis"])
+
+    def test_representations_are_cached_per_object_version(self):
+        from .api.serializers import ServiceSerializer
+
+        self.client.get("/api/services/")
+        with mock.patch.object(ServiceSerializer, "build_representation") as build:
+            self.client.get("/api/services/")
+        build.assert_not_called()
+
+        Service.objects.filter(title="CRM").first().save()
+        with mock.patch.object(ServiceSerializer, "build_representation", return_value={}) as build:
+            self.client.get("/api/services/")
+        self.assertEqual(build.call_count, 1)
@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import feeds, views
 
 app_name = "core"
 
@@ -12,8 +12,17 @@ urlpatterns = [
     path("services/", views.services_view, name="services"),
     path("portfolio/", views.PortfolioListView.as_view(), name="portfolio"),
     path("portfolio/<int:project_id>/", views.portfolio_detail_view, name="portfolio_detail"),
+    path("portfolio/tech/<slug:slug>/", views.PortfolioTechnologyListView.as_view(), name="portfolio_technology"),
     path("blog/", views.BlogListView.as_view(), name="blog"),
+    path("blog/tag/<slug:slug>/", views.BlogTagListView.as_view(), name="blog_tag"),
+    path("blog/feed/rss/", feeds.feed_view(feeds.BlogPostsFeed), name="blog_feed_rss"),
+    path("blog/feed/atom/", feeds.feed_view(feeds.BlogPostsAtomFeed), name="blog_feed_atom"),
+    path("blog/category/<slug:category>/feed/rss/", feeds.feed_view(feeds.BlogPostsFeed), name="blog_category_feed_rss"),
+    path("blog/category/<slug:category>/feed/atom/", feeds.feed_view(feeds.BlogPostsAtomFeed), name="blog_category_feed_atom"),
+    path("blog/tag/<slug:slug>/feed/rss/", feeds.feed_view(feeds.BlogPostsFeed), name="blog_tag_feed_rss"),
+    path("blog/tag/<slug:slug>/feed/atom/", feeds.feed_view(feeds.BlogPostsAtomFeed), name="blog_tag_feed_atom"),
     path("blog/<slug:slug>/", views.blog_detail_view, name="blog_detail"),
+    path("search/", views.search_view, name="search"),
 
     # About and legal pages
     path("about/", views.about_view, name="about"),
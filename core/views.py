@@ -10,12 +10,30 @@ from django.views.generic import (
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib import messages
 from django.core.paginator import Paginator
-from django.http import HttpResponse, Http404
-
+from django.db import transaction
+from django.http import Http404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+from . import brochure, metrics, perf, related, search, spam, storage
+from .cache import cache_public_page, model_version, versions_key
+from .conditional import ConditionalGetMixin, conditional_page, file_response, latest_change
+from .tasks import enqueue_contact_followups
 from .models import (
-    Item, Contact, TeamMember, Service, PortfolioProject, BlogPost
+    Item, Contact, TeamMember, Service, PortfolioProject, BlogPost, RelatedContent, Tag, Technology
 )
 from django.contrib.auth.forms import UserCreationForm
+from django.contrib.admin.views.decorators import staff_member_required
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation, ValidationError
+from django.core.validators import validate_email
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+import mimetypes
+import os
+import re
 
 
 def signup(request):
@@ -30,6 +48,7 @@ def signup(request):
 	return render(request, "registration/signup.html", {"form": form})
 
 
+@cache_public_page(query_params=(), models=(Service, PortfolioProject))
 def index(request):
     """Render the project homepage for Phase 2."""
     from .models import Service, PortfolioProject
@@ -102,29 +121,76 @@ def contact_view(request):
         company = request.POST.get('company', '')
         message = request.POST.get('message')
 
-        if name and email and message:
-            Contact.objects.create(
-                name=name,
-                email=email,
-                company=company,
-                message=message
-            )
+        if not (name and email and message):
+            messages.error(request, "Please fill in all required fields.")
+        elif not _valid_email(email):
+            messages.error(request, "Please enter a valid email address.")
+        else:
+            verdict = spam.screen(request, name, email, company, message)
+            if verdict.outcome == spam.RATE_LIMITED:
+                messages.error(request, "You have sent several messages recently. Please try again later.")
+                response = render(request, "contact.html", _contact_context(request), status=429)
+                response["Retry-After"] = str(int(verdict.retry_after) + 1)
+                return response
+            if verdict.outcome in (spam.BAD_TOKEN, spam.TOO_FAST):
+                messages.error(request, "Your form expired. Please check your details and send it again.")
+                return render(request, "contact.html", _contact_context(request), status=400)
+
+            if verdict.allowed:
+                # Mail and CRM calls run in the worker; the jobs commit with the contact.
+                with transaction.atomic():
+                    contact = Contact.objects.create(
+                        name=name,
+                        email=email,
+                        company=company,
+                        message=message,
+                        spam_score=verdict.score,
+                        quarantined=verdict.quarantined,
+                    )
+                    if not contact.quarantined:
+                        enqueue_contact_followups(contact)
+            # Honeypot hits and spam get the usual thank-you so bots learn nothing.
             messages.success(request, "Thank you for your message! We'll get back to you soon.")
             return redirect('core:contact')
-        else:
-            messages.error(request, "Please fill in all required fields.")
 
-    return render(request, "contact.html")
+    return render(request, "contact.html", _contact_context(request))
+
+
+def _valid_email(email):
+    # The address receives the auto-reply, so it must be a single well-formed mailbox.
+    try:
+        validate_email(email)
+    except ValidationError:
+        return False
+    return True
+
+
+def _contact_context(request):
+    return {
+        "form_data": request.POST,
+        "form_token": spam.make_form_token(),
+        "honeypot_field": spam.HONEYPOT_FIELD,
+    }
 
 
 # Team views
-class TeamListView(ListView):
+@method_decorator(cache_public_page(query_params=("page",), models=(TeamMember,)), name="get")
+class TeamListView(ConditionalGetMixin, ListView):
     model = TeamMember
     template_name = "team.html"
     context_object_name = "team_members"
 
 
 # Services views
+def _services_validators(request):
+    services = Service.objects.all()
+    if request.GET.get('type'):
+        services = services.filter(expertise=request.GET['type'])
+    return latest_change(services)
+
+
+@conditional_page(_services_validators)
+@cache_public_page(query_params=("type",), models=(Service,))
 def services_view(request):
     """List all services, with optional filtering by expertise."""
     expertise_filter = request.GET.get('type')
@@ -142,14 +208,14 @@ def services_view(request):
 
 
 # Portfolio views
-class PortfolioListView(ListView):
+class PortfolioListView(ConditionalGetMixin, ListView):
     model = PortfolioProject
     template_name = "portfolio.html"
     context_object_name = "projects"
     paginate_by = 12
 
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = super().get_queryset().prefetch_related("technologies")
         expertise = self.request.GET.get('expertise')
         if expertise:
             queryset = queryset.filter(expertise=expertise)
@@ -162,26 +228,43 @@ class PortfolioListView(ListView):
         return context
 
 
+class PortfolioTechnologyListView(PortfolioListView):
+    """Projects that use a given technology (indexed join on the through table)."""
+
+    def get_queryset(self):
+        self.technology = get_object_or_404(Technology, slug=self.kwargs['slug'])
+        return super().get_queryset().filter(technologies=self.technology)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['current_technology'] = self.technology
+        return context
+
+
+def _portfolio_detail_validators(request, project_id):
+    updated_at = PortfolioProject.objects.filter(id=project_id).values_list("updated_at", flat=True).first()
+    return None if updated_at is None else (updated_at, model_version(PortfolioProject))
+
+
+@conditional_page(_portfolio_detail_validators)
 def portfolio_detail_view(request, project_id):
     """Show portfolio project detail."""
-    project = get_object_or_404(PortfolioProject, id=project_id)
+    project = get_object_or_404(PortfolioProject.objects.prefetch_related("technologies"), id=project_id)
     return render(request, "portfolio_detail.html", {"project": project})
 
 
 # Blog views
-class BlogListView(ListView):
+class BlogListView(ConditionalGetMixin, ListView):
     model = BlogPost
     template_name = "blog.html"
     context_object_name = "posts"
     paginate_by = 10
 
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = BlogPost.objects.published().for_listing()
         category = self.request.GET.get('category')
         if category:
-            queryset = queryset.filter(category=category, published=True)
-        else:
-            queryset = queryset.filter(published=True)
+            queryset = queryset.filter(category=category)
         return queryset
 
     def get_context_data(self, **kwargs):
@@ -191,108 +274,144 @@ class BlogListView(ListView):
         return context
 
 
+class BlogTagListView(BlogListView):
+    """Published posts carrying a given tag (indexed join on the through table)."""
+
+    def get_queryset(self):
+        self.tag = get_object_or_404(Tag, slug=self.kwargs['slug'])
+        return super().get_queryset().filter(tags=self.tag)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['current_tag'] = self.tag
+        return context
+
+
+def _blog_detail_validators(request, slug):
+    # The version counters cover the tags and the related-items sidebar, which
+    # change without touching this post's updated_at: the sidebar is rewritten
+    # by the related.refresh job and shows project titles too.
+    updated_at = BlogPost.objects.published().filter(slug=slug).values_list("updated_at", flat=True).first()
+    return None if updated_at is None else (updated_at, versions_key((BlogPost, PortfolioProject, RelatedContent)))
+
+
+@conditional_page(_blog_detail_validators)
 def blog_detail_view(request, slug):
     """Show blog post detail."""
-    post = get_object_or_404(BlogPost, slug=slug, published=True)
-    return render(request, "blog_detail.html", {"post": post})
+    post = get_object_or_404(BlogPost.objects.published().with_author().prefetch_related("tags"), slug=slug)
+    return render(request, "blog_detail.html", {
+        "post": post,
+        "related_items": related.related_for(post, limit=3),
+    })
+
+
+# Search views
+def search_view(request):
+    """Ranked full-text search across published blog posts and portfolio projects."""
+    query = request.GET.get('q', '').strip()
+    paginator = Paginator(search.search(query), 10)
+    page_obj = paginator.get_page(request.GET.get('page'))
+    return render(request, "search.html", {
+        "query": query,
+        "page_obj": page_obj,
+        "results": page_obj.object_list,
+        "is_paginated": page_obj.has_other_pages(),
+    })
 
 
 # Brochure download view
+def _current_brochure(request):
+    if not hasattr(request, "_brochure"):
+        request._brochure = brochure.current()
+    return request._brochure
+
+
+@condition(etag_func=lambda request: _current_brochure(request)[1])
 def brochure_view(request):
-    """Return a PDF brochure for download."""
-    # For now, create a simple placeholder PDF using reportlab if available
-    # If reportlab is not installed, return a simple text response
+    """Serve the pregenerated PDF brochure (see ``core.brochure``)."""
+    path, digest = _current_brochure(request)
+    metrics.BROCHURE_DOWNLOADS.inc()
+    return file_response(request, path, digest, filename=brochure.FILENAME, content_type="application/pdf")
+
+
+# Collected static files
+_HASHED_NAME_RE = re.compile(r"\.[0-9a-f]{12}\.[^./]+$")
+
+
+def _accepted_encodings(request):
+    accepted = set()
+    for part in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        coding, _, params = part.partition(";")
+        params = params.replace(" ", "")
+        try:
+            if params.startswith("q=") and float(params[2:]) == 0:
+                continue  # Explicitly refused.
+        except ValueError:
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+@require_safe
+def static_view(request, path):
+    """Serve a file from ``STATIC_ROOT``, preferring its ``.br``/``.gz`` sibling (see ``core.storage``).
+
+    Content-hashed names never change content, so they are cached for a year
+    as ``immutable``; anything else gets a short ``max-age`` and revalidates.
+    """
     try:
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.pagesizes import letter
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-        from django.http import HttpResponse
-        from io import BytesIO
-
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
-        styles = getSampleStyleSheet()
-
-        # Create content
-        content = []
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=20,
-            spaceAfter=30,
-            alignment=1  # center
-        )
-
-        content.append(Paragraph("NexusSphere Solutions - Company Brochure", title_style))
-        content.append(Spacer(1, 12))
-
-        content.append(Paragraph("Empowering Businesses with Innovative Technology Solutions", styles['Heading2']))
-
-        # Add some content
-        intro_text = """
-        NexusSphere Solutions specializes in web applications, enterprise SaaS solutions,
-        mobile applications, and cutting-edge technologies for geoscience platforms,
-        school management systems, and CRM solutions.
-        """
-        content.append(Paragraph(intro_text, styles['Normal']))
-        content.append(Spacer(1, 12))
-
-        # Services section
-        content.append(Paragraph("Our Services:", styles['Heading3']))
-        services = [
-            "• Web Applications",
-            "• Enterprise SaaS Solutions",
-            "• Mobile Applications",
-            "• Geoscience Platforms",
-            "• School Management Systems",
-            "• CRM Solutions"
-        ]
-        for service in services:
-            content.append(Paragraph(service, styles['Normal']))
-            content.append(Spacer(1, 4))
-
-        # Contact info
-        content.append(Spacer(1, 12))
-        content.append(Paragraph("Contact Us:", styles['Heading3']))
-        content.append(Paragraph("Email: info@nexusspheresolutions.com", styles['Normal']))
-        content.append(Paragraph("Phone: +1 (555) 123-4567", styles['Normal']))
-        content.append(Paragraph("Website: https://nexusspheresolutions.com", styles['Normal']))
-
-        doc.build(content)
-        buffer.seek(0)
-
-        response = HttpResponse(buffer, content_type='application/pdf')
-        response['Content-Disposition'] = 'attachment; filename="nexussphere_brochure.pdf"'
-        return response
-
-    except ImportError:
-        # If reportlab is not available, return a simple text response
-        response = HttpResponse(
-            "NexusSphere Solutions - Company Brochure\n\n"
-            "Please contact us at info@nexusspheresolutions.com for our full brochure.\n\n"
-            "Services:\n"
-            "- Web Applications\n"
-            "- Learning Management System\n"
-            "- Mobile Applications\n"
-            "And more...",
-            content_type='text/plain'
-        )
-        response['Content-Disposition'] = 'attachment; filename="nexussphere_brochure.txt"'
-        return response
+        fullpath = safe_join(settings.STATIC_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404
+    if not os.path.isfile(fullpath):
+        raise Http404
+
+    content_type = mimetypes.guess_type(fullpath)[0] or "application/octet-stream"
+    encoding = None
+    accepted = _accepted_encodings(request)
+    for candidate, suffix in storage.ENCODINGS.items():
+        if candidate in accepted and os.path.isfile(fullpath + suffix):
+            encoding, fullpath = candidate, fullpath + suffix
+            break
+
+    stat = os.stat(fullpath)
+    etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+    response = get_conditional_response(request, etag=f'"{etag}"', last_modified=int(stat.st_mtime))
+    if response is None:
+        response = file_response(request, fullpath, etag, content_type=content_type)
+        if encoding:
+            response["Content-Encoding"] = encoding
+    response["ETag"] = f'"{etag}"'
+    response["Last-Modified"] = http_date(stat.st_mtime)
+    if _HASHED_NAME_RE.search(path):
+        patch_cache_control(response, public=True, max_age=settings.STATIC_IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, public=True, max_age=settings.STATIC_MAX_AGE)
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+# Instrumentation
+@staff_member_required
+def perf_view(request):
+    """Rolling per-view latency percentiles and query counts (see ``core.perf``)."""
+    return render(request, "perf.html", {"rows": perf.summary(), "window": settings.PERF_WINDOW})
 
 
 # Static page views
+@cache_public_page(query_params=())
 def about_view(request):
     """Render the about page."""
     return render(request, "about.html", {"project_name": "NexusSphere"})
 
 
+@cache_public_page(query_params=())
 def privacy_view(request):
     """Render the privacy policy page."""
     return render(request, "privacy.html", {"project_name": "NexusSphere"})
 
 
+@cache_public_page(query_params=())
 def terms_view(request):
     """Render the terms of service page."""
     return render(request, "terms.html", {"project_name": "NexusSphere"})